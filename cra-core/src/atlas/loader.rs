@@ -7,7 +7,9 @@
 
 use std::collections::HashMap;
 use std::fs;
+use std::io::{self, Read};
 use std::path::{Path, PathBuf};
+use std::time::SystemTime;
 
 use crate::error::{CRAError, Result};
 
@@ -23,6 +25,71 @@ pub struct AtlasLoader {
 
     /// Whether to validate on load
     validate_on_load: bool,
+
+    /// Source fingerprints of file/directory-backed atlases, for reload()
+    fingerprints: HashMap<String, SourceFingerprint>,
+}
+
+/// Cheap change detector for an atlas source
+///
+/// Built from file metadata only (count, total size, newest mtime), so
+/// checking whether a source changed costs a few stat calls instead of a
+/// full read and parse.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+struct SourceFingerprint {
+    files: u64,
+    total_len: u64,
+    newest: Option<SystemTime>,
+}
+
+impl SourceFingerprint {
+    /// Fingerprint a manifest file or an atlas package directory
+    fn of(path: &Path) -> Option<Self> {
+        let mut fingerprint = Self {
+            files: 0,
+            total_len: 0,
+            newest: None,
+        };
+
+        if path.is_dir() {
+            fingerprint.add(&path.join("atlas.json"))?;
+            let context_dir = path.join("context");
+            if let Ok(entries) = fs::read_dir(&context_dir) {
+                // Directory mtime changes when context files are added or removed
+                fingerprint.add(&context_dir)?;
+                for entry in entries.flatten() {
+                    fingerprint.add(&entry.path())?;
+                }
+            }
+        } else {
+            fingerprint.add(path)?;
+        }
+
+        Some(fingerprint)
+    }
+
+    fn add(&mut self, path: &Path) -> Option<()> {
+        let metadata = fs::metadata(path).ok()?;
+        self.files += 1;
+        self.total_len += metadata.len();
+        self.newest = self.newest.max(metadata.modified().ok());
+        Some(())
+    }
+}
+
+/// Check a directory entry's type without a `stat` where possible
+///
+/// The type usually comes with the directory listing itself; only symlinks
+/// are resolved, so they keep following to their target as `Path::is_dir`
+/// and `Path::is_file` do.
+fn entry_is(entry: &fs::DirEntry, kind: fn(&fs::FileType) -> bool) -> bool {
+    match entry.file_type() {
+        Ok(file_type) if file_type.is_symlink() => {
+            fs::metadata(entry.path()).map_or(false, |m| kind(&m.file_type()))
+        }
+        Ok(file_type) => kind(&file_type),
+        Err(_) => false,
+    }
 }
 
 /// A loaded atlas with its source information
@@ -45,6 +112,7 @@ impl AtlasLoader {
             atlases: HashMap::new(),
             search_paths: vec![],
             validate_on_load: true,
+            fingerprints: HashMap::new(),
         }
     }
 
@@ -93,16 +161,13 @@ impl AtlasLoader {
     /// Load an atlas from a JSON file
     pub fn load_from_file<P: AsRef<Path>>(&mut self, path: P) -> Result<String> {
         let path = path.as_ref();
-        let content = fs::read_to_string(path).map_err(|e| CRAError::AtlasLoadError {
-            path: path.display().to_string(),
-            reason: e.to_string(),
-        })?;
+        // Taken before reading so a concurrent edit is seen as a change later
+        let fingerprint = SourceFingerprint::of(path);
+        if let Some(atlas_id) = self.loaded_unchanged(path, fingerprint) {
+            return Ok(atlas_id);
+        }
 
-        let manifest: AtlasManifest = serde_json::from_str(&content).map_err(|e| {
-            CRAError::InvalidAtlasManifest {
-                reason: format!("{}: {}", path.display(), e),
-            }
-        })?;
+        let manifest = read_manifest(path)?;
 
         if self.validate_on_load {
             manifest.validate().map_err(|errors| {
@@ -122,6 +187,7 @@ impl AtlasLoader {
                 context_files: HashMap::new(),
             },
         );
+        self.record_fingerprint(&atlas_id, fingerprint);
 
         Ok(atlas_id)
     }
@@ -147,72 +213,16 @@ impl AtlasLoader {
             });
         }
 
-        // Load manifest
-        let manifest_path = path.join("atlas.json");
-        if !manifest_path.exists() {
-            return Err(CRAError::AtlasLoadError {
-                path: path.display().to_string(),
-                reason: "atlas.json not found".to_string(),
-            });
-        }
-
-        let manifest_content = fs::read_to_string(&manifest_path).map_err(|e| {
-            CRAError::AtlasLoadError {
-                path: manifest_path.display().to_string(),
-                reason: e.to_string(),
-            }
-        })?;
-
-        let manifest: AtlasManifest =
-            serde_json::from_str(&manifest_content).map_err(|e| CRAError::InvalidAtlasManifest {
-                reason: format!("{}: {}", manifest_path.display(), e),
-            })?;
-
-        if self.validate_on_load {
-            manifest.validate().map_err(|errors| {
-                CRAError::InvalidAtlasManifest {
-                    reason: errors.join("; "),
-                }
-            })?;
-        }
-
-        // Load context files
-        let mut context_files = HashMap::new();
-        let context_dir = path.join("context");
-        if context_dir.is_dir() {
-            for entry in fs::read_dir(&context_dir).map_err(|e| CRAError::AtlasLoadError {
-                path: context_dir.display().to_string(),
-                reason: e.to_string(),
-            })? {
-                let entry = entry.map_err(|e| CRAError::AtlasLoadError {
-                    path: context_dir.display().to_string(),
-                    reason: e.to_string(),
-                })?;
-                let file_path = entry.path();
-                if file_path.is_file() {
-                    if let Some(name) = file_path.file_name() {
-                        let content = fs::read_to_string(&file_path).map_err(|e| {
-                            CRAError::AtlasLoadError {
-                                path: file_path.display().to_string(),
-                                reason: e.to_string(),
-                            }
-                        })?;
-                        context_files.insert(name.to_string_lossy().to_string(), content);
-                    }
-                }
-            }
+        let fingerprint = SourceFingerprint::of(path);
+        if let Some(atlas_id) = self.loaded_unchanged(path, fingerprint) {
+            return Ok(atlas_id);
         }
 
-        let atlas_id = manifest.atlas_id.clone();
+        let atlas = read_package(path, self.validate_on_load)?;
+        let atlas_id = atlas.manifest.atlas_id.clone();
 
-        self.atlases.insert(
-            atlas_id.clone(),
-            LoadedAtlas {
-                manifest,
-                source_path: Some(path.to_path_buf()),
-                context_files,
-            },
-        );
+        self.atlases.insert(atlas_id.clone(), atlas);
+        self.record_fingerprint(&atlas_id, fingerprint);
 
         Ok(atlas_id)
     }
@@ -253,6 +263,7 @@ impl AtlasLoader {
 
     /// Unload an atlas
     pub fn unload(&mut self, atlas_id: &str) -> Option<LoadedAtlas> {
+        self.fingerprints.remove(atlas_id);
         self.atlases.remove(atlas_id)
     }
 
@@ -292,12 +303,12 @@ impl AtlasLoader {
             // Look in subdirectories
             if let Ok(entries) = fs::read_dir(search_path) {
                 for entry in entries.flatten() {
+                    if !entry_is(&entry, fs::FileType::is_dir) {
+                        continue;
+                    }
                     let path = entry.path();
-                    if path.is_dir() {
-                        let manifest = path.join("atlas.json");
-                        if manifest.exists() {
-                            found.push(path);
-                        }
+                    if path.join("atlas.json").exists() {
+                        found.push(path);
                     }
                 }
             }
@@ -307,14 +318,92 @@ impl AtlasLoader {
     }
 
     /// Load all discovered atlases
+    ///
+    /// Packages are independent, so the changed ones are read and parsed on
+    /// scoped threads; results are registered in discovery order, so the
+    /// outcome matches loading them one by one.
     pub fn load_discovered(&mut self) -> Result<Vec<String>> {
         let paths = self.discover();
-        let mut loaded = vec![];
+        let validate = self.validate_on_load;
+
+        // Unchanged sources keep their loaded atlas; the rest are read
+        let checks: Vec<_> = paths
+            .iter()
+            .map(|path| {
+                let fingerprint = SourceFingerprint::of(path);
+                match self.loaded_unchanged(path, fingerprint) {
+                    Some(atlas_id) => Err(atlas_id),
+                    None => Ok(fingerprint),
+                }
+            })
+            .collect();
+        let to_read: Vec<_> = paths
+            .iter()
+            .zip(&checks)
+            .filter(|(_, check)| check.is_ok())
+            .map(|(path, _)| path)
+            .collect();
+
+        // Read on at most one thread per core, each taking a contiguous chunk
+        let threads = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .clamp(1, to_read.len().max(1));
+        let chunk_size = ((to_read.len() + threads - 1) / threads).max(1);
+
+        let mut reads = std::thread::scope(|scope| {
+            let handles: Vec<_> = to_read
+                .chunks(chunk_size)
+                .map(|chunk| {
+                    let handle = scope.spawn(move || {
+                        chunk
+                            .iter()
+                            .map(|path| read_package(path, validate))
+                            .collect::<Vec<_>>()
+                    });
+                    (chunk.len(), handle)
+                })
+                .collect();
+
+            handles
+                .into_iter()
+                .flat_map(|(len, handle)| {
+                    handle.join().unwrap_or_else(|_| {
+                        (0..len)
+                            .map(|_| {
+                                Err(CRAError::InternalError {
+                                    reason: "atlas load thread panicked".to_string(),
+                                })
+                            })
+                            .collect()
+                    })
+                })
+                .collect::<Vec<_>>()
+        })
+        .into_iter();
+
+        let reads = checks.into_iter().map(|check| {
+            check.map(|fingerprint| {
+                let result = reads.next().unwrap_or_else(|| {
+                    Err(CRAError::InternalError {
+                        reason: "atlas load result missing".to_string(),
+                    })
+                });
+                (fingerprint, result)
+            })
+        });
 
-        for path in paths {
-            match self.load_from_directory(&path) {
-                Ok(atlas_id) => loaded.push(atlas_id),
-                Err(e) => {
+        let mut loaded = vec![];
+        for (path, read) in paths.iter().zip(reads) {
+            match read {
+                Err(unchanged_id) => loaded.push(unchanged_id),
+                Ok((fingerprint, Ok(atlas))) => {
+                    let atlas_id = atlas.manifest.atlas_id.clone();
+                    self.atlases.insert(atlas_id.clone(), atlas);
+                    self.record_fingerprint(&atlas_id, fingerprint);
+                    loaded.push(atlas_id);
+                }
+                Ok((_, Err(e))) => {
                     // Log but continue
                     eprintln!("Warning: Failed to load atlas from {:?}: {}", path, e);
                 }
@@ -325,6 +414,11 @@ impl AtlasLoader {
     }
 
     /// Reload an atlas from its source
+    ///
+    /// Always re-reads the source. Only implicit loads (`load_from_file`,
+    /// `load_from_directory`, `load_discovered`) skip sources whose file
+    /// metadata is unchanged, which can miss an edit that keeps both size
+    /// and mtime.
     pub fn reload(&mut self, atlas_id: &str) -> Result<()> {
         let atlas = self.atlases.get(atlas_id).ok_or_else(|| CRAError::AtlasNotFound {
             atlas_id: atlas_id.to_string(),
@@ -337,6 +431,7 @@ impl AtlasLoader {
 
         // Unload first
         self.atlases.remove(atlas_id);
+        self.fingerprints.remove(atlas_id);
 
         // Reload from source
         if source_path.is_dir() {
@@ -347,6 +442,33 @@ impl AtlasLoader {
 
         Ok(())
     }
+
+    /// Find an atlas already loaded from `path` whose source is unchanged
+    ///
+    /// Lets repeated loads of the same source (e.g. `load_discovered` on a
+    /// timer) skip the read and parse entirely.
+    fn loaded_unchanged(&self, path: &Path, fingerprint: Option<SourceFingerprint>) -> Option<String> {
+        let fingerprint = fingerprint?;
+        self.atlases
+            .iter()
+            .find(|(atlas_id, atlas)| {
+                atlas.source_path.as_deref() == Some(path)
+                    && self.fingerprints.get(atlas_id.as_str()) == Some(&fingerprint)
+            })
+            .map(|(atlas_id, _)| atlas_id.clone())
+    }
+
+    /// Remember (or forget) the source fingerprint for an atlas
+    fn record_fingerprint(&mut self, atlas_id: &str, fingerprint: Option<SourceFingerprint>) {
+        match fingerprint {
+            Some(fingerprint) => {
+                self.fingerprints.insert(atlas_id.to_string(), fingerprint);
+            }
+            None => {
+                self.fingerprints.remove(atlas_id);
+            }
+        }
+    }
 }
 
 impl Default for AtlasLoader {
@@ -355,6 +477,91 @@ impl Default for AtlasLoader {
     }
 }
 
+/// Manifests larger than this are parsed straight from a buffered reader
+const STREAM_THRESHOLD: u64 = 512 * 1024;
+
+/// Read and parse an atlas manifest file
+///
+/// Small manifests are read whole and parsed from the raw bytes: serde_json
+/// checks UTF-8 as it goes, so there is no separate validation pass over a
+/// decoded `String`. Large ones are parsed from a buffered reader instead,
+/// so the file's bytes and the parsed manifest are never held in memory at
+/// the same time, and malformed input fails without reading the rest.
+fn read_manifest(path: &Path) -> Result<AtlasManifest> {
+    let load_error = |e: std::io::Error| CRAError::AtlasLoadError {
+        path: path.display().to_string(),
+        reason: e.to_string(),
+    };
+    let parse_error = |e: serde_json::Error| CRAError::InvalidAtlasManifest {
+        reason: format!("{}: {}", path.display(), e),
+    };
+
+    let mut file = fs::File::open(path).map_err(load_error)?;
+    let len = file.metadata().map_err(load_error)?.len();
+
+    if len > STREAM_THRESHOLD {
+        return serde_json::from_reader(io::BufReader::new(file)).map_err(parse_error);
+    }
+
+    let mut bytes = Vec::with_capacity(len as usize);
+    file.read_to_end(&mut bytes).map_err(load_error)?;
+    serde_json::from_slice(&bytes).map_err(parse_error)
+}
+
+/// Read an atlas package directory: manifest plus context files
+fn read_package(path: &Path, validate: bool) -> Result<LoadedAtlas> {
+    let manifest_path = path.join("atlas.json");
+    if !manifest_path.exists() {
+        return Err(CRAError::AtlasLoadError {
+            path: path.display().to_string(),
+            reason: "atlas.json not found".to_string(),
+        });
+    }
+
+    let manifest = read_manifest(&manifest_path)?;
+
+    if validate {
+        manifest.validate().map_err(|errors| {
+            CRAError::InvalidAtlasManifest {
+                reason: errors.join("; "),
+            }
+        })?;
+    }
+
+    // Load context files
+    let mut context_files = HashMap::new();
+    let context_dir = path.join("context");
+    if context_dir.is_dir() {
+        for entry in fs::read_dir(&context_dir).map_err(|e| CRAError::AtlasLoadError {
+            path: context_dir.display().to_string(),
+            reason: e.to_string(),
+        })? {
+            let entry = entry.map_err(|e| CRAError::AtlasLoadError {
+                path: context_dir.display().to_string(),
+                reason: e.to_string(),
+            })?;
+            if entry_is(&entry, fs::FileType::is_file) {
+                let file_path = entry.path();
+                if let Some(name) = file_path.file_name() {
+                    let content = fs::read_to_string(&file_path).map_err(|e| {
+                        CRAError::AtlasLoadError {
+                            path: file_path.display().to_string(),
+                            reason: e.to_string(),
+                        }
+                    })?;
+                    context_files.insert(name.to_string_lossy().to_string(), content);
+                }
+            }
+        }
+    }
+
+    Ok(LoadedAtlas {
+        manifest,
+        source_path: Some(path.to_path_buf()),
+        context_files,
+    })
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -381,6 +588,117 @@ mod tests {
         assert!(loader.is_loaded("com.test.example"));
     }
 
+    #[test]
+    fn test_reload_from_file() {
+        let dir = std::env::temp_dir().join(format!("cra-test-loader-{}", uuid::Uuid::new_v4()));
+        fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("atlas.json");
+
+        let manifest = |name: &str| {
+            format!(
+                r#"{{"atlas_version": "1.0", "atlas_id": "com.test.reload", "version": "1.0.0",
+                "name": "{}", "description": "", "domains": [], "capabilities": [],
+                "policies": [], "actions": []}}"#,
+                name
+            )
+        };
+
+        fs::write(&path, manifest("Before")).unwrap();
+        let mut loader = AtlasLoader::new();
+        let atlas_id = loader.load_from_file(&path).unwrap();
+
+        // Unchanged source: loading again is a no-op
+        assert_eq!(loader.load_from_file(&path).unwrap(), atlas_id);
+        loader.reload(&atlas_id).unwrap();
+        assert_eq!(loader.get_manifest(&atlas_id).unwrap().name, "Before");
+
+        // An edit that keeps size and mtime is missed by implicit loads,
+        // but an explicit reload always re-reads the source
+        let mtime = fs::metadata(&path).unwrap().modified().unwrap();
+        fs::write(&path, manifest("Beyond")).unwrap();
+        fs::File::options().write(true).open(&path).unwrap().set_modified(mtime).unwrap();
+        loader.load_from_file(&path).unwrap();
+        assert_eq!(loader.get_manifest(&atlas_id).unwrap().name, "Before");
+        loader.reload(&atlas_id).unwrap();
+        assert_eq!(loader.get_manifest(&atlas_id).unwrap().name, "Beyond");
+
+        // Changed source: reload picks up the new manifest
+        fs::write(&path, manifest("After the edit")).unwrap();
+        loader.reload(&atlas_id).unwrap();
+        assert_eq!(loader.get_manifest(&atlas_id).unwrap().name, "After the edit");
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+
+    #[test]
+    fn test_load_large_manifest() {
+        let dir = std::env::temp_dir().join(format!("cra-test-large-{}", uuid::Uuid::new_v4()));
+        fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("atlas.json");
+
+        // Over the streaming threshold, so parsed from a reader
+        let description = "x".repeat(STREAM_THRESHOLD as usize);
+        fs::write(
+            &path,
+            format!(
+                r#"{{"atlas_version": "1.0", "atlas_id": "com.test.large", "version": "1.0.0",
+                "name": "Large", "description": "{}", "domains": [], "capabilities": [],
+                "policies": [], "actions": []}}"#,
+                description
+            ),
+        )
+        .unwrap();
+
+        let mut loader = AtlasLoader::new();
+        let atlas_id = loader.load_from_file(&path).unwrap();
+        assert_eq!(loader.get_manifest(&atlas_id).unwrap().description.len(), description.len());
+
+        // Malformed large manifests are rejected
+        fs::write(&path, format!(r#"{{"atlas_id": "{}"#, description)).unwrap();
+        assert!(AtlasLoader::new().load_from_file(&path).is_err());
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+
+    #[test]
+    fn test_load_discovered() {
+        let dir = std::env::temp_dir().join(format!("cra-test-discover-{}", uuid::Uuid::new_v4()));
+        for id in ["one", "two", "three"] {
+            let package = dir.join(id);
+            fs::create_dir_all(package.join("context")).unwrap();
+            fs::write(
+                package.join("atlas.json"),
+                format!(
+                    r#"{{"atlas_version": "1.0", "atlas_id": "com.test.{}", "version": "1.0.0",
+                    "name": "{}", "description": "", "domains": [], "capabilities": [],
+                    "policies": [], "actions": []}}"#,
+                    id, id
+                ),
+            )
+            .unwrap();
+            fs::write(package.join("context").join("guide.md"), id).unwrap();
+        }
+        // A broken package is skipped without failing the others
+        fs::create_dir_all(dir.join("broken")).unwrap();
+        fs::write(dir.join("broken").join("atlas.json"), "{").unwrap();
+        // Stray files next to packages, and directories among context files,
+        // are passed over
+        fs::write(dir.join("README.md"), "notes").unwrap();
+        fs::create_dir_all(dir.join("one").join("context").join("drafts")).unwrap();
+
+        let mut loader = AtlasLoader::new().with_search_path(dir.clone());
+        let mut loaded = loader.load_discovered().unwrap();
+        loaded.sort();
+        assert_eq!(loaded, vec!["com.test.one", "com.test.three", "com.test.two"]);
+        assert_eq!(loader.get("com.test.two").unwrap().context_files["guide.md"], "two");
+        assert_eq!(loader.get("com.test.one").unwrap().context_files.len(), 1);
+
+        // Unchanged packages come back without being re-read
+        assert_eq!(loader.load_discovered().unwrap().len(), 3);
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+
     #[test]
     fn test_load_invalid_json() {
         let mut loader = AtlasLoader::new();
@@ -1,6 +1,6 @@
 //! Atlas Manifest types
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
@@ -100,15 +100,24 @@ impl AtlasManifest {
     }
 
     /// Get all actions for a capability
+    ///
+    /// Actions are indexed in one pass instead of scanning the action list
+    /// once per capability entry; as with `get_action`, the first definition
+    /// of a duplicated ID wins.
     pub fn get_capability_actions(&self, capability_id: &str) -> Vec<&AtlasAction> {
-        self.get_capability(capability_id)
-            .map(|cap| {
-                cap.actions
-                    .iter()
-                    .filter_map(|action_id| self.get_action(action_id))
-                    .collect()
-            })
-            .unwrap_or_default()
+        let Some(cap) = self.get_capability(capability_id) else {
+            return vec![];
+        };
+
+        let mut by_id: HashMap<&str, &AtlasAction> = HashMap::with_capacity(self.actions.len());
+        for action in &self.actions {
+            by_id.entry(action.action_id.as_str()).or_insert(action);
+        }
+
+        cap.actions
+            .iter()
+            .filter_map(|action_id| by_id.get(action_id.as_str()).copied())
+            .collect()
     }
 
     /// Get a checkpoint by ID
@@ -175,7 +184,7 @@ impl AtlasManifest {
             .iter()
             .filter(|c| {
                 matches!(&c.trigger, CheckpointTrigger::CapabilityAccess { capability_ids }
-                    if capability_ids.contains(&capability_id.to_string()))
+                    if capability_ids.iter().any(|id| id == capability_id))
             })
             .collect()
     }
@@ -205,26 +214,18 @@ impl AtlasManifest {
 
         // Validate actions have unique IDs
         let mut action_ids: Vec<&str> = self.actions.iter().map(|a| a.action_id.as_str()).collect();
-        action_ids.sort();
-        for window in action_ids.windows(2) {
-            if window[0] == window[1] {
-                errors.push(format!("Duplicate action_id: {}", window[0]));
-            }
-        }
+        action_ids.sort_unstable();
+        push_duplicates(&action_ids, "action_id", &mut errors);
 
         // Validate policies have unique IDs
         let mut policy_ids: Vec<&str> = self.policies.iter().map(|p| p.policy_id.as_str()).collect();
-        policy_ids.sort();
-        for window in policy_ids.windows(2) {
-            if window[0] == window[1] {
-                errors.push(format!("Duplicate policy_id: {}", window[0]));
-            }
-        }
+        policy_ids.sort_unstable();
+        push_duplicates(&policy_ids, "policy_id", &mut errors);
 
-        // Validate capability actions exist
+        // Validate capability actions exist (action_ids is already sorted)
         for capability in &self.capabilities {
             for action_id in &capability.actions {
-                if self.get_action(action_id).is_none() {
+                if action_ids.binary_search(&action_id.as_str()).is_err() {
                     errors.push(format!(
                         "Capability {} references unknown action: {}",
                         capability.capability_id, action_id
@@ -235,19 +236,22 @@ impl AtlasManifest {
 
         // Validate checkpoints have unique IDs
         let mut checkpoint_ids: Vec<&str> = self.checkpoints.iter().map(|c| c.checkpoint_id.as_str()).collect();
-        checkpoint_ids.sort();
-        for window in checkpoint_ids.windows(2) {
-            if window[0] == window[1] {
-                errors.push(format!("Duplicate checkpoint_id: {}", window[0]));
-            }
-        }
+        checkpoint_ids.sort_unstable();
+        push_duplicates(&checkpoint_ids, "checkpoint_id", &mut errors);
+
+        // Reference checks below look IDs up in sets built once, rather than
+        // scanning the blocks, packs and capabilities for every reference
+        let context_ids: HashSet<&str> = self.context_blocks.iter().map(|b| b.context_id.as_str())
+            .chain(self.context_packs.iter().map(|p| p.pack_id.as_str()))
+            .collect();
+        let capability_ids: HashSet<&str> = self.capabilities.iter()
+            .map(|c| c.capability_id.as_str())
+            .collect();
 
         // Validate checkpoint context references exist
         for checkpoint in &self.checkpoints {
             for context_id in &checkpoint.inject_contexts {
-                let context_exists = self.context_blocks.iter().any(|b| &b.context_id == context_id)
-                    || self.context_packs.iter().any(|p| &p.pack_id == context_id);
-                if !context_exists {
+                if !context_ids.contains(context_id.as_str()) {
                     errors.push(format!(
                         "Checkpoint {} references unknown context: {}",
                         checkpoint.checkpoint_id, context_id
@@ -257,7 +261,7 @@ impl AtlasManifest {
 
             // Validate capability references
             for cap_id in &checkpoint.unlock_capabilities {
-                if self.get_capability(cap_id).is_none() {
+                if !capability_ids.contains(cap_id.as_str()) {
                     errors.push(format!(
                         "Checkpoint {} references unknown capability to unlock: {}",
                         checkpoint.checkpoint_id, cap_id
@@ -265,7 +269,7 @@ impl AtlasManifest {
                 }
             }
             for cap_id in &checkpoint.lock_capabilities {
-                if self.get_capability(cap_id).is_none() {
+                if !capability_ids.contains(cap_id.as_str()) {
                     errors.push(format!(
                         "Checkpoint {} references unknown capability to lock: {}",
                         checkpoint.checkpoint_id, cap_id
@@ -282,6 +286,15 @@ impl AtlasManifest {
     }
 }
 
+/// Report each repeated ID in a sorted slice once, in a single pass
+fn push_duplicates(sorted_ids: &[&str], field: &str, errors: &mut Vec<String>) {
+    for run in sorted_ids.chunk_by(|a, b| a == b) {
+        if run.len() > 1 {
+            errors.push(format!("Duplicate {}: {}", field, run[0]));
+        }
+    }
+}
+
 /// Builder for AtlasManifest
 #[derive(Debug)]
 pub struct AtlasManifestBuilder {
@@ -805,6 +818,20 @@ mod tests {
         .build();
 
         assert!(invalid.validate().is_err());
+
+        // An ID repeated three times is reported once
+        let action = || AtlasAction::new("dup.action".to_string(), "Dup".to_string(), "Dup".to_string());
+        let duplicated = AtlasManifest::builder(
+            "com.test.dup".to_string(),
+            "Dup Atlas".to_string(),
+        )
+        .add_action(action())
+        .add_action(action())
+        .add_action(action())
+        .build();
+
+        let errors = duplicated.validate().unwrap_err();
+        assert_eq!(errors, vec!["Duplicate action_id: dup.action".to_string()]);
     }
 
     #[test]
@@ -826,6 +853,34 @@ mod tests {
         assert!(rate_limit.parameters.is_some());
     }
 
+    #[test]
+    fn test_capability_actions() {
+        let action = |id: &str| AtlasAction::new(id.to_string(), id.to_string(), String::new());
+        let manifest = AtlasManifest::builder("com.test.caps".to_string(), "Caps".to_string())
+            .add_action(action("ticket.get"))
+            .add_action(action("ticket.create"))
+            .add_action(action("ticket.delete"))
+            .add_capability(AtlasCapability::new(
+                "tickets.write".to_string(),
+                "Write tickets".to_string(),
+                vec![
+                    "ticket.delete".to_string(),
+                    "ticket.missing".to_string(),
+                    "ticket.create".to_string(),
+                ],
+            ))
+            .build();
+
+        // Capability order is kept and unknown IDs are skipped
+        let ids: Vec<_> = manifest
+            .get_capability_actions("tickets.write")
+            .iter()
+            .map(|a| a.action_id.as_str())
+            .collect();
+        assert_eq!(ids, vec!["ticket.delete", "ticket.create"]);
+        assert!(manifest.get_capability_actions("tickets.none").is_empty());
+    }
+
     #[test]
     fn test_action_builder() {
         let action = AtlasAction::new(
@@ -223,7 +223,8 @@ impl AtlasValidator {
         let mut seen_ids = std::collections::HashSet::new();
 
         for (i, action) in manifest.actions.iter().enumerate() {
-            let path = format!("actions[{}]", i);
+            // Paths are only formatted for actions that have an issue
+            let path = |field: &str| format!("actions[{}].{}", i, field);
 
             // Check for duplicates
             if !seen_ids.insert(&action.action_id) {
@@ -232,7 +233,7 @@ impl AtlasValidator {
                         "E005",
                         format!("Duplicate action_id: {}", action.action_id),
                     )
-                    .with_path(&format!("{}.action_id", path)),
+                    .with_path(path("action_id")),
                 );
             }
 
@@ -246,7 +247,7 @@ impl AtlasValidator {
                             action.action_id
                         ),
                     )
-                    .with_path(&format!("{}.action_id", path))
+                    .with_path(path("action_id"))
                     .with_suggestion("Use dotted notation (e.g., resource.verb)"),
                 );
             }
@@ -255,18 +256,18 @@ impl AtlasValidator {
             if !action.parameters_schema.is_object() {
                 result.add_error(
                     ValidationIssue::new("E006", "parameters_schema must be an object")
-                        .with_path(&format!("{}.parameters_schema", path)),
+                        .with_path(path("parameters_schema")),
                 );
             }
 
             // Validate risk tier
-            if !["low", "medium", "high", "critical"].contains(&action.risk_tier.as_str()) {
+            if !matches!(action.risk_tier.as_str(), "low" | "medium" | "high" | "critical") {
                 result.add_warning(
                     ValidationIssue::new(
                         "W003",
                         format!("Unknown risk_tier: {}", action.risk_tier),
                     )
-                    .with_path(&format!("{}.risk_tier", path))
+                    .with_path(path("risk_tier"))
                     .with_suggestion("Use one of: low, medium, high, critical"),
                 );
             }
@@ -277,7 +278,8 @@ impl AtlasValidator {
         let mut seen_ids = std::collections::HashSet::new();
 
         for (i, policy) in manifest.policies.iter().enumerate() {
-            let path = format!("policies[{}]", i);
+            // Paths are only formatted for policies that have an issue
+            let path = |field: &str| format!("policies[{}].{}", i, field);
 
             // Check for duplicates
             if !seen_ids.insert(&policy.policy_id) {
@@ -286,7 +288,7 @@ impl AtlasValidator {
                         "E007",
                         format!("Duplicate policy_id: {}", policy.policy_id),
                     )
-                    .with_path(&format!("{}.policy_id", path)),
+                    .with_path(path("policy_id")),
                 );
             }
 
@@ -294,7 +296,7 @@ impl AtlasValidator {
             if policy.actions.is_empty() {
                 result.add_error(
                     ValidationIssue::new("E008", "Policy must have at least one action pattern")
-                        .with_path(&format!("{}.actions", path)),
+                        .with_path(path("actions")),
                 );
             }
 
@@ -311,7 +313,7 @@ impl AtlasValidator {
                             "W004",
                             format!("Invalid action pattern: {}", pattern),
                         )
-                        .with_path(&format!("{}.actions[{}]", path, j)),
+                        .with_path(path(&format!("actions[{}]", j))),
                     );
                 }
             }
@@ -321,37 +323,31 @@ impl AtlasValidator {
     fn validate_rate_limit_params(
         &self,
         policy: &AtlasPolicy,
-        path: &str,
+        path: &dyn Fn(&str) -> String,
         result: &mut ValidationResult,
     ) {
-        match &policy.parameters {
-            Some(params) => {
-                if params.get("max_calls").is_none() {
-                    result.add_error(
-                        ValidationIssue::new(
-                            "E009",
-                            "Rate limit policy must have max_calls parameter",
-                        )
-                        .with_path(&format!("{}.parameters.max_calls", path)),
-                    );
-                }
-                if params.get("window_seconds").is_none() {
-                    result.add_error(
-                        ValidationIssue::new(
-                            "E010",
-                            "Rate limit policy must have window_seconds parameter",
-                        )
-                        .with_path(&format!("{}.parameters.window_seconds", path)),
-                    );
-                }
-            }
-            None => {
+        /// Required rate limit parameters and the code reported when missing
+        const REQUIRED: [(&str, &str); 2] = [("max_calls", "E009"), ("window_seconds", "E010")];
+
+        let Some(params) = &policy.parameters else {
+            result.add_error(
+                ValidationIssue::new(
+                    "E011",
+                    "Rate limit policy must have parameters",
+                )
+                .with_path(path("parameters")),
+            );
+            return;
+        };
+
+        for (param, code) in REQUIRED {
+            if params.get(param).is_none() {
                 result.add_error(
                     ValidationIssue::new(
-                        "E011",
-                        "Rate limit policy must have parameters",
+                        code,
+                        format!("Rate limit policy must have {} parameter", param),
                     )
-                    .with_path(&format!("{}.parameters", path)),
+                    .with_path(path(&format!("parameters.{}", param))),
                 );
             }
         }
@@ -365,8 +361,6 @@ impl AtlasValidator {
             .collect();
 
         for (i, capability) in manifest.capabilities.iter().enumerate() {
-            let path = format!("capabilities[{}]", i);
-
             // Check referenced actions exist
             for (j, action_id) in capability.actions.iter().enumerate() {
                 if !action_ids.contains(action_id.as_str()) {
@@ -375,7 +369,7 @@ impl AtlasValidator {
                             "E012",
                             format!("Capability references unknown action: {}", action_id),
                         )
-                        .with_path(&format!("{}.actions[{}]", path, j)),
+                        .with_path(format!("capabilities[{}].actions[{}]", i, j)),
                     );
                 }
             }
@@ -384,7 +378,7 @@ impl AtlasValidator {
             if capability.actions.is_empty() {
                 result.add_warning(
                     ValidationIssue::new("W005", "Capability has no actions")
-                        .with_path(&format!("{}.actions", path)),
+                        .with_path(format!("capabilities[{}].actions", i)),
                 );
             }
         }
@@ -392,52 +386,56 @@ impl AtlasValidator {
 
     fn validate_context_packs(&self, manifest: &AtlasManifest, result: &mut ValidationResult) {
         for (i, pack) in manifest.context_packs.iter().enumerate() {
-            let path = format!("context_packs[{}]", i);
-
             if pack.files.is_empty() {
                 result.add_warning(
                     ValidationIssue::new("W006", "Context pack has no files")
-                        .with_path(&format!("{}.files", path)),
+                        .with_path(format!("context_packs[{}].files", i)),
                 );
             }
         }
     }
 
     fn check_recommendations(&self, manifest: &AtlasManifest, result: &mut ValidationResult) {
-        // License
-        if manifest.license.is_none() {
-            result.add_info(
-                ValidationIssue::new("I001", "No license specified")
-                    .with_path("license")
-                    .with_suggestion("Add an SPDX license identifier"),
-            );
-        }
-
-        // Description
-        if manifest.description.is_empty() {
-            result.add_info(
-                ValidationIssue::new("I002", "No description provided")
-                    .with_path("description")
-                    .with_suggestion("Add a description to help users understand this atlas"),
-            );
-        }
-
-        // Authors
-        if manifest.authors.is_empty() {
-            result.add_info(
-                ValidationIssue::new("I003", "No authors specified")
-                    .with_path("authors")
-                    .with_suggestion("Add author information"),
-            );
-        }
-
-        // Domains
-        if manifest.domains.is_empty() {
-            result.add_info(
-                ValidationIssue::new("I004", "No domains specified")
-                    .with_path("domains")
-                    .with_suggestion("Add domain tags for better discoverability"),
-            );
+        // (missing, code, path, message, suggestion)
+        let checks = [
+            (
+                manifest.license.is_none(),
+                "I001",
+                "license",
+                "No license specified",
+                "Add an SPDX license identifier",
+            ),
+            (
+                manifest.description.is_empty(),
+                "I002",
+                "description",
+                "No description provided",
+                "Add a description to help users understand this atlas",
+            ),
+            (
+                manifest.authors.is_empty(),
+                "I003",
+                "authors",
+                "No authors specified",
+                "Add author information",
+            ),
+            (
+                manifest.domains.is_empty(),
+                "I004",
+                "domains",
+                "No domains specified",
+                "Add domain tags for better discoverability",
+            ),
+        ];
+
+        for (missing, code, path, message, suggestion) in checks {
+            if missing {
+                result.add_info(
+                    ValidationIssue::new(code, message)
+                        .with_path(path)
+                        .with_suggestion(suggestion),
+                );
+            }
         }
     }
 }
@@ -609,6 +607,18 @@ mod tests {
 
         assert!(!result.is_valid);
         assert!(result.errors.iter().any(|e| e.code == "E011"));
+
+        // Each missing parameter is reported under its own code and path
+        let index = manifest.policies.len() - 1;
+        manifest.policies[index].parameters = Some(serde_json::json!({"max_calls": 10}));
+        let result = validator.validate(&manifest);
+
+        let missing = result.errors.iter().find(|e| e.code == "E010").unwrap();
+        assert_eq!(
+            missing.path.as_deref(),
+            Some(format!("policies[{}].parameters.window_seconds", index).as_str())
+        );
+        assert!(!result.errors.iter().any(|e| e.code == "E009" || e.code == "E011"));
     }
 
     #[test]
@@ -7,10 +7,14 @@
 //!     cra-context "I need to modify the hash computation"
 //!     cra-context --atlas path/to/atlas.json "Add a new event type"
 //!     cra-context --json "Working on trace module"
+//!     cra-context --json --pretty "Working on trace module"
+//!     cra-context --compact "Working on trace module"
 
 use clap::Parser;
 use cra_core::{Resolver, CARPRequest, atlas::AtlasManifest};
-use std::path::PathBuf;
+use std::fs::File;
+use std::io::{BufReader, BufWriter, Write};
+use std::path::{Path, PathBuf};
 
 #[derive(Parser, Debug)]
 #[command(name = "cra-context")]
@@ -28,10 +32,18 @@ struct Args {
     #[arg(long)]
     json: bool,
 
+    /// Indent JSON output (default is compact)
+    #[arg(long)]
+    pretty: bool,
+
     /// Show only context block IDs (no content)
     #[arg(long)]
     list_only: bool,
 
+    /// Render context without preamble, separators and footer
+    #[arg(long)]
+    compact: bool,
+
     /// Agent ID for session tracking
     #[arg(long, default_value = "cli-agent")]
     agent_id: String,
@@ -53,9 +65,13 @@ fn main() {
         }
     };
 
+    // Only the verbose banner needs anything from the manifest once it has
+    // been handed to the resolver, so don't copy the whole atlas for it
+    let atlas_label = args.verbose.then(|| format!("{} v{}", atlas.name, atlas.version));
+
     // Create resolver and load atlas
     let mut resolver = Resolver::new();
-    if let Err(e) = resolver.load_atlas(atlas.clone()) {
+    if let Err(e) = resolver.load_atlas(atlas) {
         eprintln!("Error loading atlas into resolver: {}", e);
         std::process::exit(1);
     }
@@ -71,7 +87,7 @@ fn main() {
 
     if args.verbose {
         eprintln!("Session: {}", &session_id[..8]);
-        eprintln!("Atlas: {} v{}", atlas.name, atlas.version);
+        eprintln!("Atlas: {}", atlas_label.unwrap_or_default());
         eprintln!("Goal: \"{}\"", args.goal);
         eprintln!();
     }
@@ -93,11 +109,11 @@ fn main() {
 
     // Output based on format
     if args.json {
-        output_json(&resolution);
+        output_json(&resolution, args.pretty);
     } else if args.list_only {
         output_list(&resolution);
     } else {
-        output_rendered(&resolution, args.verbose);
+        output_rendered(&resolution, args.verbose, args.compact);
     }
 }
 
@@ -107,10 +123,7 @@ fn load_atlas(path: &Option<PathBuf>, verbose: bool) -> Result<AtlasManifest, St
         if verbose {
             eprintln!("Loading atlas from: {}", p.display());
         }
-        let content = std::fs::read_to_string(p)
-            .map_err(|e| format!("Failed to read atlas file: {}", e))?;
-        return serde_json::from_str(&content)
-            .map_err(|e| format!("Failed to parse atlas JSON: {}", e));
+        return read_atlas_file(p);
     }
 
     // Try default locations
@@ -126,58 +139,79 @@ fn load_atlas(path: &Option<PathBuf>, verbose: bool) -> Result<AtlasManifest, St
             if verbose {
                 eprintln!("Found atlas at: {}", p.display());
             }
-            let content = std::fs::read_to_string(p)
-                .map_err(|e| format!("Failed to read atlas file: {}", e))?;
-            return serde_json::from_str(&content)
-                .map_err(|e| format!("Failed to parse atlas JSON: {}", e));
+            return read_atlas_file(p);
         }
     }
 
     Err("No atlas found. Specify with --atlas or place cra-development.json in atlases/".to_string())
 }
 
-fn output_json(resolution: &cra_core::CARPResolution) {
+/// Parse an atlas straight from a buffered file reader
+///
+/// The manifest is built as the bytes are read, so large atlases are never
+/// held in memory twice (once as text, once parsed).
+fn read_atlas_file(path: &Path) -> Result<AtlasManifest, String> {
+    let file = File::open(path)
+        .map_err(|e| format!("Failed to read atlas file: {}", e))?;
+    serde_json::from_reader(BufReader::new(file))
+        .map_err(|e| format!("Failed to parse atlas JSON: {}", e))
+}
+
+fn output_json(resolution: &cra_core::CARPResolution, pretty: bool) {
+    // Borrow from the resolution: the output is only read by the
+    // serializer, so copying every block's content would be wasted work
     #[derive(serde::Serialize)]
-    struct JsonOutput {
+    struct JsonOutput<'a> {
         decision: String,
-        context_blocks: Vec<JsonBlock>,
+        context_blocks: Vec<JsonBlock<'a>>,
         rendered: String,
     }
 
     #[derive(serde::Serialize)]
-    struct JsonBlock {
-        id: String,
-        name: String,
+    struct JsonBlock<'a> {
+        id: &'a str,
+        name: &'a str,
         priority: i32,
-        source: String,
-        content_type: String,
-        content: String,
+        source: &'a str,
+        content_type: &'a str,
+        content: &'a str,
     }
 
     let output = JsonOutput {
         decision: format!("{:?}", resolution.decision),
         context_blocks: resolution.context_blocks.iter().map(|b| JsonBlock {
-            id: b.block_id.clone(),
-            name: b.name.clone(),
+            id: &b.block_id,
+            name: &b.name,
             priority: b.priority,
-            source: b.source_atlas.clone(),
-            content_type: b.content_type.clone(),
-            content: b.content.clone(),
+            source: &b.source_atlas,
+            content_type: &b.content_type,
+            content: &b.content,
         }).collect(),
         rendered: resolution.render_context(),
     };
 
-    println!("{}", serde_json::to_string_pretty(&output).unwrap());
+    // Stream straight into locked, buffered stdout instead of formatting
+    // the whole document into an intermediate String first
+    let stdout = std::io::stdout();
+    let mut out = BufWriter::new(stdout.lock());
+    // Compact unless asked otherwise: the output is usually piped into a
+    // program or jq, and indenting costs time and size
+    if pretty {
+        serde_json::to_writer_pretty(&mut out, &output).unwrap();
+    } else {
+        serde_json::to_writer(&mut out, &output).unwrap();
+    }
+    writeln!(out).unwrap();
 }
 
 fn output_list(resolution: &cra_core::CARPResolution) {
     println!("Context blocks for goal:");
     println!();
 
-    let mut blocks = resolution.context_blocks.clone();
+    let mut blocks: Vec<_> = resolution.context_blocks.iter().collect();
     blocks.sort_by(|a, b| b.priority.cmp(&a.priority));
 
-    for block in &blocks {
+    for block in blocks {
         println!("  {} (priority: {}, source: {})",
             block.block_id,
             block.priority,
@@ -189,7 +223,7 @@ fn output_list(resolution: &cra_core::CARPResolution) {
     println!("Total: {} blocks", resolution.context_blocks.len());
 }
 
-fn output_rendered(resolution: &cra_core::CARPResolution, verbose: bool) {
+fn output_rendered(resolution: &cra_core::CARPResolution, verbose: bool, compact: bool) {
     if verbose {
         eprintln!("Decision: {:?}", resolution.decision);
         eprintln!("Context blocks: {}", resolution.context_blocks.len());
@@ -200,5 +234,9 @@ fn output_rendered(resolution: &cra_core::CARPResolution, verbose: bool) {
     }
 
     // Output the rendered context (this is what an LLM would receive)
-    print!("{}", resolution.render_context());
+    if compact {
+        print!("{}", resolution.render_context_compact());
+    } else {
+        print!("{}", resolution.render_context());
+    }
 }
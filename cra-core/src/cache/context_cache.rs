@@ -11,6 +11,10 @@ use sha2::{Digest, Sha256};
 
 use super::DEFAULT_CONTEXT_TTL;
 
+/// A full cache evicts `max_entries / EVICTION_BATCH_DIVISOR` of its oldest
+/// entries at once
+const EVICTION_BATCH_DIVISOR: usize = 8;
+
 /// Configuration for context cache
 #[derive(Debug, Clone)]
 pub struct ContextCacheConfig {
@@ -66,7 +70,12 @@ pub struct CachedContext {
 impl CachedContext {
     /// Check if this entry has expired
     pub fn is_expired(&self) -> bool {
-        Instant::now() >= self.expires_at
+        self.is_expired_at(Instant::now())
+    }
+
+    /// Check expiry against a clock reading the caller already has
+    pub fn is_expired_at(&self, now: Instant) -> bool {
+        now >= self.expires_at
     }
 
     /// Get time until expiration
@@ -152,7 +161,8 @@ impl ContextCache {
         let ttl = ttl.unwrap_or(self.config.default_ttl);
 
         let content_hash = if self.config.track_hashes {
-            compute_hash(&content)
+            self.cached_hash(&key, &content)
+                .unwrap_or_else(|| compute_hash(&content))
         } else {
             String::new()
         };
@@ -168,11 +178,13 @@ impl ContextCache {
 
         let mut entries = self.entries.write().unwrap();
 
-        // Check if we need to evict entries
-        if entries.len() >= self.config.max_entries {
-            self.evict_expired(&mut entries);
+        // Check if we need to evict entries (overwriting a key never grows
+        // the cache, so it needs no room made)
+        if entries.len() >= self.config.max_entries && !entries.contains_key(&key) {
+            self.evict_expired(&mut entries, now);
 
-            // If still full, evict oldest
+            // If still full, evict a batch of the oldest so the inserts that
+            // follow don't each rescan the whole cache
             if entries.len() >= self.config.max_entries {
                 self.evict_oldest(&mut entries);
             }
@@ -181,6 +193,18 @@ impl ContextCache {
         entries.insert(key, entry);
     }
 
+    /// Reuse the stored hash when re-caching unchanged content
+    ///
+    /// Comparing the bytes is far cheaper than hashing them again, and
+    /// refreshing an entry with identical content is the common case.
+    fn cached_hash(&self, key: &str, content: &str) -> Option<String> {
+        let entries = self.entries.read().unwrap();
+        entries
+            .get(key)
+            .filter(|entry| !entry.content_hash.is_empty() && entry.content == content)
+            .map(|entry| entry.content_hash.clone())
+    }
+
     /// Invalidate a specific context
     pub fn invalidate(&self, atlas_id: &str, context_id: &str) {
         let key = make_key(atlas_id, context_id);
@@ -199,24 +223,31 @@ impl ContextCache {
         self.entries.write().unwrap().clear();
     }
 
-    /// Evict expired entries
-    fn evict_expired(&self, entries: &mut HashMap<String, CachedContext>) {
+    /// Evict entries expired as of `now`
+    fn evict_expired(&self, entries: &mut HashMap<String, CachedContext>, now: Instant) {
         let before = entries.len();
-        entries.retain(|_, v| !v.is_expired());
+        entries.retain(|_, v| !v.is_expired_at(now));
         let evicted = before - entries.len();
         self.evictions.fetch_add(evicted as u64, Ordering::Relaxed);
     }
 
-    /// Evict oldest entry
+    /// Evict the oldest eighth of the cache (at least one entry)
     fn evict_oldest(&self, entries: &mut HashMap<String, CachedContext>) {
-        if let Some(oldest_key) = entries
-            .iter()
-            .min_by_key(|(_, v)| v.cached_at)
-            .map(|(k, _)| k.clone())
-        {
-            entries.remove(&oldest_key);
-            self.evictions.fetch_add(1, Ordering::Relaxed);
+        let count = (self.config.max_entries / EVICTION_BATCH_DIVISOR).max(1);
+        let mut by_age: Vec<(Instant, &String)> =
+            entries.iter().map(|(k, v)| (v.cached_at, k)).collect();
+
+        let oldest: Vec<String> = if count < by_age.len() {
+            by_age.select_nth_unstable_by_key(count - 1, |(cached_at, _)| *cached_at);
+            by_age[..count].iter().map(|(_, k)| (*k).clone()).collect()
+        } else {
+            by_age.iter().map(|(_, k)| (*k).clone()).collect()
+        };
+
+        for key in &oldest {
+            entries.remove(key);
         }
+        self.evictions.fetch_add(oldest.len() as u64, Ordering::Relaxed);
     }
 
     /// Get cache statistics
@@ -307,7 +338,9 @@ mod tests {
         cache.set("atlas-1", "context-1", "Test content".to_string(), None);
 
         // Should be cached
-        assert!(cache.get("atlas-1", "context-1").is_some());
+        let entry = cache.get("atlas-1", "context-1").unwrap();
+        assert!(!entry.is_expired_at(entry.cached_at));
+        assert!(entry.is_expired_at(entry.expires_at));
 
         // Wait for expiration
         thread::sleep(Duration::from_millis(60));
@@ -349,6 +382,14 @@ mod tests {
         // Same content should produce same hash
         let hash1 = compute_hash("Test content");
         assert_eq!(entry.content_hash, hash1);
+
+        // Re-caching unchanged content keeps the hash; new content rehashes
+        cache.set("atlas-1", "context-1", "Test content".to_string(), None);
+        assert_eq!(cache.get("atlas-1", "context-1").unwrap().content_hash, hash1);
+
+        cache.set("atlas-1", "context-1", "Changed content".to_string(), None);
+        let entry = cache.get("atlas-1", "context-1").unwrap();
+        assert_eq!(entry.content_hash, compute_hash("Changed content"));
     }
 
     #[test]
@@ -369,4 +410,34 @@ mod tests {
         assert_eq!(cache.len(), 3);
         assert!(cache.stats().evictions > 0);
     }
+
+    #[test]
+    fn test_eviction_batches_oldest() {
+        let config = ContextCacheConfig::default()
+            .with_max_entries(16);
+        let cache = ContextCache::with_config(config);
+
+        for i in 0..16 {
+            cache.set("atlas-1", &format!("context-{}", i), "Content".to_string(), None);
+        }
+
+        // Overwriting an existing key never evicts
+        cache.set("atlas-1", "context-0", "Updated".to_string(), None);
+        assert_eq!(cache.len(), 16);
+        assert_eq!(cache.stats().evictions, 0);
+
+        // A new key evicts the two oldest (context-0 was just refreshed),
+        // leaving room for the next insert
+        cache.set("atlas-1", "context-16", "Content".to_string(), None);
+        assert_eq!(cache.len(), 15);
+        assert_eq!(cache.stats().evictions, 2);
+        assert!(cache.get("atlas-1", "context-0").is_some());
+        assert!(cache.get("atlas-1", "context-1").is_none());
+        assert!(cache.get("atlas-1", "context-2").is_none());
+        assert!(cache.get("atlas-1", "context-3").is_some());
+
+        cache.set("atlas-1", "context-17", "Content".to_string(), None);
+        assert_eq!(cache.len(), 16);
+        assert_eq!(cache.stats().evictions, 2);
+    }
 }
@@ -92,7 +92,12 @@ pub struct CachedPolicy {
 impl CachedPolicy {
     /// Check if this entry has expired
     pub fn is_expired(&self) -> bool {
-        Instant::now() >= self.expires_at
+        self.is_expired_at(Instant::now())
+    }
+
+    /// Check expiry against a clock reading the caller already has
+    pub fn is_expired_at(&self, now: Instant) -> bool {
+        now >= self.expires_at
     }
 
     /// Get time until expiration
@@ -101,17 +106,96 @@ impl CachedPolicy {
     }
 }
 
-/// Cache key: atlas_id:action_id:params_hash
-fn make_key(atlas_id: &str, action_id: &str, params_hash: &str) -> String {
-    format!("{}:{}:{}", atlas_id, action_id, params_hash)
+/// Cached entries by atlas_id, then action_id, then params_hash
+///
+/// Nesting the maps lets lookups use the borrowed IDs directly instead of
+/// formatting an "atlas:action:params" key on every call, and turns
+/// action- and atlas-wide invalidation into a single remove instead of a
+/// prefix scan over every key.
+#[derive(Debug, Default)]
+struct Entries {
+    by_atlas: HashMap<String, HashMap<String, HashMap<String, CachedPolicy>>>,
+    len: usize,
+}
+
+impl Entries {
+    fn get(&self, atlas_id: &str, action_id: &str, params_hash: &str) -> Option<&CachedPolicy> {
+        self.by_atlas.get(atlas_id)?.get(action_id)?.get(params_hash)
+    }
+
+    fn insert(&mut self, entry: CachedPolicy) {
+        let by_params = self
+            .by_atlas
+            .entry(entry.atlas_id.clone())
+            .or_default()
+            .entry(entry.action_id.clone())
+            .or_default();
+        if by_params.insert(entry.params_hash.clone(), entry).is_none() {
+            self.len += 1;
+        }
+    }
+
+    fn remove(&mut self, atlas_id: &str, action_id: &str, params_hash: &str) -> Option<CachedPolicy> {
+        let by_action = self.by_atlas.get_mut(atlas_id)?;
+        let by_params = by_action.get_mut(action_id)?;
+        let removed = by_params.remove(params_hash)?;
+        self.len -= 1;
+
+        if by_params.is_empty() {
+            by_action.remove(action_id);
+            if by_action.is_empty() {
+                self.by_atlas.remove(atlas_id);
+            }
+        }
+        Some(removed)
+    }
+
+    fn remove_action(&mut self, atlas_id: &str, action_id: &str) {
+        if let Some(by_action) = self.by_atlas.get_mut(atlas_id) {
+            if let Some(by_params) = by_action.remove(action_id) {
+                self.len -= by_params.len();
+            }
+            if by_action.is_empty() {
+                self.by_atlas.remove(atlas_id);
+            }
+        }
+    }
+
+    fn remove_atlas(&mut self, atlas_id: &str) {
+        if let Some(by_action) = self.by_atlas.remove(atlas_id) {
+            self.len -= by_action.values().map(HashMap::len).sum::<usize>();
+        }
+    }
+
+    /// Keep only entries matching `keep`, returning how many were removed
+    fn retain(&mut self, mut keep: impl FnMut(&CachedPolicy) -> bool) -> usize {
+        let before = self.len;
+        self.by_atlas.retain(|_, by_action| {
+            by_action.retain(|_, by_params| {
+                by_params.retain(|_, entry| keep(entry));
+                !by_params.is_empty()
+            });
+            !by_action.is_empty()
+        });
+        self.len = self.by_atlas.values().flat_map(HashMap::values).map(HashMap::len).sum();
+        before - self.len
+    }
+
+    fn values(&self) -> impl Iterator<Item = &CachedPolicy> {
+        self.by_atlas.values().flat_map(HashMap::values).flat_map(HashMap::values)
+    }
+
+    fn clear(&mut self) {
+        self.by_atlas.clear();
+        self.len = 0;
+    }
 }
 
 /// Compute hash of parameters for cache key
 pub fn hash_params(params: &serde_json::Value) -> String {
     let mut hasher = Sha256::new();
-    // Use canonical JSON for consistent hashing
-    let json = serde_json::to_string(params).unwrap_or_default();
-    hasher.update(json.as_bytes());
+    // Serialize straight into the hasher rather than through a String
+    let _ = serde_json::to_writer(&mut hasher, params);
     hex::encode(hasher.finalize())
 }
 
@@ -119,7 +203,7 @@ pub fn hash_params(params: &serde_json::Value) -> String {
 #[derive(Debug)]
 pub struct PolicyCache {
     /// Cached entries
-    entries: RwLock<HashMap<String, CachedPolicy>>,
+    entries: RwLock<Entries>,
     /// Configuration
     config: PolicyCacheConfig,
     /// Statistics
@@ -137,7 +221,7 @@ impl PolicyCache {
     /// Create with custom config
     pub fn with_config(config: PolicyCacheConfig) -> Self {
         Self {
-            entries: RwLock::new(HashMap::new()),
+            entries: RwLock::new(Entries::default()),
             config,
             hits: AtomicU64::new(0),
             misses: AtomicU64::new(0),
@@ -147,10 +231,9 @@ impl PolicyCache {
 
     /// Get a cached policy decision
     pub fn get(&self, atlas_id: &str, action_id: &str, params_hash: &str) -> Option<CachedPolicy> {
-        let key = make_key(atlas_id, action_id, params_hash);
         let entries = self.entries.read().unwrap();
 
-        match entries.get(&key) {
+        match entries.get(atlas_id, action_id, params_hash) {
             Some(entry) if !entry.is_expired() => {
                 self.hits.fetch_add(1, Ordering::Relaxed);
                 Some(entry.clone())
@@ -200,7 +283,6 @@ impl PolicyCache {
         policy_id: Option<String>,
         ttl: Option<Duration>,
     ) {
-        let key = make_key(atlas_id, action_id, params_hash);
         let now = Instant::now();
         let ttl = ttl.unwrap_or(self.config.default_ttl);
 
@@ -218,35 +300,30 @@ impl PolicyCache {
         let mut entries = self.entries.write().unwrap();
 
         // Evict if needed
-        if entries.len() >= self.config.max_entries {
-            self.evict_expired(&mut entries);
+        if entries.len >= self.config.max_entries {
+            self.evict_expired(&mut entries, now);
 
-            if entries.len() >= self.config.max_entries {
+            if entries.len >= self.config.max_entries {
                 self.evict_oldest(&mut entries);
             }
         }
 
-        entries.insert(key, entry);
+        entries.insert(entry);
     }
 
     /// Invalidate a specific action
     pub fn invalidate(&self, atlas_id: &str, action_id: &str, params_hash: &str) {
-        let key = make_key(atlas_id, action_id, params_hash);
-        self.entries.write().unwrap().remove(&key);
+        self.entries.write().unwrap().remove(atlas_id, action_id, params_hash);
     }
 
     /// Invalidate all decisions for an action (any params)
     pub fn invalidate_action(&self, atlas_id: &str, action_id: &str) {
-        let mut entries = self.entries.write().unwrap();
-        let prefix = format!("{}:{}:", atlas_id, action_id);
-        entries.retain(|k, _| !k.starts_with(&prefix));
+        self.entries.write().unwrap().remove_action(atlas_id, action_id);
     }
 
     /// Invalidate all decisions for an atlas
     pub fn invalidate_atlas(&self, atlas_id: &str) {
-        let mut entries = self.entries.write().unwrap();
-        let prefix = format!("{}:", atlas_id);
-        entries.retain(|k, _| !k.starts_with(&prefix));
+        self.entries.write().unwrap().remove_atlas(atlas_id);
     }
 
     /// Clear all entries
@@ -254,22 +331,20 @@ impl PolicyCache {
         self.entries.write().unwrap().clear();
     }
 
-    /// Evict expired entries
-    fn evict_expired(&self, entries: &mut HashMap<String, CachedPolicy>) {
-        let before = entries.len();
-        entries.retain(|_, v| !v.is_expired());
-        let evicted = before - entries.len();
+    /// Evict entries expired as of `now`
+    fn evict_expired(&self, entries: &mut Entries, now: Instant) {
+        let evicted = entries.retain(|v| !v.is_expired_at(now));
         self.evictions.fetch_add(evicted as u64, Ordering::Relaxed);
     }
 
     /// Evict oldest entry
-    fn evict_oldest(&self, entries: &mut HashMap<String, CachedPolicy>) {
-        if let Some(oldest_key) = entries
-            .iter()
-            .min_by_key(|(_, v)| v.cached_at)
-            .map(|(k, _)| k.clone())
+    fn evict_oldest(&self, entries: &mut Entries) {
+        if let Some(oldest) = entries
+            .values()
+            .min_by_key(|v| v.cached_at)
+            .map(|v| (v.atlas_id.clone(), v.action_id.clone(), v.params_hash.clone()))
         {
-            entries.remove(&oldest_key);
+            entries.remove(&oldest.0, &oldest.1, &oldest.2);
             self.evictions.fetch_add(1, Ordering::Relaxed);
         }
     }
@@ -281,7 +356,7 @@ impl PolicyCache {
         let misses = self.misses.load(Ordering::Relaxed);
 
         CacheStats {
-            entries: entries.len(),
+            entries: entries.len,
             max_entries: self.config.max_entries,
             hits,
             misses,
@@ -296,12 +371,12 @@ impl PolicyCache {
 
     /// Get number of entries
     pub fn len(&self) -> usize {
-        self.entries.read().unwrap().len()
+        self.entries.read().unwrap().len
     }
 
     /// Check if cache is empty
     pub fn is_empty(&self) -> bool {
-        self.entries.read().unwrap().is_empty()
+        self.entries.read().unwrap().len == 0
     }
 }
 
@@ -427,6 +502,20 @@ mod tests {
         assert!(cache.get("atlas-2", "action-1", "hash-1").is_some());
     }
 
+    #[test]
+    fn test_ids_containing_separator_stay_distinct() {
+        let cache = PolicyCache::new();
+
+        cache.set("atlas", "a:b", "c", PolicyDecision::Allow, None);
+        cache.set("atlas:a", "b", "c", PolicyDecision::Deny, None);
+        assert_eq!(cache.len(), 2);
+        assert!(cache.get("atlas", "a:b", "c").unwrap().decision.is_allowed());
+
+        cache.invalidate_atlas("atlas");
+        assert_eq!(cache.len(), 1);
+        assert!(cache.get("atlas:a", "b", "c").unwrap().decision.is_denied());
+    }
+
     #[test]
     fn test_full_details() {
         let cache = PolicyCache::new();
@@ -43,6 +43,7 @@
 //! - `interactive` - Steward-defined interactive gate
 
 use std::collections::{HashMap, HashSet};
+use std::sync::RwLock;
 use std::time::{Duration, Instant};
 
 use serde::{Deserialize, Serialize};
@@ -754,13 +755,22 @@ impl CheckpointValidator {
     pub fn validate(
         checkpoint: &TriggeredCheckpoint,
         response: &CheckpointResponse,
+    ) -> CheckpointValidation {
+        Self::validate_with(checkpoint, response, None)
+    }
+
+    /// Validate a response, reusing answer patterns compiled by `patterns`
+    pub fn validate_with(
+        checkpoint: &TriggeredCheckpoint,
+        response: &CheckpointResponse,
+        patterns: Option<&AnswerPatternCache>,
     ) -> CheckpointValidation {
         let mut question_results = HashMap::new();
         let mut is_valid = true;
         let mut actions = vec![];
 
         for question in &checkpoint.questions {
-            let result = Self::validate_question(question, response.answers.get(&question.question_id));
+            let result = Self::validate_question(question, response.answers.get(&question.question_id), patterns);
 
             if question.required && !result.is_valid {
                 is_valid = false;
@@ -835,6 +845,7 @@ impl CheckpointValidator {
     fn validate_question(
         question: &CheckpointQuestion,
         answer: Option<&AnswerValue>,
+        patterns: Option<&AnswerPatternCache>,
     ) -> QuestionValidationResult {
         let Some(answer) = answer else {
             return QuestionValidationResult {
@@ -900,21 +911,25 @@ impl CheckpointValidator {
                     }
                 }
 
+                let text_lower = text.to_lowercase();
+
                 // Must contain
-                for keyword in &validation.must_contain {
-                    if !text.to_lowercase().contains(&keyword.to_lowercase()) {
-                        return QuestionValidationResult {
-                            question_id: question.question_id.clone(),
-                            is_valid: false,
-                            error_message: Some(format!("Answer must contain: {}", keyword)),
-                            action: question.on_invalid.clone(),
-                        };
-                    }
+                if let Some(keyword) = validation
+                    .must_contain
+                    .iter()
+                    .find(|keyword| !text_lower.contains(&keyword.to_lowercase()))
+                {
+                    return QuestionValidationResult {
+                        question_id: question.question_id.clone(),
+                        is_valid: false,
+                        error_message: Some(format!("Answer must contain: {}", keyword)),
+                        action: question.on_invalid.clone(),
+                    };
                 }
 
                 // Must not contain
                 for keyword in &validation.must_not_contain {
-                    if text.to_lowercase().contains(&keyword.to_lowercase()) {
+                    if text_lower.contains(&keyword.to_lowercase()) {
                         return QuestionValidationResult {
                             question_id: question.question_id.clone(),
                             is_valid: false,
@@ -926,8 +941,12 @@ impl CheckpointValidator {
 
                 // Pattern validation
                 if let Some(pattern) = &validation.pattern {
-                    if let Ok(re) = regex::Regex::new(pattern) {
-                        if !re.is_match(text) {
+                    let matched = match patterns {
+                        Some(patterns) => patterns.is_match(pattern, text),
+                        None => regex::Regex::new(pattern).ok().map(|re| re.is_match(text)),
+                    };
+                    if let Some(matched) = matched {
+                        if !matched {
                             return QuestionValidationResult {
                                 question_id: question.question_id.clone(),
                                 is_valid: false,
@@ -1214,16 +1233,100 @@ impl Default for SessionCheckpointState {
     }
 }
 
+/// Answer patterns compiled once and reused across checkpoint responses
+///
+/// Keyed by pattern source, so edited questions simply compile a new entry.
+/// Invalid patterns are kept as `None` and not enforced. Once the cache is
+/// full, further patterns are compiled per call instead of being stored.
+#[derive(Debug, Default)]
+pub struct AnswerPatternCache {
+    patterns: RwLock<HashMap<String, Option<regex::Regex>>>,
+}
+
+impl AnswerPatternCache {
+    /// Maximum number of distinct patterns kept compiled
+    pub const MAX_PATTERNS: usize = 256;
+
+    /// Create an empty cache
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Whether `text` matches `pattern`, or `None` if the pattern is invalid
+    pub fn is_match(&self, pattern: &str, text: &str) -> Option<bool> {
+        if let Ok(patterns) = self.patterns.read() {
+            if let Some(compiled) = patterns.get(pattern) {
+                return compiled.as_ref().map(|re| re.is_match(text));
+            }
+        }
+
+        let compiled = regex::Regex::new(pattern).ok();
+        let matched = compiled.as_ref().map(|re| re.is_match(text));
+        if let Ok(mut patterns) = self.patterns.write() {
+            if patterns.len() < Self::MAX_PATTERNS {
+                patterns.insert(pattern.to_string(), compiled);
+            }
+        }
+        matched
+    }
+
+    /// Number of patterns currently compiled
+    pub fn len(&self) -> usize {
+        self.patterns.read().map(|p| p.len()).unwrap_or(0)
+    }
+
+    /// Whether no patterns are compiled yet
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+}
+
 /// Checkpoint evaluator
 #[derive(Debug)]
 pub struct CheckpointEvaluator {
     config: CheckpointConfig,
+    /// Keyword patterns compiled once, when matching in regex mode
+    keyword_regexes: HashMap<String, regex::Regex>,
+    /// Wildcard action_pre patterns as (prefix, pattern), longest prefix first
+    action_pre_prefixes: Vec<(String, String)>,
+    /// Answer validation patterns compiled on first use
+    answer_patterns: AnswerPatternCache,
 }
 
 impl CheckpointEvaluator {
     /// Create a new evaluator with config
     pub fn new(config: CheckpointConfig) -> Self {
-        Self { config }
+        let keyword_regexes = match config.keyword_match.match_mode {
+            MatchMode::Regex => config
+                .keyword_match
+                .mappings
+                .keys()
+                .filter_map(|pattern| {
+                    regex::Regex::new(pattern)
+                        .ok()
+                        .map(|re| (pattern.clone(), re))
+                })
+                .collect(),
+            _ => HashMap::new(),
+        };
+
+        // Only wildcard patterns need scanning on an exact-match miss, so an
+        // action with no checkpoint costs one hash lookup when there are none
+        let mut action_pre_prefixes: Vec<(String, String)> = config
+            .action_pre
+            .mappings
+            .keys()
+            .filter(|pattern| pattern.ends_with('*'))
+            .map(|pattern| (pattern.trim_end_matches('*').to_string(), pattern.clone()))
+            .collect();
+        action_pre_prefixes.sort_by(|a, b| b.0.len().cmp(&a.0.len()));
+
+        Self {
+            config,
+            keyword_regexes,
+            action_pre_prefixes,
+            answer_patterns: AnswerPatternCache::new(),
+        }
     }
 
     /// Create with default config
@@ -1231,6 +1334,15 @@ impl CheckpointEvaluator {
         Self::new(CheckpointConfig::default())
     }
 
+    /// Validate a response, compiling each answer pattern only once
+    pub fn validate_response(
+        &self,
+        checkpoint: &TriggeredCheckpoint,
+        response: &CheckpointResponse,
+    ) -> CheckpointValidation {
+        CheckpointValidator::validate_with(checkpoint, response, Some(&self.answer_patterns))
+    }
+
     /// Evaluate session start checkpoint
     pub fn on_session_start(&self) -> Option<TriggeredCheckpoint> {
         if !self.config.session_start.enabled {
@@ -1456,8 +1568,9 @@ impl CheckpointEvaluator {
                     input_normalized.contains(&phrase)
                 }
                 MatchMode::Regex => {
-                    // Try to compile as regex
-                    regex::Regex::new(pattern)
+                    // Patterns that failed to compile never match
+                    self.keyword_regexes
+                        .get(pattern)
                         .map(|re| re.is_match(&input_normalized))
                         .unwrap_or(false)
                 }
@@ -1495,56 +1608,34 @@ impl CheckpointEvaluator {
         action_id: &str,
         params: Option<&Value>,
     ) -> Option<TriggeredCheckpoint> {
-        // Try exact match first
-        if let Some(config) = self.config.action_pre.mappings.get(action_id) {
-            return Some(TriggeredCheckpoint {
-                checkpoint_type: CheckpointType::ActionPre,
-                priority: CheckpointType::ActionPre.default_priority(),
-                inject_contexts: config.inject_contexts.clone(),
-                is_sync: config.require_policy_check,
-                trigger_data: Some(TriggerData::Action {
-                    action_id: action_id.to_string(),
-                    params: params.cloned(),
-                }),
-                steward_def: None,
-                questions: vec![],
-                guidance: None,
-                mode: if config.require_confirmation {
-                    CheckpointMode::Blocking
-                } else {
-                    CheckpointMode::Advisory
-                },
-            });
-        }
+        let mappings = &self.config.action_pre.mappings;
 
-        // Try wildcard patterns
-        for (pattern, config) in &self.config.action_pre.mappings {
-            if pattern.ends_with('*') {
-                let prefix = pattern.trim_end_matches('*');
-                if action_id.starts_with(prefix) {
-                    return Some(TriggeredCheckpoint {
-                        checkpoint_type: CheckpointType::ActionPre,
-                        priority: CheckpointType::ActionPre.default_priority(),
-                        inject_contexts: config.inject_contexts.clone(),
-                        is_sync: config.require_policy_check,
-                        trigger_data: Some(TriggerData::Action {
-                            action_id: action_id.to_string(),
-                            params: params.cloned(),
-                        }),
-                        steward_def: None,
-                        questions: vec![],
-                        guidance: None,
-                        mode: if config.require_confirmation {
-                            CheckpointMode::Blocking
-                        } else {
-                            CheckpointMode::Advisory
-                        },
-                    });
-                }
-            }
-        }
+        // Try exact match first, then the most specific wildcard pattern
+        let config = mappings.get(action_id).or_else(|| {
+            self.action_pre_prefixes
+                .iter()
+                .find(|(prefix, _)| action_id.starts_with(prefix.as_str()))
+                .and_then(|(_, pattern)| mappings.get(pattern))
+        })?;
 
-        None
+        Some(TriggeredCheckpoint {
+            checkpoint_type: CheckpointType::ActionPre,
+            priority: CheckpointType::ActionPre.default_priority(),
+            inject_contexts: config.inject_contexts.clone(),
+            is_sync: config.require_policy_check,
+            trigger_data: Some(TriggerData::Action {
+                action_id: action_id.to_string(),
+                params: params.cloned(),
+            }),
+            steward_def: None,
+            questions: vec![],
+            guidance: None,
+            mode: if config.require_confirmation {
+                CheckpointMode::Blocking
+            } else {
+                CheckpointMode::Advisory
+            },
+        })
     }
 
     fn evaluate_risk_threshold(
@@ -1552,22 +1643,7 @@ impl CheckpointEvaluator {
         risk_tier: RiskTier,
         action_id: &str,
     ) -> Option<TriggeredCheckpoint> {
-        // Compare risk tiers
-        let current_level = match risk_tier {
-            RiskTier::Low => 0,
-            RiskTier::Medium => 1,
-            RiskTier::High => 2,
-            RiskTier::Critical => 3,
-        };
-
-        let min_level = match self.config.risk_threshold.min_tier {
-            RiskTier::Low => 0,
-            RiskTier::Medium => 1,
-            RiskTier::High => 2,
-            RiskTier::Critical => 3,
-        };
-
-        if current_level >= min_level {
+        if risk_tier.level() >= self.config.risk_threshold.min_tier.level() {
             return Some(TriggeredCheckpoint {
                 checkpoint_type: CheckpointType::RiskThreshold,
                 priority: CheckpointType::RiskThreshold.default_priority(),
@@ -1657,6 +1733,27 @@ mod tests {
         assert_eq!(cp.inject_contexts, vec!["intro"]);
     }
 
+    #[test]
+    fn test_keyword_matching_regex() {
+        let mut config = CheckpointConfig::default();
+        config.keyword_match.match_mode = MatchMode::Regex;
+        config.keyword_match.mappings.insert(
+            r"deploy(ment)? to prod".to_string(),
+            vec!["deploy-safety".to_string()],
+        );
+        config.keyword_match.mappings.insert(
+            "(unclosed".to_string(),
+            vec!["never".to_string()],
+        );
+
+        let evaluator = CheckpointEvaluator::new(config);
+        let mut state = SessionCheckpointState::new();
+
+        let checkpoints = evaluator.on_input("Start the deployment to prod", &mut state);
+        assert_eq!(checkpoints.len(), 1);
+        assert_eq!(checkpoints[0].inject_contexts, vec!["deploy-safety"]);
+    }
+
     #[test]
     fn test_keyword_matching() {
         let mut config = CheckpointConfig::default();
@@ -1727,6 +1824,37 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_action_pre_most_specific_wildcard() {
+        let mut config = CheckpointConfig::default();
+        for (pattern, context) in [("delete_*", "deletion-warning"), ("delete_user*", "user-deletion")] {
+            config.action_pre.mappings.insert(
+                pattern.to_string(),
+                ActionCheckpointConfig {
+                    inject_contexts: vec![context.to_string()],
+                    require_policy_check: false,
+                    require_confirmation: false,
+                },
+            );
+        }
+
+        let evaluator = CheckpointEvaluator::new(config);
+        let mut state = SessionCheckpointState::new();
+        let action_pre = |checkpoints: Vec<TriggeredCheckpoint>| {
+            checkpoints
+                .into_iter()
+                .find(|c| c.checkpoint_type == CheckpointType::ActionPre)
+        };
+
+        let user = action_pre(evaluator.on_action_pre("delete_user", None, RiskTier::Low, &mut state));
+        assert_eq!(user.unwrap().inject_contexts, vec!["user-deletion"]);
+
+        let ticket = action_pre(evaluator.on_action_pre("delete_ticket", None, RiskTier::Low, &mut state));
+        assert_eq!(ticket.unwrap().inject_contexts, vec!["deletion-warning"]);
+
+        assert!(action_pre(evaluator.on_action_pre("read_ticket", None, RiskTier::Low, &mut state)).is_none());
+    }
+
     #[test]
     fn test_count_interval() {
         let mut config = CheckpointConfig::default();
@@ -1948,6 +2076,159 @@ mod tests {
         assert!(!validation.is_valid);
     }
 
+    #[test]
+    fn test_checkpoint_validator_missing_keyword() {
+        let checkpoint = TriggeredCheckpoint {
+            checkpoint_type: CheckpointType::Interactive,
+            priority: 500,
+            inject_contexts: vec![],
+            is_sync: true,
+            trigger_data: None,
+            steward_def: None,
+            questions: vec![
+                CheckpointQuestion::text("plan", "Describe your plan")
+                    .with_validation(AnswerValidation {
+                        pattern: None,
+                        min_length: None,
+                        max_length: None,
+                        must_contain: vec![
+                            "Backup".to_string(),
+                            "rollback".to_string(),
+                            "review".to_string(),
+                        ],
+                        must_not_contain: vec![],
+                        custom_validator: None,
+                    }),
+            ],
+            guidance: None,
+            mode: CheckpointMode::Blocking,
+        };
+
+        let mut answers = HashMap::new();
+        answers.insert("plan".to_string(), AnswerValue::Text("Take a BACKUP first".to_string()));
+
+        let response = CheckpointResponse {
+            checkpoint_id: "test".to_string(),
+            answers,
+            guidance_acknowledged: false,
+            responded_at: "2024-01-01T00:00:00Z".to_string(),
+            session_id: "session-1".to_string(),
+        };
+
+        let validation = CheckpointValidator::validate(&checkpoint, &response);
+        assert!(!validation.is_valid);
+        assert_eq!(
+            validation.question_results["plan"].error_message.as_deref(),
+            Some("Answer must contain: rollback")
+        );
+    }
+
+    #[test]
+    fn test_checkpoint_validator_pattern() {
+        let checkpoint = TriggeredCheckpoint {
+            checkpoint_type: CheckpointType::Interactive,
+            priority: 500,
+            inject_contexts: vec![],
+            is_sync: true,
+            trigger_data: None,
+            steward_def: None,
+            questions: vec![
+                CheckpointQuestion::text("ticket", "Which ticket?")
+                    .with_validation(AnswerValidation {
+                        pattern: Some(r"^[A-Z]+-\d+$".to_string()),
+                        min_length: None,
+                        max_length: None,
+                        must_contain: vec![],
+                        must_not_contain: vec![],
+                        custom_validator: None,
+                    }),
+            ],
+            guidance: None,
+            mode: CheckpointMode::Blocking,
+        };
+
+        let respond = |text: &str| {
+            let mut answers = HashMap::new();
+            answers.insert("ticket".to_string(), AnswerValue::Text(text.to_string()));
+            CheckpointResponse {
+                checkpoint_id: "test".to_string(),
+                answers,
+                guidance_acknowledged: false,
+                responded_at: "2024-01-01T00:00:00Z".to_string(),
+                session_id: "session-1".to_string(),
+            }
+        };
+
+        assert!(CheckpointValidator::validate(&checkpoint, &respond("CRA-42")).is_valid);
+        assert!(!CheckpointValidator::validate(&checkpoint, &respond("no ticket")).is_valid);
+
+        // The evaluator compiles the pattern once and reuses it
+        let evaluator = CheckpointEvaluator::with_defaults();
+        assert!(evaluator.validate_response(&checkpoint, &respond("CRA-42")).is_valid);
+        assert!(!evaluator.validate_response(&checkpoint, &respond("no ticket")).is_valid);
+        assert_eq!(evaluator.answer_patterns.len(), 1);
+
+        // An edited pattern gets its own entry
+        let mut edited = checkpoint.clone();
+        edited.questions[0].validation.as_mut().unwrap().pattern = Some(r"^\d+$".to_string());
+        assert!(evaluator.validate_response(&edited, &respond("42")).is_valid);
+        assert!(!evaluator.validate_response(&edited, &respond("CRA-42")).is_valid);
+        assert!(evaluator.validate_response(&checkpoint, &respond("CRA-42")).is_valid);
+        assert_eq!(evaluator.answer_patterns.len(), 2);
+
+        // Past the bound, patterns still apply but are not stored
+        let cache = AnswerPatternCache::new();
+        for i in 0..AnswerPatternCache::MAX_PATTERNS + 10 {
+            assert_eq!(cache.is_match(&format!("^{}$", i), &i.to_string()), Some(true));
+        }
+        assert_eq!(cache.len(), AnswerPatternCache::MAX_PATTERNS);
+        assert_eq!(cache.is_match("(", "x"), None);
+    }
+
+    #[test]
+    fn test_checkpoint_validator_json_answers() {
+        let mut question = CheckpointQuestion::text("plan", "Describe the plan");
+        question.response_type = ResponseType::Json {
+            schema: Some(serde_json::json!({
+                "type": "object",
+                "required": ["steps"]
+            })),
+        };
+        let checkpoint = TriggeredCheckpoint {
+            checkpoint_type: CheckpointType::Interactive,
+            priority: 500,
+            inject_contexts: vec![],
+            is_sync: true,
+            trigger_data: None,
+            steward_def: None,
+            questions: vec![question],
+            guidance: None,
+            mode: CheckpointMode::Blocking,
+        };
+
+        let respond = |answer: AnswerValue| {
+            let mut answers = HashMap::new();
+            answers.insert("plan".to_string(), answer);
+            CheckpointResponse {
+                checkpoint_id: "test".to_string(),
+                answers,
+                guidance_acknowledged: false,
+                responded_at: "2024-01-01T00:00:00Z".to_string(),
+                session_id: "session-1".to_string(),
+            }
+        };
+
+        // Schemas are not enforced: any JSON answer passes a Json question
+        let conforming = respond(AnswerValue::Json(serde_json::json!({"steps": ["review"]})));
+        assert!(CheckpointValidator::validate(&checkpoint, &conforming).is_valid);
+        let other = respond(AnswerValue::Json(serde_json::json!({"summary": "none"})));
+        assert!(CheckpointValidator::validate(&checkpoint, &other).is_valid);
+
+        // Only the answer type is checked
+        let text = respond(AnswerValue::Text("steps".to_string()));
+        assert!(!CheckpointValidator::validate(&checkpoint, &text).is_valid);
+    }
+
     #[test]
     fn test_steward_checkpoint_evaluation() {
         let checkpoint_def = StewardCheckpointDef::new(
@@ -40,7 +40,7 @@ pub use checkpoint::{
     // Guidance
     GuidanceBlock, GuidanceFormat,
     // Response validation
-    CheckpointResponse, AnswerValue, CheckpointValidator,
+    CheckpointResponse, AnswerValue, CheckpointValidator, AnswerPatternCache,
     CheckpointValidation, QuestionValidationResult, CheckpointAction,
     // Config types
     SessionStartConfig, SessionEndConfig, KeywordMatchConfig,
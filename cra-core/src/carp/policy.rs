@@ -9,7 +9,7 @@
 //! If no policy matches, the default behavior is to allow the action.
 
 use std::collections::HashMap;
-use std::time::{Duration, Instant};
+use std::time::Instant;
 
 use serde::{Deserialize, Serialize};
 
@@ -48,23 +48,182 @@ impl PolicyResult {
 #[derive(Debug)]
 pub struct PolicyEvaluator {
     /// Policies grouped by type
-    policies: Vec<AtlasPolicy>,
+    policies: Vec<CompiledPolicy>,
 
-    /// Rate limit state (action_id -> (count, window_start))
-    rate_limit_state: HashMap<String, RateLimitState>,
+    /// Rate limit state, sharded by policy_id then action_id
+    ///
+    /// Nesting the maps lets a check look its counter up by the borrowed
+    /// IDs, instead of formatting a "policy:action" key on every call.
+    rate_limit_state: HashMap<String, HashMap<String, RateLimitState>>,
+
+    /// Policy decisions by action_id, dropped whenever the policies change
+    ///
+    /// Holds at most `MAX_CACHED_DECISIONS` entries, since action IDs come
+    /// from callers and need not name a loaded action.
+    decisions: HashMap<String, CachedDecision>,
 }
 
+/// Most action decisions `PolicyEvaluator` remembers at once
+///
+/// Once full, decisions for further action IDs are worked out on every
+/// evaluation instead of being cached.
+const MAX_CACHED_DECISIONS: usize = 4096;
+
+/// The counter-independent part of a policy decision for one action
+///
+/// Deny and approval outcomes, and which rate limits apply, depend only on
+/// the policy set, so they are worked out once per action. Only the rate
+/// limit counters are consulted on later evaluations.
 #[derive(Debug, Clone)]
+enum CachedDecision {
+    /// Deny or approval, returned as is
+    Final(PolicyResult),
+    /// Check these rate limit policies (indices into `policies`) in order,
+    /// then return `otherwise`
+    Counted {
+        rate_limits: Vec<usize>,
+        otherwise: PolicyResult,
+    },
+}
+
+impl CachedDecision {
+    /// Walk the policies in evaluation order for one action
+    fn decide(policies: &[CompiledPolicy], action_id: &str) -> Self {
+        let matching = |policy_type: PolicyType| {
+            policies
+                .iter()
+                .enumerate()
+                .filter(move |(_, p)| p.policy.policy_type == policy_type && p.matches(action_id))
+        };
+
+        // Phase 1: Check deny policies
+        if let Some((_, compiled)) = matching(PolicyType::Deny).next() {
+            let policy = &compiled.policy;
+            return CachedDecision::Final(PolicyResult::Deny {
+                policy_id: policy.policy_id.clone(),
+                reason: policy.reason.clone().unwrap_or_else(|| "Denied by policy".to_string()),
+            });
+        }
+
+        // Phase 2: Check approval policies
+        if let Some((_, compiled)) = matching(PolicyType::RequiresApproval).next() {
+            return CachedDecision::Final(PolicyResult::RequiresApproval {
+                policy_id: compiled.policy.policy_id.clone(),
+            });
+        }
+
+        // Phase 3: Collect rate limit policies, checked on every evaluation.
+        // One without usable limits never throttles, so it is left out
+        let rate_limits = matching(PolicyType::RateLimit)
+            .filter(|(_, p)| p.rate_limit.is_some())
+            .map(|(idx, _)| idx)
+            .collect();
+
+        // Phase 4: Check allow policies (explicit allow)
+        // Default: no matching policy means allow
+        let otherwise = if matching(PolicyType::Allow).next().is_some() {
+            PolicyResult::Allow
+        } else {
+            PolicyResult::NoMatch
+        };
+
+        CachedDecision::Counted { rate_limits, otherwise }
+    }
+}
+
+/// Per-key token bucket
+///
+/// A key may spend up to `max_calls` tokens, which are earned back
+/// continuously at `max_calls` per `window_seconds`. Only the spent amount
+/// and the last refill are stored; the limits themselves are read from the
+/// owning policy, so each tracked key stays two words wide.
+#[derive(Debug, Clone, Copy)]
 struct RateLimitState {
-    count: u64,
-    window_start: Instant,
+    /// Tokens spent and not yet refilled, at most `max_calls`
+    spent: f64,
+    last_refill: Instant,
+}
+
+/// An action pattern parsed once when its policy is added
+///
+/// Equivalent to [`pattern_matches`] on the source string, without
+/// re-inspecting the pattern text for every action evaluated.
+#[derive(Debug, Clone, PartialEq, Eq)]
+enum ActionPattern {
+    /// "*"
+    Any,
+    /// "ticket.*" stored as "ticket."
+    Prefix(String),
+    /// "*.delete" stored as ".delete"
+    Suffix(String),
+    /// "ticket.get"
+    Exact(String),
+}
+
+impl ActionPattern {
+    fn compile(pattern: &str) -> Self {
+        if pattern == "*" {
+            ActionPattern::Any
+        } else if pattern.ends_with(".*") {
+            ActionPattern::Prefix(pattern[..pattern.len() - 1].to_string())
+        } else if pattern.starts_with("*.") {
+            ActionPattern::Suffix(pattern[1..].to_string())
+        } else {
+            ActionPattern::Exact(pattern.to_string())
+        }
+    }
+
+    fn matches(&self, action_id: &str) -> bool {
+        match self {
+            ActionPattern::Any => true,
+            ActionPattern::Prefix(prefix) => action_id.starts_with(prefix.as_str()),
+            ActionPattern::Suffix(suffix) => action_id.ends_with(suffix.as_str()),
+            ActionPattern::Exact(exact) => exact == action_id,
+        }
+    }
+}
+
+/// A policy together with its compiled action patterns
+#[derive(Debug, Clone)]
+struct CompiledPolicy {
+    policy: AtlasPolicy,
+    patterns: Vec<ActionPattern>,
+    /// Rate limit parameters, read from `policy.parameters` once
+    rate_limit: Option<RateLimit>,
+}
+
+/// Normalized `max_calls` / `window_seconds` of a rate limit policy
+#[derive(Debug, Clone, Copy)]
+struct RateLimit {
     max_calls: u64,
     window_seconds: u64,
 }
 
-/// Check if an action matches any of the policy patterns
-fn matches_action(patterns: &[String], action_id: &str) -> bool {
-    patterns.iter().any(|pattern| pattern_matches(pattern, action_id))
+impl RateLimit {
+    /// Read the limits from policy parameters, if both are present
+    fn from_policy(policy: &AtlasPolicy) -> Option<Self> {
+        let params = policy.parameters.as_ref()?;
+        Some(Self {
+            max_calls: params.get("max_calls")?.as_u64()?,
+            window_seconds: params.get("window_seconds")?.as_u64()?,
+        })
+    }
+}
+
+impl CompiledPolicy {
+    fn new(policy: AtlasPolicy) -> Self {
+        let patterns = policy.actions.iter().map(|p| ActionPattern::compile(p)).collect();
+        let rate_limit = match policy.policy_type {
+            PolicyType::RateLimit => RateLimit::from_policy(&policy),
+            _ => None,
+        };
+        Self { policy, patterns, rate_limit }
+    }
+
+    /// Check if an action matches any of the policy patterns
+    fn matches(&self, action_id: &str) -> bool {
+        self.patterns.iter().any(|pattern| pattern.matches(action_id))
+    }
 }
 
 /// Match a pattern against an action ID
@@ -94,24 +253,88 @@ fn pattern_matches(pattern: &str, action_id: &str) -> bool {
     false
 }
 
+/// Check and count one call against a rate limit policy
+fn check_rate_limit(
+    rate_limit_state: &mut HashMap<String, HashMap<String, RateLimitState>>,
+    action_id: &str,
+    compiled: &CompiledPolicy,
+    now: Instant,
+) -> Option<PolicyResult> {
+    let RateLimit { max_calls, window_seconds } = compiled.rate_limit?;
+    let policy = &compiled.policy;
+
+    // IDs are only copied the first time a policy or action is counted
+    let shard = get_or_insert_with(rate_limit_state, &policy.policy_id, HashMap::new);
+    let state = get_or_insert_with(shard, action_id, || RateLimitState {
+        spent: 0.0,
+        last_refill: now,
+    });
+
+    // Earn back tokens for the time since the last check
+    let capacity = max_calls as f64;
+    let refill_per_sec = if window_seconds == 0 {
+        f64::INFINITY
+    } else {
+        capacity / window_seconds as f64
+    };
+    let elapsed = now.saturating_duration_since(state.last_refill).as_secs_f64();
+    if elapsed > 0.0 {
+        state.spent = (state.spent - elapsed * refill_per_sec).max(0.0);
+        state.last_refill = now;
+    }
+
+    // Check if limit exceeded
+    if state.spent + 1.0 > capacity {
+        let retry_after = if refill_per_sec > 0.0 {
+            ((state.spent + 1.0 - capacity) / refill_per_sec).ceil() as u64
+        } else {
+            window_seconds
+        };
+        return Some(PolicyResult::RateLimitExceeded {
+            policy_id: policy.policy_id.clone(),
+            retry_after,
+        });
+    }
+
+    // Take a token
+    state.spent += 1.0;
+
+    None
+}
+
+/// Look up `key` by reference, inserting `default()` only when it is missing
+fn get_or_insert_with<'a, V>(
+    map: &'a mut HashMap<String, V>,
+    key: &str,
+    default: impl FnOnce() -> V,
+) -> &'a mut V {
+    if !map.contains_key(key) {
+        map.insert(key.to_string(), default());
+    }
+    map.get_mut(key).expect("key was just inserted")
+}
+
 impl PolicyEvaluator {
     /// Create a new policy evaluator
     pub fn new() -> Self {
         Self {
             policies: Vec::new(),
             rate_limit_state: HashMap::new(),
+            decisions: HashMap::new(),
         }
     }
 
     /// Add policies from an atlas
     pub fn add_policies(&mut self, policies: Vec<AtlasPolicy>) {
-        self.policies.extend(policies);
+        self.policies.extend(policies.into_iter().map(CompiledPolicy::new));
+        self.decisions.clear();
     }
 
     /// Clear all policies
     pub fn clear_policies(&mut self) {
         self.policies.clear();
         self.rate_limit_state.clear();
+        self.decisions.clear();
     }
 
     /// Evaluate all policies for a given action
@@ -119,50 +342,32 @@ impl PolicyEvaluator {
     /// Returns the first matching result in priority order:
     /// deny -> requires_approval -> rate_limit -> allow -> no_match
     pub fn evaluate(&mut self, action_id: &str) -> PolicyResult {
-        // Phase 1: Check deny policies
-        for policy in self.policies.iter().filter(|p| p.policy_type == PolicyType::Deny) {
-            if matches_action(&policy.actions, action_id) {
-                return PolicyResult::Deny {
-                    policy_id: policy.policy_id.clone(),
-                    reason: policy.reason.clone().unwrap_or_else(|| "Denied by policy".to_string()),
-                };
+        // Borrow the policies, counters and decisions separately so the
+        // cached decision is used in place, against a single clock reading
+        let Self { policies, rate_limit_state, decisions } = self;
+        let uncached;
+        let decision: &CachedDecision =
+            if decisions.len() < MAX_CACHED_DECISIONS || decisions.contains_key(action_id) {
+                get_or_insert_with(decisions, action_id, || {
+                    CachedDecision::decide(policies, action_id)
+                })
+            } else {
+                uncached = CachedDecision::decide(policies, action_id);
+                &uncached
+            };
+
+        match decision {
+            CachedDecision::Final(result) => result.clone(),
+            CachedDecision::Counted { rate_limits, otherwise } => {
+                let now = Instant::now();
+                for &idx in rate_limits.iter() {
+                    if let Some(result) = check_rate_limit(rate_limit_state, action_id, &policies[idx], now) {
+                        return result;
+                    }
+                }
+                otherwise.clone()
             }
         }
-
-        // Phase 2: Check approval policies
-        for policy in self.policies.iter().filter(|p| p.policy_type == PolicyType::RequiresApproval) {
-            if matches_action(&policy.actions, action_id) {
-                return PolicyResult::RequiresApproval {
-                    policy_id: policy.policy_id.clone(),
-                };
-            }
-        }
-
-        // Phase 3: Check rate limit policies
-        // Collect matching rate limit policies first to avoid borrow issues
-        let rate_limit_matches: Vec<_> = self
-            .policies
-            .iter()
-            .filter(|p| p.policy_type == PolicyType::RateLimit)
-            .filter(|p| matches_action(&p.actions, action_id))
-            .cloned()
-            .collect();
-
-        for policy in rate_limit_matches {
-            if let Some(result) = self.check_rate_limit(action_id, &policy) {
-                return result;
-            }
-        }
-
-        // Phase 4: Check allow policies (explicit allow)
-        for policy in self.policies.iter().filter(|p| p.policy_type == PolicyType::Allow) {
-            if matches_action(&policy.actions, action_id) {
-                return PolicyResult::Allow;
-            }
-        }
-
-        // Default: no matching policy means allow
-        PolicyResult::NoMatch
     }
 
     /// Match a pattern against an action ID
@@ -176,57 +381,20 @@ impl PolicyEvaluator {
         pattern_matches(pattern, action_id)
     }
 
-    /// Check rate limit for an action
-    fn check_rate_limit(&mut self, action_id: &str, policy: &AtlasPolicy) -> Option<PolicyResult> {
-        let params = policy.parameters.as_ref()?;
-        let max_calls = params.get("max_calls")?.as_u64()?;
-        let window_seconds = params.get("window_seconds")?.as_u64()?;
-
-        let now = Instant::now();
-        let key = format!("{}:{}", policy.policy_id, action_id);
-
-        let state = self.rate_limit_state.entry(key.clone()).or_insert_with(|| {
-            RateLimitState {
-                count: 0,
-                window_start: now,
-                max_calls,
-                window_seconds,
-            }
-        });
-
-        // Check if window has expired
-        let window = Duration::from_secs(state.window_seconds);
-        if now.duration_since(state.window_start) > window {
-            // Reset window
-            state.count = 0;
-            state.window_start = now;
-        }
-
-        // Check if limit exceeded
-        if state.count >= state.max_calls {
-            let elapsed = now.duration_since(state.window_start);
-            let retry_after = state.window_seconds.saturating_sub(elapsed.as_secs());
-            return Some(PolicyResult::RateLimitExceeded {
-                policy_id: policy.policy_id.clone(),
-                retry_after,
-            });
-        }
-
-        // Increment counter
-        state.count += 1;
-
-        None
-    }
-
     /// Reset rate limit state for testing or session end
     pub fn reset_rate_limits(&mut self) {
         self.rate_limit_state.clear();
     }
 
     /// Get the current count for a rate-limited action
+    ///
+    /// The number of tokens spent and not yet refilled, as of the last
+    /// check, counting a partly refilled token as spent.
     pub fn get_rate_limit_count(&self, policy_id: &str, action_id: &str) -> Option<u64> {
-        let key = format!("{}:{}", policy_id, action_id);
-        self.rate_limit_state.get(&key).map(|s| s.count)
+        self.rate_limit_state
+            .get(policy_id)
+            .and_then(|shard| shard.get(action_id))
+            .map(|s| s.spent.ceil() as u64)
     }
 }
 
@@ -279,6 +447,7 @@ impl PolicyEvaluation {
 mod tests {
     use super::*;
     use serde_json::json;
+    use std::time::Duration;
 
     fn create_test_policies() -> Vec<AtlasPolicy> {
         vec![
@@ -346,6 +515,66 @@ mod tests {
         // 6th call should be rate limited
         let result = evaluator.evaluate("ticket.get");
         assert!(matches!(result, PolicyResult::RateLimitExceeded { .. }));
+
+        // Counters are kept per policy and action
+        assert_eq!(evaluator.get_rate_limit_count("rate-limit-api", "ticket.get"), Some(5));
+        assert_eq!(evaluator.get_rate_limit_count("rate-limit-api", "ticket.list"), None);
+        assert!(!matches!(evaluator.evaluate("ticket.list"), PolicyResult::RateLimitExceeded { .. }));
+        assert_eq!(evaluator.get_rate_limit_count("rate-limit-api", "ticket.list"), Some(1));
+    }
+
+    #[test]
+    fn test_rate_limit_refills_over_time() {
+        let compiled = CompiledPolicy::new(AtlasPolicy {
+            policy_id: "rate-limit-bucket".to_string(),
+            policy_type: PolicyType::RateLimit,
+            actions: vec!["*".to_string()],
+            reason: None,
+            parameters: Some(json!({ "max_calls": 3, "window_seconds": 60 })),
+        });
+        let mut state = HashMap::new();
+        let start = Instant::now();
+
+        // A full bucket allows a burst of 3
+        for _ in 0..3 {
+            assert!(check_rate_limit(&mut state, "ticket.get", &compiled, start).is_none());
+        }
+
+        // The next token is earned back 20s later
+        assert_eq!(
+            check_rate_limit(&mut state, "ticket.get", &compiled, start),
+            Some(PolicyResult::RateLimitExceeded {
+                policy_id: "rate-limit-bucket".to_string(),
+                retry_after: 20,
+            })
+        );
+        let later = start + Duration::from_secs(20);
+        assert!(check_rate_limit(&mut state, "ticket.get", &compiled, later).is_none());
+        assert!(check_rate_limit(&mut state, "ticket.get", &compiled, later).is_some());
+
+        // A full window refills the bucket, but never beyond max_calls
+        let idle = later + Duration::from_secs(600);
+        for _ in 0..3 {
+            assert!(check_rate_limit(&mut state, "ticket.get", &compiled, idle).is_none());
+        }
+        assert!(check_rate_limit(&mut state, "ticket.get", &compiled, idle).is_some());
+    }
+
+    #[test]
+    fn test_rate_limit_without_parameters_never_throttles() {
+        let mut evaluator = PolicyEvaluator::new();
+        evaluator.add_policies(vec![AtlasPolicy {
+            policy_id: "rate-limit-incomplete".to_string(),
+            policy_type: PolicyType::RateLimit,
+            actions: vec!["*".to_string()],
+            reason: None,
+            parameters: Some(json!({ "max_calls": 1 })),
+        }]);
+
+        for _ in 0..3 {
+            assert!(matches!(evaluator.evaluate("ticket.get"), PolicyResult::NoMatch));
+        }
+        assert_eq!(evaluator.get_rate_limit_count("rate-limit-incomplete", "ticket.get"), None);
     }
 
     #[test]
@@ -370,6 +599,25 @@ mod tests {
         assert!(!evaluator.pattern_matches("ticket.get", "ticket.list"));
     }
 
+    #[test]
+    fn test_compiled_patterns_match_string_patterns() {
+        let patterns = ["*", "ticket.*", "*.delete", "ticket.get", ".*", "*.", "*.*", "ticketget"];
+        let actions = ["ticket.get", "ticket.delete", "user.delete", "ticketget", ".x", "x.", "ticket", "*.delete"];
+
+        for pattern in patterns {
+            let compiled = ActionPattern::compile(pattern);
+            for action in actions {
+                assert_eq!(
+                    compiled.matches(action),
+                    pattern_matches(pattern, action),
+                    "pattern {:?} vs action {:?}",
+                    pattern,
+                    action
+                );
+            }
+        }
+    }
+
     #[test]
     fn test_no_matching_policy() {
         let mut evaluator = PolicyEvaluator::new();
@@ -380,6 +628,48 @@ mod tests {
         assert!(matches!(result, PolicyResult::NoMatch));
     }
 
+    #[test]
+    fn test_cached_decision_follows_policy_changes() {
+        let mut evaluator = PolicyEvaluator::new();
+        evaluator.add_policies(create_test_policies());
+        assert!(matches!(evaluator.evaluate("report.export"), PolicyResult::NoMatch));
+
+        // Adding a policy drops the decision cached for the action above
+        evaluator.add_policies(vec![AtlasPolicy {
+            policy_id: "deny-export".to_string(),
+            policy_type: PolicyType::Deny,
+            actions: vec!["report.export".to_string()],
+            reason: None,
+            parameters: None,
+        }]);
+        assert_eq!(
+            evaluator.evaluate("report.export"),
+            PolicyResult::Deny {
+                policy_id: "deny-export".to_string(),
+                reason: "Denied by policy".to_string(),
+            }
+        );
+
+        evaluator.clear_policies();
+        assert!(matches!(evaluator.evaluate("report.export"), PolicyResult::NoMatch));
+    }
+
+    #[test]
+    fn test_decision_cache_is_bounded() {
+        let mut evaluator = PolicyEvaluator::new();
+        evaluator.add_policies(create_test_policies());
+
+        for i in 0..MAX_CACHED_DECISIONS + 100 {
+            evaluator.evaluate(&format!("unknown.action{}", i));
+        }
+        assert_eq!(evaluator.decisions.len(), MAX_CACHED_DECISIONS);
+
+        // Actions past the bound are still decided correctly
+        assert!(matches!(evaluator.evaluate("ticket.delete"), PolicyResult::Deny { .. }));
+        assert!(matches!(evaluator.evaluate("payment.process"), PolicyResult::RequiresApproval { .. }));
+        assert_eq!(evaluator.decisions.len(), MAX_CACHED_DECISIONS);
+    }
+
     #[test]
     fn test_policy_priority() {
         let mut evaluator = PolicyEvaluator::new();
@@ -163,6 +163,16 @@ impl RiskTier {
         }
     }
 
+    /// Get the tier's lowercase name, as used in atlas conditions
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            RiskTier::Low => "low",
+            RiskTier::Medium => "medium",
+            RiskTier::High => "high",
+            RiskTier::Critical => "critical",
+        }
+    }
+
     /// Check if this tier requires approval
     pub fn requires_approval(&self) -> bool {
         matches!(self, RiskTier::High | RiskTier::Critical)
@@ -177,12 +187,7 @@ impl Default for RiskTier {
 
 impl std::fmt::Display for RiskTier {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
-        match self {
-            RiskTier::Low => write!(f, "low"),
-            RiskTier::Medium => write!(f, "medium"),
-            RiskTier::High => write!(f, "high"),
-            RiskTier::Critical => write!(f, "critical"),
-        }
+        f.write_str(self.as_str())
     }
 }
 
@@ -256,5 +261,7 @@ mod tests {
         assert_eq!(RiskTier::Critical.level(), 4);
         assert!(RiskTier::High.requires_approval());
         assert!(!RiskTier::Low.requires_approval());
+        assert_eq!(RiskTier::Medium.as_str(), "medium");
+        assert_eq!(RiskTier::Critical.to_string(), "critical");
     }
 }
@@ -1,5 +1,7 @@
 //! CARP Resolution types
 
+use std::fmt::Write;
+
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
@@ -84,29 +86,62 @@ impl CARPResolution {
             return String::new();
         }
 
-        let mut output = String::new();
-        output.push_str("# Context for Your Task\n\n");
-        output.push_str("The following context has been automatically selected based on your goal.\n\n");
-
         // Sort by priority (higher first)
-        let mut blocks = self.context_blocks.clone();
+        let mut blocks: Vec<&ContextBlock> = self.context_blocks.iter().collect();
         blocks.sort_by(|a, b| b.priority.cmp(&a.priority));
 
+        // Size the buffer up front so the whole document is assembled in a
+        // single allocation instead of one temporary String per block.
+        let capacity = 160
+            + blocks
+                .iter()
+                .map(|b| b.name.len() + b.content.len() + 16)
+                .sum::<usize>();
+        let mut output = String::with_capacity(capacity);
+        output.push_str("# Context for Your Task\n\n");
+        output.push_str("The following context has been automatically selected based on your goal.\n\n");
+
         for block in &blocks {
-            output.push_str(&format!("## {}\n\n", block.name));
+            let _ = write!(output, "## {}\n\n", block.name);
             output.push_str(&block.content);
             output.push_str("\n\n---\n\n");
         }
 
         // Add metadata footer
-        output.push_str(&format!(
-            "_Context injected by CRA. {} block(s) from {} atlas(es)._\n",
+        let _ = writeln!(
+            output,
+            "_Context injected by CRA. {} block(s) from {} atlas(es)._",
             self.context_blocks.len(),
             self.context_blocks.iter()
                 .map(|b| b.source_atlas.as_str())
                 .collect::<std::collections::HashSet<_>>()
                 .len()
-        ));
+        );
+
+        output
+    }
+
+    /// Render context blocks without the surrounding prose
+    ///
+    /// Same blocks and ordering as [`render_context`](Self::render_context),
+    /// but drops the preamble, separators and footer. Use this when the
+    /// context is spliced into a prompt that already frames it and every
+    /// token counts.
+    pub fn render_context_compact(&self) -> String {
+        let mut blocks: Vec<&ContextBlock> = self.context_blocks.iter().collect();
+        blocks.sort_by(|a, b| b.priority.cmp(&a.priority));
+
+        let capacity = blocks
+            .iter()
+            .map(|b| b.name.len() + b.content.len() + 8)
+            .sum::<usize>();
+        let mut output = String::with_capacity(capacity);
+
+        for block in &blocks {
+            let _ = write!(output, "## {}\n", block.name);
+            output.push_str(block.content.trim_end());
+            output.push_str("\n\n");
+        }
 
         output
     }
@@ -123,7 +158,7 @@ impl CARPResolutionBuilder {
         Self {
             resolution: CARPResolution {
                 carp_version: VERSION.to_string(),
-                trace_id: uuid::Uuid::new_v4().to_string(),
+                trace_id: crate::trace::new_id(),
                 session_id,
                 decision: Decision::Allow,
                 allowed_actions: vec![],
@@ -486,4 +521,22 @@ mod tests {
             Some("Deletion not allowed")
         );
     }
+
+    #[test]
+    fn test_render_context_compact() {
+        let resolution = CARPResolution::builder("session-1".to_string())
+            .add_context_block(
+                ContextBlock::new("low".to_string(), "Low".to_string(), "low body\n".to_string())
+                    .with_priority(1),
+            )
+            .add_context_block(
+                ContextBlock::new("high".to_string(), "High".to_string(), "high body".to_string())
+                    .with_priority(10),
+            )
+            .build();
+
+        let compact = resolution.render_context_compact();
+        assert_eq!(compact, "## High\nhigh body\n\n## Low\nlow body\n\n");
+        assert!(compact.len() < resolution.render_context().len());
+    }
 }
@@ -11,19 +11,18 @@ use std::collections::HashMap;
 
 use chrono::Utc;
 use serde_json::Value;
-use uuid::Uuid;
 
-use crate::atlas::{AtlasAction, AtlasManifest};
+use crate::atlas::AtlasManifest;
 use crate::context::{ContextRegistry, ContextMatcher, LoadedContext, ContextSource};
 use crate::error::{CRAError, Result};
-use crate::trace::{DeferredConfig, EventType, TraceCollector, TRACEEvent};
+use crate::trace::{new_id, DeferredConfig, EventType, TraceCollector, TRACEEvent};
 
 use super::{
     AllowedAction, CARPRequest, CARPResolution, ContextBlock, Constraint, Decision, DeniedAction,
     PolicyEvaluator, PolicyResult,
     // Checkpoint types
     CheckpointEvaluator, CheckpointConfig, CheckpointResponse,
-    CheckpointValidator, CheckpointValidation, TriggeredCheckpoint,
+    CheckpointValidation, TriggeredCheckpoint,
     SessionCheckpointState, TriggerData,
 };
 
@@ -84,6 +83,9 @@ pub struct Resolver {
     /// Loaded atlases by ID
     atlases: HashMap<String, AtlasManifest>,
 
+    /// Action ID -> (atlas ID, index into that atlas's actions)
+    action_index: HashMap<String, (String, usize)>,
+
     /// Active sessions by ID
     sessions: HashMap<String, Session>,
 
@@ -120,6 +122,7 @@ impl Resolver {
     pub fn new() -> Self {
         Self {
             atlases: HashMap::new(),
+            action_index: HashMap::new(),
             sessions: HashMap::new(),
             checkpoint_states: HashMap::new(),
             pending_checkpoints: HashMap::new(),
@@ -242,6 +245,7 @@ impl Resolver {
         // For now, context_packs with files are not loaded automatically
         // In production, you'd use ContextRegistry::load_from_pack() with a file loader
 
+        Self::index_actions(&mut self.action_index, &atlas);
         self.atlases.insert(atlas_id.clone(), atlas);
         Ok(atlas_id)
     }
@@ -255,10 +259,24 @@ impl Resolver {
         }
 
         self.atlases.remove(atlas_id);
+        self.action_index.retain(|_, (owner, _)| owner != atlas_id);
+        // Another loaded atlas may define an action the removed one shadowed
+        for atlas in self.atlases.values() {
+            Self::index_actions(&mut self.action_index, atlas);
+        }
         // Note: policies remain - in production you'd want to rebuild
         Ok(())
     }
 
+    /// Add an atlas's actions to the action index, keeping existing entries
+    fn index_actions(index: &mut HashMap<String, (String, usize)>, atlas: &AtlasManifest) {
+        for (i, action) in atlas.actions.iter().enumerate() {
+            index
+                .entry(action.action_id.clone())
+                .or_insert_with(|| (atlas.atlas_id.clone(), i));
+        }
+    }
+
     /// Get a loaded atlas by ID
     pub fn get_atlas(&self, atlas_id: &str) -> Option<&AtlasManifest> {
         self.atlases.get(atlas_id)
@@ -273,7 +291,7 @@ impl Resolver {
     ///
     /// Returns the session ID and any triggered session start checkpoints.
     pub fn create_session(&mut self, agent_id: &str, goal: &str) -> Result<String> {
-        let session_id = Uuid::new_v4().to_string();
+        let session_id = new_id();
 
         if self.sessions.contains_key(&session_id) {
             return Err(CRAError::SessionAlreadyExists {
@@ -425,7 +443,7 @@ impl Resolver {
         }
 
         // Validate the response
-        let validation = CheckpointValidator::validate(checkpoint, response);
+        let validation = self.checkpoint_evaluator.validate_response(checkpoint, response);
 
         // Emit validation events
         for (question_id, result) in &validation.question_results {
@@ -642,7 +660,7 @@ impl Resolver {
         }
 
         // Generate trace ID for this resolution
-        let trace_id = Uuid::new_v4().to_string();
+        let trace_id = new_id();
 
         // Emit carp.request.received event
         self.trace_collector.emit(
@@ -656,30 +674,28 @@ impl Resolver {
             }),
         )?;
 
-        // Collect all actions from loaded atlases
-        let all_actions: Vec<&AtlasAction> = self
-            .atlases
-            .values()
-            .flat_map(|a| a.actions.iter())
-            .collect();
-
-        let mut allowed_actions = Vec::new();
+        // Most actions are allowed, so only that list is sized up front for
+        // every action; denials are rarer and grow as needed. Both are
+        // filled straight from the atlases without first collecting the
+        // actions into a list of their own
+        let action_count: usize = self.atlases.values().map(|a| a.actions.len()).sum();
+        let mut allowed_actions = Vec::with_capacity(action_count);
         let mut denied_actions = Vec::new();
         let mut constraints = Vec::new();
+        // policy.evaluated events, emitted together once every action is evaluated
+        let mut policy_events = Vec::with_capacity(action_count);
 
         // Evaluate each action against policies
-        for action in all_actions {
+        for action in self.atlases.values().flat_map(|a| a.actions.iter()) {
             let result = self.policy_evaluator.evaluate(&action.action_id);
 
-            // Emit policy.evaluated event
-            self.trace_collector.emit(
-                &request.session_id,
+            policy_events.push((
                 EventType::PolicyEvaluated,
                 serde_json::json!({
                     "action_id": action.action_id,
                     "result": format!("{:?}", result),
                 }),
-            )?;
+            ));
 
             match result {
                 PolicyResult::Deny { policy_id, reason } => {
@@ -726,6 +742,9 @@ impl Resolver {
             }
         }
 
+        // Emit policy.evaluated events
+        self.trace_collector.emit_batch(&request.session_id, policy_events)?;
+
         // Determine overall decision
         let decision = if denied_actions.is_empty() && !allowed_actions.is_empty() {
             Decision::Allow
@@ -741,18 +760,18 @@ impl Resolver {
         session.resolution_count += 1;
 
         // Query context registry for matching context based on goal
-        let context_hints: Vec<String> = request.context_hints.clone().unwrap_or_default();
+        let context_hints: &[String] = request.context_hints.as_deref().unwrap_or_default();
         let matching_contexts = self.context_registry.query(&request.goal, None);
 
         // Convert matching context to ContextBlocks and emit TRACE events
-        let mut context_blocks: Vec<ContextBlock> = Vec::new();
+        let mut context_blocks: Vec<ContextBlock> = Vec::with_capacity(matching_contexts.len());
         for ctx in matching_contexts {
             // Evaluate conditions with the matcher for fine-grained matching
             let match_result = self.context_matcher.evaluate(
                 ctx.conditions.as_ref(),
                 &request.goal,
                 None, // TODO: Parse risk tier from request if provided
-                &context_hints,
+                context_hints,
                 ctx.priority,
             );
 
@@ -781,10 +800,10 @@ impl Resolver {
         let resolution = CARPResolution::builder(request.session_id.clone())
             .trace_id(trace_id.clone())
             .decision(decision)
-            .allowed_actions(allowed_actions.clone())
-            .denied_actions(denied_actions.clone())
+            .allowed_actions(allowed_actions)
+            .denied_actions(denied_actions)
             .constraints(constraints)
-            .context_blocks(context_blocks.clone())
+            .context_blocks(context_blocks)
             .ttl_seconds(self.default_ttl)
             .build();
 
@@ -795,9 +814,9 @@ impl Resolver {
             serde_json::json!({
                 "resolution_id": trace_id,
                 "decision_type": resolution.decision.to_string(),
-                "allowed_count": allowed_actions.len(),
-                "denied_count": denied_actions.len(),
-                "context_count": context_blocks.len(),
+                "allowed_count": resolution.allowed_actions.len(),
+                "denied_count": resolution.denied_actions.len(),
+                "context_count": resolution.context_blocks.len(),
                 "ttl_seconds": self.default_ttl,
             }),
         )?;
@@ -826,11 +845,8 @@ impl Resolver {
             });
         }
 
-        let execution_id = Uuid::new_v4().to_string();
-
-        // Emit action.requested event
-        self.trace_collector.emit(
-            session_id,
+        let execution_id = new_id();
+        let requested = (
             EventType::ActionRequested,
             serde_json::json!({
                 "action_id": action_id,
@@ -838,48 +854,47 @@ impl Resolver {
                 "execution_id": execution_id,
                 "parameters_hash": hash_value(&parameters),
             }),
-        )?;
+        );
 
         // Re-evaluate policy for this action
         let policy_result = self.policy_evaluator.evaluate(action_id);
 
         if let PolicyResult::Deny { policy_id, reason } = policy_result {
-            // Emit action.denied event
-            self.trace_collector.emit(
-                session_id,
-                EventType::ActionDenied,
-                serde_json::json!({
-                    "action_id": action_id,
-                    "reason": reason,
-                    "policy_id": policy_id,
-                }),
-            )?;
+            // Emit action.requested and action.denied together
+            let denied = serde_json::json!({
+                "action_id": action_id,
+                "reason": reason,
+                "policy_id": policy_id,
+            });
+            self.trace_collector
+                .emit_batch(session_id, [requested, (EventType::ActionDenied, denied)])?;
 
             return Err(CRAError::ActionDenied { policy_id, reason });
         }
 
         // Find the action definition
-        let action = self
-            .atlases
-            .values()
-            .flat_map(|a| a.actions.iter())
-            .find(|a| a.action_id == action_id)
-            .ok_or_else(|| CRAError::ActionNotFound {
+        let Some(action) = self
+            .action_index
+            .get(action_id)
+            .and_then(|(atlas_id, i)| self.atlases.get(atlas_id)?.actions.get(*i))
+        else {
+            let (event_type, payload) = requested;
+            self.trace_collector.emit(session_id, event_type, payload)?;
+            return Err(CRAError::ActionNotFound {
                 action_id: action_id.to_string(),
-            })?;
+            });
+        };
 
         // In a real implementation, you would validate parameters against schema
         // and execute the actual action here. For now, we just record the execution.
 
-        // Emit action.approved event
-        self.trace_collector.emit(
-            session_id,
-            EventType::ActionApproved,
-            serde_json::json!({
-                "action_id": action_id,
-                "resolution_id": resolution_id,
-            }),
-        )?;
+        // Emit action.requested and action.approved together
+        let approved = serde_json::json!({
+            "action_id": action_id,
+            "resolution_id": resolution_id,
+        });
+        self.trace_collector
+            .emit_batch(session_id, [requested, (EventType::ActionApproved, approved)])?;
 
         // Simulate execution
         let start = std::time::Instant::now();
@@ -911,11 +926,35 @@ impl Resolver {
         Ok(result)
     }
 
+    /// Resolve a request and execute one of its actions in a single call
+    ///
+    /// Equivalent to `resolve()` followed by `execute()` with the new
+    /// resolution's trace ID, for callers that would otherwise make two
+    /// round trips (FFI, MCP, HTTP) for every governed action. Denials go
+    /// through `execute()` too, so the TRACE records the same
+    /// `action.requested` / `action.denied` events. Returns the resolution
+    /// alongside the execution result.
+    pub fn resolve_and_execute(
+        &mut self,
+        request: &CARPRequest,
+        action_id: &str,
+        parameters: Value,
+    ) -> Result<(CARPResolution, Value)> {
+        let resolution = self.resolve(request)?;
+        let result = self.execute(&request.session_id, &resolution.trace_id, action_id, parameters)?;
+        Ok((resolution, result))
+    }
+
     /// Get the TRACE for a session
     pub fn get_trace(&self, session_id: &str) -> Result<Vec<TRACEEvent>> {
         self.trace_collector.get_events(session_id)
     }
 
+    /// Export the TRACE for a session as JSONL
+    pub fn export_trace_jsonl(&self, session_id: &str) -> Result<String> {
+        self.trace_collector.export_jsonl(session_id)
+    }
+
     /// Verify the hash chain integrity for a session
     pub fn verify_chain(&self, session_id: &str) -> Result<crate::trace::ChainVerification> {
         self.trace_collector.verify_chain(session_id)
@@ -937,9 +976,9 @@ impl Default for Resolver {
 fn hash_value(value: &Value) -> String {
     use sha2::{Digest, Sha256};
 
-    let canonical = serde_json::to_string(value).unwrap_or_default();
-    let hash = Sha256::digest(canonical.as_bytes());
-    hex::encode(hash)
+    let mut hasher = Sha256::new();
+    let _ = serde_json::to_writer(&mut hasher, value);
+    hex::encode(hasher.finalize())
 }
 
 #[cfg(test)]
@@ -1064,6 +1103,77 @@ mod tests {
             json!({}),
         );
         assert!(result.is_err());
+
+        let event_types: Vec<_> = resolver
+            .get_trace(&session_id)
+            .unwrap()
+            .into_iter()
+            .map(|e| e.event_type)
+            .collect();
+        assert_eq!(
+            &event_types[event_types.len() - 5..],
+            &[
+                EventType::ActionRequested,
+                EventType::ActionApproved,
+                EventType::ActionExecuted,
+                EventType::ActionRequested,
+                EventType::ActionDenied,
+            ]
+        );
+        assert!(resolver.verify_chain(&session_id).unwrap().is_valid);
+    }
+
+    #[test]
+    fn test_execute_after_unload() {
+        let mut resolver = Resolver::new();
+        resolver.load_atlas(create_test_atlas()).unwrap();
+        let session_id = resolver.create_session("test-agent", "Test goal").unwrap();
+
+        resolver.unload_atlas("com.test.resolver").unwrap();
+
+        // Unloading drops the atlas's actions from the lookup index
+        let err = resolver
+            .execute(&session_id, "resolution-1", "test.get", json!({}))
+            .unwrap_err();
+        assert!(matches!(err, CRAError::ActionNotFound { .. }));
+    }
+
+    #[test]
+    fn test_resolve_and_execute() {
+        let mut resolver = Resolver::new();
+        resolver.load_atlas(create_test_atlas()).unwrap();
+
+        let session_id = resolver.create_session("test-agent", "Test goal").unwrap();
+        let request = CARPRequest::new(
+            session_id.clone(),
+            "test-agent".to_string(),
+            "Test goal".to_string(),
+        );
+
+        let (resolution, result) = resolver
+            .resolve_and_execute(&request, "test.get", json!({}))
+            .unwrap();
+        assert!(resolution.is_action_allowed("test.get"));
+        assert_eq!(result["status"], "success");
+
+        // Denied actions are recorded in the TRACE as with execute()
+        let err = resolver
+            .resolve_and_execute(&request, "test.delete", json!({}))
+            .unwrap_err();
+        assert!(matches!(err, CRAError::ActionDenied { .. }));
+
+        let event_types: Vec<_> = resolver
+            .get_trace(&session_id)
+            .unwrap()
+            .into_iter()
+            .map(|e| e.event_type)
+            .collect();
+        assert_eq!(
+            &event_types[event_types.len() - 2..],
+            &[EventType::ActionRequested, EventType::ActionDenied]
+        );
+
+        assert!(resolver.verify_chain(&session_id).unwrap().is_valid);
     }
 
     #[test]
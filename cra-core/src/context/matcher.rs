@@ -116,10 +116,10 @@ impl ContextMatcher {
         // Check risk tier conditions
         if let Some(risk_tiers) = conditions.get("risk_tiers").and_then(|v| v.as_array()) {
             if let Some(request_tier) = risk_tier {
-                let tier_str = request_tier.to_string();
+                let tier_str = request_tier.as_str();
                 for tier in risk_tiers {
                     if let Some(t) = tier.as_str() {
-                        if t.eq_ignore_ascii_case(&tier_str) {
+                        if t.eq_ignore_ascii_case(tier_str) {
                             score.risk_score += 30;
                             matched_any = true;
                         }
@@ -63,15 +63,77 @@ impl LoadedContext {
     }
 
     /// Convert to ContextBlock for resolution
+    ///
+    /// Built as a literal rather than through `ContextBlock::new` and its
+    /// setters, which would allocate default field values only to replace
+    /// them.
     pub fn to_context_block(&self) -> ContextBlock {
-        ContextBlock::new(
-            self.pack_id.clone(),
-            self.pack_id.clone(), // name = pack_id for now
-            self.content.clone(),
-        )
-        .with_priority(self.priority)
-        .with_content_type(self.content_type.clone())
-        .with_source_atlas(self.source.as_string())
+        ContextBlock {
+            block_id: self.pack_id.clone(),
+            name: self.pack_id.clone(), // name = pack_id for now
+            content: self.content.clone(),
+            priority: self.priority,
+            content_type: self.content_type.clone(),
+            source_atlas: self.source.as_string(),
+        }
+    }
+}
+
+/// Pack conditions reduced to lowercase match terms
+///
+/// Built once when a context is added, so queries test the goal against
+/// ready-made terms instead of walking the conditions JSON and lowercasing
+/// every keyword on each call.
+#[derive(Debug, Clone)]
+enum CompiledConditions {
+    /// Matches if the goal contains any of these keywords
+    Keywords(Vec<String>),
+    /// Matches if the goal contains any of these file pattern parts
+    FileParts(Vec<String>),
+    /// No conditions the registry filters on
+    Always,
+}
+
+impl CompiledConditions {
+    fn compile(conditions: Option<&Value>) -> Self {
+        // Simple condition evaluation
+        // TODO: Expand with proper expression language
+        let Some(conditions) = conditions else {
+            return Self::Always;
+        };
+
+        if let Some(keywords) = conditions.get("keywords").and_then(|v| v.as_array()) {
+            return Self::Keywords(
+                keywords
+                    .iter()
+                    .filter_map(|kw| kw.as_str())
+                    .map(|kw| kw.to_lowercase())
+                    .collect(),
+            );
+        }
+
+        if let Some(pattern) = conditions.get("file_pattern").and_then(|v| v.as_str()) {
+            // File pattern matching - check if goal mentions the pattern
+            return Self::FileParts(
+                pattern
+                    .split('/')
+                    .map(|part| part.replace("*", "").replace(".", "").to_lowercase())
+                    .filter(|clean| !clean.is_empty())
+                    .collect(),
+            );
+        }
+
+        // Default: include if no conditions specified
+        Self::Always
+    }
+
+    fn matches(&self, goal_lower: &str) -> bool {
+        match self {
+            Self::Keywords(terms) | Self::FileParts(terms) => {
+                terms.iter().any(|term| goal_lower.contains(term.as_str()))
+            }
+            Self::Always => true,
+        }
     }
 }
 
@@ -89,6 +151,12 @@ pub struct ContextRegistry {
 
     /// Keywords index for semantic matching
     keyword_index: HashMap<String, Vec<usize>>,
+
+    /// Lowercased content, parallel to `contexts`, so queries don't redo it
+    content_lower: Vec<String>,
+
+    /// Compiled conditions, parallel to `contexts`
+    conditions: Vec<CompiledConditions>,
 }
 
 impl ContextRegistry {
@@ -120,6 +188,8 @@ impl ContextRegistry {
                 .push(idx);
         }
 
+        self.content_lower.push(context.content.to_lowercase());
+        self.conditions.push(CompiledConditions::compile(context.conditions.as_ref()));
         self.contexts.push(context);
     }
 
@@ -153,11 +223,8 @@ impl ContextRegistry {
 
     /// Query for matching context based on goal text
     pub fn query(&self, goal: &str, atlas_filter: Option<&str>) -> Vec<&LoadedContext> {
-        let goal_words: Vec<String> = goal
-            .to_lowercase()
-            .split_whitespace()
-            .map(|s| s.to_string())
-            .collect();
+        let goal_lower = goal.to_lowercase();
+        let goal_words: Vec<&str> = goal_lower.split_whitespace().collect();
 
         let mut scored: Vec<(usize, i32)> = Vec::new();
 
@@ -175,10 +242,8 @@ impl ContextRegistry {
             }
 
             // Check conditions (if any)
-            if let Some(conditions) = &context.conditions {
-                if !self.evaluate_conditions(conditions, goal) {
-                    continue;
-                }
+            if !self.conditions[idx].matches(&goal_lower) {
+                continue;
             }
 
             // Calculate match score
@@ -192,9 +257,9 @@ impl ContextRegistry {
             }
 
             // Content matching (lower weight)
-            let content_lower = context.content.to_lowercase();
+            let content_lower = &self.content_lower[idx];
             for word in &goal_words {
-                if content_lower.contains(word) {
+                if content_lower.contains(*word) {
                     score += 2;
                 }
             }
@@ -248,39 +313,6 @@ impl ContextRegistry {
         self.contexts.is_empty()
     }
 
-    /// Evaluate conditions against a goal
-    fn evaluate_conditions(&self, conditions: &Value, goal: &str) -> bool {
-        // Simple condition evaluation
-        // TODO: Expand with proper expression language
-
-        if let Some(keywords) = conditions.get("keywords").and_then(|v| v.as_array()) {
-            let goal_lower = goal.to_lowercase();
-            for keyword in keywords {
-                if let Some(kw) = keyword.as_str() {
-                    if goal_lower.contains(&kw.to_lowercase()) {
-                        return true;
-                    }
-                }
-            }
-            return false;
-        }
-
-        if let Some(pattern) = conditions.get("file_pattern").and_then(|v| v.as_str()) {
-            // File pattern matching - check if goal mentions the pattern
-            let pattern_parts: Vec<&str> = pattern.split('/').collect();
-            for part in pattern_parts {
-                let clean = part.replace("*", "").replace(".", "");
-                if !clean.is_empty() && goal.to_lowercase().contains(&clean.to_lowercase()) {
-                    return true;
-                }
-            }
-            return false;
-        }
-
-        // Default: include if no conditions specified
-        true
-    }
-
     /// Extract keywords from content and filename
     fn extract_keywords(content: &str, file_path: &str) -> Vec<String> {
         let mut keywords = Vec::new();
@@ -394,6 +426,31 @@ mod tests {
         assert_eq!(results.len(), 0);
     }
 
+    #[test]
+    fn test_file_pattern_conditions() {
+        let mut registry = ContextRegistry::new();
+
+        registry.add_context(LoadedContext {
+            pack_id: "schema-editing".to_string(),
+            source: ContextSource::Atlas("dev.cra".to_string()),
+            content: "Schema files are versioned...".to_string(),
+            content_type: "text/markdown".to_string(),
+            priority: 100,
+            keywords: vec!["schema".to_string()],
+            conditions: Some(serde_json::json!({"file_pattern": "specs/Schemas/*.json"})),
+        });
+
+        // Pattern parts are matched case-insensitively against the goal
+        let results = registry.query("update the schema in SPECS", None);
+        assert_eq!(results.len(), 1);
+
+        let results = registry.query("update the schema", None);
+        assert_eq!(results.len(), 0);
+
+        let results = registry.query("fix the schema json", None);
+        assert_eq!(results.len(), 1);
+    }
+
     #[test]
     fn test_to_context_block() {
         let context = LoadedContext {
@@ -466,14 +466,10 @@ pub extern "C" fn cra_resolver_get_trace(
         }
     };
 
-    match resolver.inner.get_trace(&session_id_str) {
-        Ok(events) => {
-            let lines: Vec<String> = events
-                .iter()
-                .filter_map(|e| serde_json::to_string(e).ok())
-                .collect();
-            string_to_c(&lines.join("\n"))
-        }
+    // Serialized straight from the collector into one buffer, without
+    // copying the events or building a String per line
+    match resolver.inner.export_trace_jsonl(&session_id_str) {
+        Ok(jsonl) => string_to_c(&jsonl),
         Err(e) => {
             set_error(format!("Failed to get trace: {}", e));
             ptr::null_mut()
@@ -580,6 +576,16 @@ mod tests {
         let session_id = cra_resolver_create_session(resolver, agent_id.as_ptr(), goal.as_ptr());
         assert!(!session_id.is_null());
 
+        // Trace is one JSON event per line
+        let trace = cra_resolver_get_trace(resolver, session_id);
+        assert!(!trace.is_null());
+        let trace_str = unsafe { CStr::from_ptr(trace) }.to_str().unwrap();
+        assert!(trace_str
+            .lines()
+            .all(|line| serde_json::from_str::<serde_json::Value>(line).is_ok()));
+        assert!(!trace_str.is_empty());
+        cra_free_string(trace);
+
         // End session
         let result = cra_resolver_end_session(resolver, session_id);
         assert_eq!(result, 0);
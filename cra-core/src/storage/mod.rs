@@ -17,10 +17,10 @@
 //! ```
 
 use std::collections::HashMap;
-use std::sync::RwLock;
+use std::sync::{Mutex, RwLock};
 
 use crate::error::{CRAError, Result};
-use crate::trace::TRACEEvent;
+use crate::trace::{EventType, TRACEEvent};
 
 /// Storage backend trait for persisting traces
 ///
@@ -30,6 +30,21 @@ pub trait StorageBackend: Send + Sync {
     /// Store a trace event
     fn store_event(&self, event: &TRACEEvent) -> Result<()>;
 
+    /// Store a batch of trace events
+    ///
+    /// Backends that can persist several events in one operation should
+    /// override this; the default stores them one at a time. A failure does
+    /// not stop the rest of the batch: every event is attempted and the
+    /// failures are reported together.
+    fn store_events(&self, events: &[TRACEEvent]) -> Result<()> {
+        let failures = events
+            .iter()
+            .filter_map(|event| self.store_event(event).err())
+            .map(|e| e.to_string())
+            .collect();
+        batch_result(failures)
+    }
+
     /// Get all events for a session
     fn get_events(&self, session_id: &str) -> Result<Vec<TRACEEvent>>;
 
@@ -52,6 +67,83 @@ pub trait StorageBackend: Send + Sync {
     fn name(&self) -> &'static str;
 }
 
+/// Combine the failures from storing a batch into one result
+fn batch_result(failures: Vec<String>) -> Result<()> {
+    if failures.is_empty() {
+        return Ok(());
+    }
+    Err(CRAError::IoError {
+        message: format!(
+            "Failed to store part of a batch ({} errors): {}",
+            failures.len(),
+            failures.join("; ")
+        ),
+    })
+}
+
+/// Parse an event type filter once, rather than formatting every stored
+/// event's type for comparison. Unknown names match no events.
+fn parse_event_type(event_type: &str) -> Option<EventType> {
+    event_type.parse().ok()
+}
+
+/// Read buffer size for scanning session files
+///
+/// Session files are read front to back, so a buffer well above the 8 KiB
+/// default cuts the number of `read` calls on multi-megabyte traces.
+const READ_BUFFER_SIZE: usize = 64 * 1024;
+
+/// Tell the kernel a session file is about to be read front to back
+///
+/// `POSIX_FADV_SEQUENTIAL` widens the readahead window, which cuts stalls
+/// when a large trace is not already in the page cache. The advice is only
+/// a hint, so failures are ignored.
+#[cfg(target_os = "linux")]
+fn advise_sequential(file: &std::fs::File) {
+    use std::os::unix::io::AsRawFd;
+
+    // SAFETY: the descriptor is owned by `file` and stays open for the call
+    unsafe {
+        libc::posix_fadvise(file.as_raw_fd(), 0, 0, libc::POSIX_FADV_SEQUENTIAL);
+    }
+}
+
+#[cfg(not(target_os = "linux"))]
+fn advise_sequential(_file: &std::fs::File) {}
+
+/// Call `f` with each non-blank line of a JSONL file, as raw bytes
+///
+/// Lines are read into one reused byte buffer, so a line is never decoded
+/// to a `String` and nothing is allocated per line unless `f` needs it.
+fn for_each_line(
+    file: std::fs::File,
+    mut f: impl FnMut(&[u8]) -> Result<()>,
+) -> Result<()> {
+    use std::io::BufRead;
+
+    advise_sequential(&file);
+    let mut reader = std::io::BufReader::with_capacity(READ_BUFFER_SIZE, file);
+    let mut line = Vec::new();
+
+    loop {
+        line.clear();
+        let read = reader.read_until(b'\n', &mut line).map_err(|e| CRAError::IoError {
+            message: format!("Failed to read line: {}", e),
+        })?;
+        if read == 0 {
+            return Ok(());
+        }
+        if line.iter().any(|b| !b.is_ascii_whitespace()) {
+            f(&line)?;
+        }
+    }
+}
+
+/// Whether `needle` occurs anywhere in `haystack`
+fn contains_bytes(haystack: &[u8], needle: &[u8]) -> bool {
+    haystack.windows(needle.len()).any(|window| window == needle)
+}
+
 /// In-memory storage backend (default)
 ///
 /// Stores events in memory using a HashMap. Events are lost on restart.
@@ -103,18 +195,32 @@ impl StorageBackend for InMemoryStorage {
         Ok(())
     }
 
+    fn store_events(&self, batch: &[TRACEEvent]) -> Result<()> {
+        let mut events = self.events.write().map_err(|_| CRAError::StorageLocked)?;
+        for event in batch {
+            events
+                .entry(event.session_id.clone())
+                .or_default()
+                .push(event.clone());
+        }
+        Ok(())
+    }
+
     fn get_events(&self, session_id: &str) -> Result<Vec<TRACEEvent>> {
         let events = self.events.read().map_err(|_| CRAError::StorageLocked)?;
         Ok(events.get(session_id).cloned().unwrap_or_default())
     }
 
     fn get_events_by_type(&self, session_id: &str, event_type: &str) -> Result<Vec<TRACEEvent>> {
+        let Some(event_type) = parse_event_type(event_type) else {
+            return Ok(Vec::new());
+        };
         let events = self.events.read().map_err(|_| CRAError::StorageLocked)?;
         Ok(events
             .get(session_id)
             .map(|v| {
                 v.iter()
-                    .filter(|e| e.event_type.to_string() == event_type)
+                    .filter(|e| e.event_type == event_type)
                     .cloned()
                     .collect()
             })
@@ -158,8 +264,87 @@ impl StorageBackend for InMemoryStorage {
 #[derive(Debug)]
 pub struct FileStorage {
     directory: std::path::PathBuf,
+    /// Event counts by session, valid while the file's stamp is unchanged
+    counts: Mutex<HashMap<String, (FileStamp, usize)>>,
+    /// Append handles of recently written sessions, kept open between writes
+    handles: Mutex<AppendHandles>,
+}
+
+/// Most session files `FileStorage` keeps open for appending at once
+const MAX_OPEN_HANDLES: usize = 64;
+
+/// Open append handles by session, evicted least recently used first
+#[derive(Debug, Default)]
+struct AppendHandles {
+    files: HashMap<String, AppendHandle>,
+    /// Write counter, stamped on a handle each time it is used
+    clock: u64,
+}
+
+#[derive(Debug)]
+struct AppendHandle {
+    file: std::fs::File,
+    /// Identity of the open file, checked against the session path before
+    /// each reuse so a file deleted or rotated by another process is
+    /// reopened rather than appended to after it has been unlinked
+    identity: Option<(u64, u64)>,
+    last_used: u64,
+}
+
+/// Device and inode of a file, where the platform exposes them
+#[cfg(unix)]
+fn file_identity(metadata: &std::fs::Metadata) -> Option<(u64, u64)> {
+    use std::os::unix::fs::MetadataExt;
+    Some((metadata.dev(), metadata.ino()))
+}
+
+#[cfg(not(unix))]
+fn file_identity(_metadata: &std::fs::Metadata) -> Option<(u64, u64)> {
+    None
+}
+
+impl AppendHandles {
+    /// The handle for `path`, reopening it if the path now names a different
+    /// file (or none), and evicting the least recently used handle to make
+    /// room for a new one
+    fn get(&mut self, session_id: &str, path: &std::path::Path) -> std::io::Result<&mut std::fs::File> {
+        let current = self.files.get(session_id).is_some_and(|handle| {
+            std::fs::metadata(path).ok().map(|m| file_identity(&m)) == Some(handle.identity)
+        });
+
+        if !current {
+            self.files.remove(session_id);
+            if self.files.len() >= MAX_OPEN_HANDLES {
+                let oldest = self
+                    .files
+                    .iter()
+                    .min_by_key(|(_, handle)| handle.last_used)
+                    .map(|(id, _)| id.clone());
+                if let Some(oldest) = oldest {
+                    self.files.remove(&oldest);
+                }
+            }
+            let file = std::fs::OpenOptions::new().create(true).append(true).open(path)?;
+            let identity = file_identity(&file.metadata()?);
+            self.files.insert(
+                session_id.to_string(),
+                AppendHandle { file, identity, last_used: 0 },
+            );
+        }
+
+        self.clock += 1;
+        let handle = self.files.get_mut(session_id).expect("handle was just checked or opened");
+        handle.last_used = self.clock;
+        Ok(&mut handle.file)
+    }
 }
 
+/// Length and mtime of a session file, taken from its open handle
+///
+/// Session files only ever grow, so a matching stamp means a cached count
+/// is still current and the file need not be re-read.
+type FileStamp = (u64, Option<std::time::SystemTime>);
+
 impl FileStorage {
     /// Create a new file storage in the given directory
     pub fn new<P: Into<std::path::PathBuf>>(directory: P) -> Result<Self> {
@@ -167,93 +352,253 @@ impl FileStorage {
         std::fs::create_dir_all(&dir).map_err(|e| CRAError::IoError {
             message: format!("Failed to create storage directory: {}", e),
         })?;
-        Ok(Self { directory: dir })
+        Ok(Self {
+            directory: dir,
+            counts: Mutex::new(HashMap::new()),
+            handles: Mutex::new(AppendHandles::default()),
+        })
     }
 
     fn session_file(&self, session_id: &str) -> std::path::PathBuf {
         self.directory.join(format!("{}.jsonl", session_id))
     }
+
+    /// Open a session file for reading, or `None` if it does not exist
+    ///
+    /// Opening directly avoids a separate existence stat before every read.
+    fn open_session(&self, session_id: &str) -> Result<Option<std::fs::File>> {
+        match std::fs::File::open(self.session_file(session_id)) {
+            Ok(file) => Ok(Some(file)),
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(None),
+            Err(e) => Err(CRAError::IoError {
+                message: format!("Failed to open file: {}", e),
+            }),
+        }
+    }
+
+    /// Get the ID of the most recently written session, if any
+    ///
+    /// Makes a single pass over the storage directory. The file type comes
+    /// from the directory listing, so only `.jsonl` files are stat'ed.
+    pub fn latest_session_id(&self) -> Result<Option<String>> {
+        let entries = std::fs::read_dir(&self.directory).map_err(|e| CRAError::IoError {
+            message: format!("Failed to read storage directory: {}", e),
+        })?;
+
+        let mut latest: Option<(std::time::SystemTime, String)> = None;
+        for entry in entries.flatten() {
+            let file_name = entry.file_name();
+            let Some(session_id) = file_name
+                .to_str()
+                .and_then(|name| name.strip_suffix(".jsonl"))
+            else {
+                continue;
+            };
+            if !entry.file_type().map(|t| t.is_file()).unwrap_or(false) {
+                continue;
+            }
+            let Ok(modified) = entry.metadata().and_then(|m| m.modified()) else {
+                continue;
+            };
+            if latest.as_ref().map_or(true, |(newest, _)| modified > *newest) {
+                latest = Some((modified, session_id.to_string()));
+            }
+        }
+
+        Ok(latest.map(|(_, session_id)| session_id))
+    }
 }
 
 impl StorageBackend for FileStorage {
     fn store_event(&self, event: &TRACEEvent) -> Result<()> {
-        use std::io::Write;
+        // A single event is a batch of one: serialized straight into a byte
+        // buffer and appended, newline included, with one write
+        self.store_events(std::slice::from_ref(event))
+    }
 
-        let path = self.session_file(&event.session_id);
-        let mut file = std::fs::OpenOptions::new()
-            .create(true)
-            .append(true)
-            .open(&path)
-            .map_err(|e| CRAError::IoError {
-                message: format!("Failed to open file: {}", e),
-            })?;
+    fn store_events(&self, events: &[TRACEEvent]) -> Result<()> {
+        use std::io::Write;
 
-        let line = serde_json::to_string(event)?;
+        // Serialize each session's events into one buffer and append it
+        // with a single write, so a batch costs one write per session even
+        // when sessions are interleaved (as they are in batches drained by
+        // the background processor). Order within a session is kept; each
+        // session has its own file, so order across sessions doesn't matter.
+        //
+        // One bad event or session doesn't cost the rest of the batch:
+        // failures are collected and reported together once every session
+        // has been attempted.
+        let mut failures = Vec::new();
+        let mut buffers: Vec<(&str, Vec<u8>)> = Vec::new();
+        let mut index: HashMap<&str, usize> = HashMap::new();
+        for event in events {
+            let slot = *index.entry(event.session_id.as_str()).or_insert_with(|| {
+                buffers.push((event.session_id.as_str(), Vec::new()));
+                buffers.len() - 1
+            });
+            let buf = &mut buffers[slot].1;
+            let start = buf.len();
+            if let Err(e) = serde_json::to_writer(&mut *buf, event) {
+                buf.truncate(start);
+                failures.push(format!("Failed to serialize event {}: {}", event.event_id, e));
+                continue;
+            }
+            buf.push(b'\n');
+        }
 
-        writeln!(file, "{}", line).map_err(|e| CRAError::IoError {
-            message: format!("Failed to write: {}", e),
-        })?;
+        // Writes go through a handle kept open per session, so steady
+        // appends cost one write call instead of an open/write/close each;
+        // holding the lock for the batch keeps concurrent batches from
+        // interleaving.
+        let mut handles = self.handles.lock().map_err(|_| CRAError::StorageLocked)?;
+        for (session_id, buf) in buffers {
+            if buf.is_empty() {
+                continue;
+            }
+            let file = match handles.get(session_id, &self.session_file(session_id)) {
+                Ok(file) => file,
+                Err(e) => {
+                    failures.push(format!("Failed to open file for session {}: {}", session_id, e));
+                    continue;
+                }
+            };
+
+            if let Err(e) = file.write_all(&buf) {
+                // Reopen on the next write rather than reuse a failed handle
+                handles.files.remove(session_id);
+                failures.push(format!("Failed to write session {}: {}", session_id, e));
+            }
+        }
 
-        Ok(())
+        batch_result(failures)
     }
 
     fn get_events(&self, session_id: &str) -> Result<Vec<TRACEEvent>> {
-        use std::io::BufRead;
-
-        let path = self.session_file(session_id);
-        if !path.exists() {
+        let Some(file) = self.open_session(session_id)? else {
             return Ok(Vec::new());
-        }
-
-        let file = std::fs::File::open(&path).map_err(|e| CRAError::IoError {
-            message: format!("Failed to open file: {}", e),
-        })?;
+        };
 
-        let reader = std::io::BufReader::new(file);
         let mut events = Vec::new();
-
-        for line in reader.lines() {
-            let line = line.map_err(|e| CRAError::IoError {
-                message: format!("Failed to read line: {}", e),
-            })?;
-            if !line.trim().is_empty() {
-                let event: TRACEEvent = serde_json::from_str(&line)?;
-                events.push(event);
-            }
-        }
+        for_each_line(file, |line| {
+            events.push(serde_json::from_slice(line)?);
+            Ok(())
+        })?;
 
         Ok(events)
     }
 
     fn get_events_by_type(&self, session_id: &str, event_type: &str) -> Result<Vec<TRACEEvent>> {
-        let events = self.get_events(session_id)?;
-        Ok(events
-            .into_iter()
-            .filter(|e| e.event_type.to_string() == event_type)
-            .collect())
+        let Some(event_type) = parse_event_type(event_type) else {
+            return Ok(Vec::new());
+        };
+        let Some(file) = self.open_session(session_id)? else {
+            return Ok(Vec::new());
+        };
+
+        // A matching line must contain the type as a quoted JSON string, so
+        // lines without it are skipped before any parsing
+        let needle = format!("\"{}\"", event_type.as_str());
+        let mut events = Vec::new();
+        for_each_line(file, |line| {
+            if contains_bytes(line, needle.as_bytes()) {
+                let event: TRACEEvent = serde_json::from_slice(line)?;
+                if event.event_type == event_type {
+                    events.push(event);
+                }
+            }
+            Ok(())
+        })?;
+
+        Ok(events)
     }
 
     fn get_last_events(&self, session_id: &str, n: usize) -> Result<Vec<TRACEEvent>> {
-        let events = self.get_events(session_id)?;
-        Ok(events.into_iter().rev().take(n).rev().collect())
+        let Some(file) = self.open_session(session_id)? else {
+            return Ok(Vec::new());
+        };
+        if n == 0 {
+            return Ok(Vec::new());
+        }
+
+        // Keep only the raw bytes of the last `n` lines, recycling the
+        // evicted buffers, and parse just those at the end
+        let mut tail: std::collections::VecDeque<Vec<u8>> = std::collections::VecDeque::with_capacity(n);
+        for_each_line(file, |line| {
+            let mut slot = if tail.len() == n {
+                tail.pop_front().unwrap_or_default()
+            } else {
+                Vec::new()
+            };
+            slot.clear();
+            slot.extend_from_slice(line);
+            tail.push_back(slot);
+            Ok(())
+        })?;
+
+        tail.iter()
+            .map(|line| serde_json::from_slice(line).map_err(Into::into))
+            .collect()
     }
 
     fn get_event_count(&self, session_id: &str) -> Result<usize> {
-        Ok(self.get_events(session_id)?.len())
+        // One event per non-blank line, so counting needs no JSON parsing
+        let Some(file) = self.open_session(session_id)? else {
+            return Ok(0);
+        };
+
+        let stamp = file
+            .metadata()
+            .map(|m| (m.len(), m.modified().ok()))
+            .map_err(|e| CRAError::IoError {
+                message: format!("Failed to stat file: {}", e),
+            })?;
+        {
+            let counts = self.counts.lock().map_err(|_| CRAError::StorageLocked)?;
+            if let Some(&(cached, count)) = counts.get(session_id) {
+                if cached == stamp {
+                    return Ok(count);
+                }
+            }
+        }
+
+        let mut count = 0;
+        for_each_line(file, |_| {
+            count += 1;
+            Ok(())
+        })?;
+
+        self.counts
+            .lock()
+            .map_err(|_| CRAError::StorageLocked)?
+            .insert(session_id.to_string(), (stamp, count));
+
+        Ok(count)
     }
 
     fn delete_session(&self, session_id: &str) -> Result<()> {
-        let path = self.session_file(session_id);
-        if path.exists() {
-            std::fs::remove_file(&path).map_err(|e| CRAError::IoError {
+        self.counts
+            .lock()
+            .map_err(|_| CRAError::StorageLocked)?
+            .remove(session_id);
+        // Closed first, so a later write recreates the file instead of
+        // appending to the unlinked one
+        self.handles
+            .lock()
+            .map_err(|_| CRAError::StorageLocked)?
+            .files
+            .remove(session_id);
+
+        match std::fs::remove_file(self.session_file(session_id)) {
+            Ok(()) => Ok(()),
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(()),
+            Err(e) => Err(CRAError::IoError {
                 message: format!("Failed to delete file: {}", e),
-            })?;
+            }),
         }
-        Ok(())
     }
 
     fn health_check(&self) -> Result<()> {
-        if self.directory.exists() && self.directory.is_dir() {
+        if std::fs::metadata(&self.directory).map_or(false, |m| m.is_dir()) {
             Ok(())
         } else {
             Err(CRAError::IoError {
@@ -319,6 +664,11 @@ mod tests {
     use crate::trace::EventType;
     use serde_json::json;
 
+    /// A fresh directory per test run, so reruns don't see earlier files
+    fn unique_temp_dir(name: &str) -> std::path::PathBuf {
+        std::env::temp_dir().join(format!("{}-{}", name, uuid::Uuid::new_v4()))
+    }
+
     fn create_test_event(session_id: &str, seq: u64) -> TRACEEvent {
         TRACEEvent::new(
             session_id.to_string(),
@@ -342,6 +692,15 @@ mod tests {
         let count = storage.get_event_count("session-1").unwrap();
         assert_eq!(count, 1);
 
+        let started = storage
+            .get_events_by_type("session-1", "session.started")
+            .unwrap();
+        assert_eq!(started.len(), 1);
+        assert!(storage
+            .get_events_by_type("session-1", "not.a.type")
+            .unwrap()
+            .is_empty());
+
         storage.delete_session("session-1").unwrap();
         let events = storage.get_events("session-1").unwrap();
         assert!(events.is_empty());
@@ -349,7 +708,7 @@ mod tests {
 
     #[test]
     fn test_file_storage() {
-        let temp_dir = std::env::temp_dir().join("cra-test-storage");
+        let temp_dir = unique_temp_dir("cra-test-storage");
         let storage = FileStorage::new(&temp_dir).unwrap();
 
         let event = create_test_event("test-session", 0);
@@ -358,12 +717,241 @@ mod tests {
         let events = storage.get_events("test-session").unwrap();
         assert_eq!(events.len(), 1);
 
+        storage.store_event(&create_test_event("test-session", 1)).unwrap();
+        assert_eq!(storage.get_event_count("test-session").unwrap(), 2);
+        assert_eq!(storage.get_event_count("test-session").unwrap(), 2);
+        assert_eq!(storage.get_event_count("missing-session").unwrap(), 0);
+
+        // A cached count is dropped once the file grows
+        storage.store_event(&create_test_event("test-session", 2)).unwrap();
+        assert_eq!(storage.get_event_count("test-session").unwrap(), 3);
+
+        storage.delete_session("test-session").unwrap();
+        assert!(storage.get_events("test-session").unwrap().is_empty());
+        assert_eq!(storage.get_event_count("test-session").unwrap(), 0);
         storage.delete_session("test-session").unwrap();
 
         // Cleanup
         let _ = std::fs::remove_dir_all(&temp_dir);
     }
 
+    #[test]
+    fn test_file_storage_large_events() {
+        let temp_dir = unique_temp_dir("cra-test-storage-large");
+        let storage = FileStorage::new(&temp_dir).unwrap();
+
+        // Lines longer than the read buffer still come back whole
+        let blob = "x".repeat(READ_BUFFER_SIZE * 2);
+        let events: Vec<TRACEEvent> = (0..3)
+            .map(|seq| {
+                TRACEEvent::new(
+                    "large-session".to_string(),
+                    "trace-1".to_string(),
+                    EventType::SessionStarted,
+                    json!({ "blob": blob }),
+                )
+                .chain(seq, "0".repeat(64))
+            })
+            .collect();
+        storage.store_events(&events).unwrap();
+
+        let stored = storage.get_events("large-session").unwrap();
+        assert_eq!(stored.len(), 3);
+        assert_eq!(stored[2].payload["blob"].as_str().unwrap().len(), blob.len());
+        assert_eq!(storage.get_event_count("large-session").unwrap(), 3);
+
+        // Cleanup
+        let _ = std::fs::remove_dir_all(&temp_dir);
+    }
+
+    #[test]
+    fn test_file_storage_batch() {
+        let temp_dir = unique_temp_dir("cra-test-storage-batch");
+        let storage = FileStorage::new(&temp_dir).unwrap();
+
+        let batch = vec![
+            create_test_event("batch-a", 0),
+            create_test_event("batch-a", 1),
+            create_test_event("batch-b", 0),
+            create_test_event("batch-a", 2),
+        ];
+        storage.store_events(&batch).unwrap();
+
+        // Interleaved sessions are written together, in order
+        let events = storage.get_events("batch-a").unwrap();
+        assert_eq!(events.len(), 3);
+        let sequences: Vec<_> = events.iter().map(|e| e.sequence).collect();
+        assert_eq!(sequences, vec![0, 1, 2]);
+        assert_eq!(storage.get_event_count("batch-b").unwrap(), 1);
+
+        // Cleanup
+        let _ = std::fs::remove_dir_all(&temp_dir);
+    }
+
+    #[test]
+    fn test_file_storage_batch_partial_failure() {
+        let temp_dir = unique_temp_dir("cra-test-storage-partial");
+        let storage = FileStorage::new(&temp_dir).unwrap();
+
+        // The middle session's file can't be opened (its directory is missing)
+        let batch = vec![
+            create_test_event("partial-a", 0),
+            create_test_event("no-such-dir/partial-bad", 0),
+            create_test_event("partial-b", 0),
+            create_test_event("partial-a", 1),
+        ];
+        let err = storage.store_events(&batch).unwrap_err();
+        assert!(err.to_string().contains("partial-bad"));
+
+        // The other sessions are still written in full
+        assert_eq!(storage.get_event_count("partial-a").unwrap(), 2);
+        assert_eq!(storage.get_event_count("partial-b").unwrap(), 1);
+
+        // Cleanup
+        let _ = std::fs::remove_dir_all(&temp_dir);
+    }
+
+    #[test]
+    fn test_default_store_events_continues_after_failure() {
+        /// Rejects events for one session, keeps the rest in memory
+        struct Flaky(InMemoryStorage);
+
+        impl StorageBackend for Flaky {
+            fn store_event(&self, event: &TRACEEvent) -> Result<()> {
+                if event.session_id == "bad" {
+                    return Err(CRAError::StorageLocked);
+                }
+                self.0.store_event(event)
+            }
+            fn get_events(&self, session_id: &str) -> Result<Vec<TRACEEvent>> {
+                self.0.get_events(session_id)
+            }
+            fn get_events_by_type(&self, session_id: &str, event_type: &str) -> Result<Vec<TRACEEvent>> {
+                self.0.get_events_by_type(session_id, event_type)
+            }
+            fn get_last_events(&self, session_id: &str, n: usize) -> Result<Vec<TRACEEvent>> {
+                self.0.get_last_events(session_id, n)
+            }
+            fn get_event_count(&self, session_id: &str) -> Result<usize> {
+                self.0.get_event_count(session_id)
+            }
+            fn delete_session(&self, session_id: &str) -> Result<()> {
+                self.0.delete_session(session_id)
+            }
+            fn health_check(&self) -> Result<()> {
+                Ok(())
+            }
+            fn name(&self) -> &'static str {
+                "flaky"
+            }
+        }
+
+        let storage = Flaky(InMemoryStorage::new());
+        let batch = vec![
+            create_test_event("good", 0),
+            create_test_event("bad", 0),
+            create_test_event("good", 1),
+        ];
+        assert!(storage.store_events(&batch).is_err());
+        assert_eq!(storage.get_event_count("good").unwrap(), 2);
+    }
+
+    #[test]
+    fn test_file_storage_handles() {
+        let temp_dir = unique_temp_dir("cra-test-storage-handles");
+        let storage = FileStorage::new(&temp_dir).unwrap();
+
+        // More sessions than open handles: evicted ones reopen and append
+        for round in 0..2 {
+            for i in 0..MAX_OPEN_HANDLES + 8 {
+                storage.store_event(&create_test_event(&format!("s{}", i), round)).unwrap();
+            }
+        }
+        assert_eq!(storage.get_event_count("s0").unwrap(), 2);
+        assert_eq!(storage.get_event_count(&format!("s{}", MAX_OPEN_HANDLES + 7)).unwrap(), 2);
+
+        // Writing after a delete starts a fresh file
+        storage.delete_session("s0").unwrap();
+        storage.store_event(&create_test_event("s0", 0)).unwrap();
+        assert_eq!(storage.get_events("s0").unwrap().len(), 1);
+
+        // A file removed outside the storage is recreated, not appended to
+        // through the stale handle
+        std::fs::remove_file(storage.session_file("s0")).unwrap();
+        storage.store_event(&create_test_event("s0", 1)).unwrap();
+        assert_eq!(storage.get_events("s0").unwrap().len(), 1);
+
+        // A busy session keeps its handle while idle ones are evicted
+        {
+            let handles = storage.handles.lock().unwrap();
+            assert!(handles.files.len() <= MAX_OPEN_HANDLES);
+            assert!(handles.files.contains_key("s0"));
+        }
+        for i in 1..MAX_OPEN_HANDLES + 8 {
+            storage.store_event(&create_test_event(&format!("s{}", i), 2)).unwrap();
+            storage.store_event(&create_test_event("s0", 2)).unwrap();
+        }
+        assert!(storage.handles.lock().unwrap().files.contains_key("s0"));
+
+        // Cleanup
+        let _ = std::fs::remove_dir_all(&temp_dir);
+    }
+
+    #[test]
+    fn test_file_storage_queries() {
+        let temp_dir = unique_temp_dir("cra-test-storage-queries");
+        let storage = FileStorage::new(&temp_dir).unwrap();
+
+        // The second event mentions "session.ended" only in its payload
+        let ended = TRACEEvent::new(
+            "queries".to_string(),
+            "trace-1".to_string(),
+            EventType::SessionEnded,
+            json!({}),
+        )
+        .chain(2, "0".repeat(64));
+        let mentions = TRACEEvent::new(
+            "queries".to_string(),
+            "trace-1".to_string(),
+            EventType::SessionStarted,
+            json!({"note": "session.ended"}),
+        )
+        .chain(1, "0".repeat(64));
+        storage
+            .store_events(&[create_test_event("queries", 0), mentions, ended])
+            .unwrap();
+
+        let by_type = storage.get_events_by_type("queries", "session.ended").unwrap();
+        assert_eq!(by_type.len(), 1);
+        assert_eq!(by_type[0].sequence, 2);
+
+        let last = storage.get_last_events("queries", 2).unwrap();
+        assert_eq!(last.iter().map(|e| e.sequence).collect::<Vec<_>>(), vec![1, 2]);
+        assert_eq!(storage.get_last_events("queries", 10).unwrap().len(), 3);
+        assert!(storage.get_last_events("queries", 0).unwrap().is_empty());
+        assert!(storage.get_last_events("missing", 2).unwrap().is_empty());
+
+        // Cleanup
+        let _ = std::fs::remove_dir_all(&temp_dir);
+    }
+
+    #[test]
+    fn test_file_storage_latest_session() {
+        let temp_dir = unique_temp_dir("cra-test-storage-latest");
+        let storage = FileStorage::new(&temp_dir).unwrap();
+        assert_eq!(storage.latest_session_id().unwrap(), None);
+
+        storage.store_event(&create_test_event("older", 0)).unwrap();
+        std::thread::sleep(std::time::Duration::from_millis(20));
+        storage.store_event(&create_test_event("newer", 0)).unwrap();
+        std::fs::write(temp_dir.join("notes.txt"), "ignored").unwrap();
+
+        assert_eq!(storage.latest_session_id().unwrap().as_deref(), Some("newer"));
+
+        // Cleanup
+        let _ = std::fs::remove_dir_all(&temp_dir);
+    }
+
     #[test]
     fn test_null_storage() {
         let storage = NullStorage::new();
@@ -154,7 +154,8 @@ impl ChainVerifier {
             );
         }
 
-        let mut last_hash = first.event_hash.clone();
+        // Borrowed while walking the chain; only the final hash is copied
+        let mut last_hash = first.event_hash.as_str();
         let mut last_sequence = first.sequence;
         let mut last_timestamp = first.timestamp;
 
@@ -208,12 +209,12 @@ impl ChainVerifier {
                 // In strict mode, this could be an error
             }
 
-            last_hash = event.event_hash.clone();
+            last_hash = &event.event_hash;
             last_sequence = event.sequence;
             last_timestamp = event.timestamp;
         }
 
-        ChainVerification::valid(events.len(), last_hash)
+        ChainVerification::valid(events.len(), last_hash.to_string())
     }
 
     /// Verify that one chain is an extension of another
@@ -15,11 +15,11 @@ use std::sync::Arc;
 use std::time::Duration;
 
 use serde_json::Value;
-use uuid::Uuid;
 
 use crate::error::{CRAError, Result};
 
 use super::{
+    new_id,
     buffer::TraceRingBuffer,
     chain::{ChainVerification, ChainVerifier},
     event::{EventType, TRACEEvent},
@@ -131,6 +131,23 @@ impl std::fmt::Debug for TraceCollector {
     }
 }
 
+/// Get the trace state for a session, creating it on first use
+///
+/// Looks the session up by `&str` first, so the common case (session
+/// already exists) allocates neither an owned key nor a fresh trace ID.
+fn session_entry<'a>(
+    sessions: &'a mut HashMap<String, SessionTrace>,
+    session_id: &str,
+) -> &'a mut SessionTrace {
+    if !sessions.contains_key(session_id) {
+        sessions.insert(
+            session_id.to_string(),
+            SessionTrace::new(new_id()),
+        );
+    }
+    sessions.get_mut(session_id).expect("session inserted above")
+}
+
 impl TraceCollector {
     /// Create a new trace collector (immediate mode)
     pub fn new() -> Self {
@@ -228,11 +245,7 @@ impl TraceCollector {
         }
 
         // Immediate mode: compute hash inline
-        let trace_id = Uuid::new_v4().to_string();
-        let session = self
-            .sessions
-            .entry(session_id.to_string())
-            .or_insert_with(|| SessionTrace::new(trace_id));
+        let session = session_entry(&mut self.sessions, session_id);
 
         let event = TRACEEvent::new(
             session_id.to_string(),
@@ -250,6 +263,48 @@ impl TraceCollector {
         Ok(appended)
     }
 
+    /// Emit several events for one session, in order
+    ///
+    /// Equivalent to calling `emit()` for each event, but in immediate mode
+    /// the session is looked up once and its event list grown once for the
+    /// whole batch. Returns the number of events emitted.
+    pub fn emit_batch<I>(&mut self, session_id: &str, events: I) -> Result<usize>
+    where
+        I: IntoIterator<Item = (EventType, Value)>,
+    {
+        let events = events.into_iter();
+        let mut count = 0;
+
+        if self.deferred {
+            for (event_type, payload) in events {
+                self.emit_deferred(session_id, event_type, payload)?;
+                count += 1;
+            }
+            return Ok(count);
+        }
+
+        let session = session_entry(&mut self.sessions, session_id);
+        session.events.reserve(events.size_hint().0);
+
+        for (event_type, payload) in events {
+            let event = TRACEEvent::new(
+                session_id.to_string(),
+                session.trace_id.clone(),
+                event_type,
+                payload,
+            );
+
+            let appended = session.append(event);
+
+            if let Some(ref callback) = self.on_emit {
+                callback(appended);
+            }
+            count += 1;
+        }
+
+        Ok(count)
+    }
+
     /// Emit in deferred mode - create event (no hash), push to buffer, return event
     ///
     /// In deferred mode, we create the event immediately but with a placeholder hash.
@@ -267,11 +322,7 @@ impl TraceCollector {
             })?;
 
         // Ensure session exists with a trace_id
-        let trace_id = Uuid::new_v4().to_string();
-        let session = self
-            .sessions
-            .entry(session_id.to_string())
-            .or_insert_with(|| SessionTrace::new(trace_id));
+        let session = session_entry(&mut self.sessions, session_id);
         let trace_id = session.trace_id.clone();
 
         // Create the event immediately (with placeholder hash)
@@ -319,11 +370,7 @@ impl TraceCollector {
         event_type: EventType,
         payload: Value,
     ) -> Result<&TRACEEvent> {
-        let trace_id = Uuid::new_v4().to_string();
-        let session = self
-            .sessions
-            .entry(session_id.to_string())
-            .or_insert_with(|| SessionTrace::new(trace_id));
+        let session = session_entry(&mut self.sessions, session_id);
 
         let event = TRACEEvent::new(
             session_id.to_string(),
@@ -384,28 +431,41 @@ impl TraceCollector {
     }
 
     /// Verify the hash chain integrity for a session
+    ///
+    /// Verifies the session's events in place rather than a copy of them.
     pub fn verify_chain(&self, session_id: &str) -> Result<ChainVerification> {
-        let events = self.get_events(session_id)?;
-        Ok(ChainVerifier::verify(&events))
+        self.sessions
+            .get(session_id)
+            .map(|s| ChainVerifier::verify(&s.events))
+            .ok_or_else(|| CRAError::SessionNotFound {
+                session_id: session_id.to_string(),
+            })
     }
 
     /// Export events as JSONL (JSON Lines)
+    ///
+    /// Events are serialized in place into a single buffer, without copying
+    /// the session's events or allocating a String per line.
     pub fn export_jsonl(&self, session_id: &str) -> Result<String> {
-        let events = self.get_events(session_id)?;
-        let lines: Vec<String> = events
-            .iter()
-            .map(|e| serde_json::to_string(e).unwrap_or_default())
-            .collect();
-        Ok(lines.join("\n"))
+        let session = self.sessions.get(session_id).ok_or_else(|| CRAError::SessionNotFound {
+            session_id: session_id.to_string(),
+        })?;
+
+        let mut out = Vec::with_capacity(session.events.len() * 512);
+        for (i, event) in session.events.iter().enumerate() {
+            if i > 0 {
+                out.push(b'\n');
+            }
+            serde_json::to_writer(&mut out, event)?;
+        }
+
+        // serde_json only ever writes valid UTF-8
+        Ok(String::from_utf8(out).unwrap_or_default())
     }
 
     /// Import events from JSONL
     pub fn import_jsonl(&mut self, session_id: &str, jsonl: &str) -> Result<usize> {
-        let trace_id = Uuid::new_v4().to_string();
-        let session = self
-            .sessions
-            .entry(session_id.to_string())
-            .or_insert_with(|| SessionTrace::new(trace_id));
+        let session = session_entry(&mut self.sessions, session_id);
 
         let mut count = 0;
         for line in jsonl.lines() {
@@ -531,6 +591,28 @@ mod tests {
         assert_eq!(verification.event_count, 2);
     }
 
+    #[test]
+    fn test_emit_batch_chains_in_order() {
+        let mut collector = TraceCollector::new();
+        collector
+            .emit("session-1", EventType::SessionStarted, json!({"agent_id": "agent-1"}))
+            .unwrap();
+
+        let emitted = collector
+            .emit_batch(
+                "session-1",
+                (0..3).map(|i| (EventType::PolicyEvaluated, json!({"action_id": format!("action-{}", i)}))),
+            )
+            .unwrap();
+        assert_eq!(emitted, 3);
+
+        let events = collector.get_events("session-1").unwrap();
+        assert_eq!(events.len(), 4);
+        assert_eq!(events[3].sequence, 3);
+        assert_eq!(events[3].payload["action_id"], "action-2");
+        assert!(collector.verify_chain("session-1").unwrap().is_valid);
+    }
+
     #[test]
     fn test_get_events_by_type() {
         let mut collector = TraceCollector::new();
@@ -1,12 +1,17 @@
 //! TRACE Event types
 
+use std::fmt::Write as _;
+
+use chrono::format::{Fixed, Item};
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use sha2::{Digest, Sha256};
-use uuid::Uuid;
 
-use super::VERSION;
+use super::{new_id, VERSION};
+
+/// Same output as `DateTime::to_rfc3339`, as a format that writes in place
+const RFC3339_ITEMS: [Item<'static>; 1] = [Item::Fixed(Fixed::RFC3339)];
 
 /// A single TRACE event in the audit log
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -59,9 +64,9 @@ impl TRACEEvent {
     ) -> Self {
         Self {
             trace_version: VERSION.to_string(),
-            event_id: Uuid::new_v4().to_string(),
+            event_id: new_id(),
             trace_id,
-            span_id: Uuid::new_v4().to_string(),
+            span_id: new_id(),
             parent_span_id: None,
             session_id,
             sequence: 0, // Will be set by collector
@@ -116,8 +121,16 @@ impl TRACEEvent {
         hasher.update(self.span_id.as_bytes());
         hasher.update(self.parent_span_id.as_deref().unwrap_or("").as_bytes());
         hasher.update(self.session_id.as_bytes());
-        hasher.update(self.sequence.to_string().as_bytes());
-        hasher.update(self.timestamp.to_rfc3339().as_bytes());
+        // Sequence and timestamp are adjacent in the hash input, so format
+        // both into one scratch string rather than allocating one for each
+        let mut scratch = String::with_capacity(64);
+        let _ = write!(
+            scratch,
+            "{}{}",
+            self.sequence,
+            self.timestamp.format_with_items(RFC3339_ITEMS.iter())
+        );
+        hasher.update(scratch.as_bytes());
         hasher.update(self.event_type.as_str().as_bytes());
         hasher.update(canonical_json(&self.payload).as_bytes());
         hasher.update(self.previous_event_hash.as_bytes());
@@ -133,21 +146,46 @@ impl TRACEEvent {
 
 /// Canonical JSON serialization (sorted keys)
 fn canonical_json(value: &Value) -> String {
+    let mut out = Vec::with_capacity(256);
+    write_canonical_json(value, &mut out);
+    // Only UTF-8 is ever written: serde_json output plus keys copied from &str
+    String::from_utf8(out).unwrap_or_default()
+}
+
+/// Append the canonical form of `value` to `out`
+///
+/// Writes straight into one buffer rather than building and joining an
+/// intermediate String per nested value; the bytes produced are the same.
+fn write_canonical_json(value: &Value, out: &mut Vec<u8>) {
     match value {
         Value::Object(map) => {
             let mut pairs: Vec<_> = map.iter().collect();
             pairs.sort_by_key(|(k, _)| *k);
-            let contents: Vec<String> = pairs
-                .iter()
-                .map(|(k, v)| format!("\"{}\":{}", k, canonical_json(v)))
-                .collect();
-            format!("{{{}}}", contents.join(","))
+            out.push(b'{');
+            for (i, (k, v)) in pairs.into_iter().enumerate() {
+                if i > 0 {
+                    out.push(b',');
+                }
+                out.push(b'"');
+                out.extend_from_slice(k.as_bytes());
+                out.extend_from_slice(b"\":");
+                write_canonical_json(v, out);
+            }
+            out.push(b'}');
         }
         Value::Array(arr) => {
-            let contents: Vec<String> = arr.iter().map(canonical_json).collect();
-            format!("[{}]", contents.join(","))
+            out.push(b'[');
+            for (i, v) in arr.iter().enumerate() {
+                if i > 0 {
+                    out.push(b',');
+                }
+                write_canonical_json(v, out);
+            }
+            out.push(b']');
+        }
+        _ => {
+            let _ = serde_json::to_writer(&mut *out, value);
         }
-        _ => serde_json::to_string(value).unwrap_or_default(),
     }
 }
 
@@ -598,7 +636,13 @@ mod tests {
         );
 
         assert_eq!(event.session_id, "session-1");
+        assert_eq!(event.trace_version, VERSION);
         assert!(matches!(event.event_type, EventType::SessionStarted));
+
+        // Round-tripping through JSON keeps the version
+        let parsed: TRACEEvent =
+            serde_json::from_str(&serde_json::to_string(&event).unwrap()).unwrap();
+        assert_eq!(parsed.trace_version, VERSION);
     }
 
     #[test]
@@ -631,6 +675,36 @@ mod tests {
         assert!(!modified.verify_hash());
     }
 
+    #[test]
+    fn test_hash_timestamp_formatting() {
+        // The in-place timestamp format must hash exactly like to_rfc3339
+        for ts in ["2024-01-01T00:00:00Z", "2024-06-30T12:34:56.789012345Z"] {
+            let mut event = TRACEEvent::new(
+                "session-1".to_string(),
+                "trace-1".to_string(),
+                EventType::SessionStarted,
+                json!({}),
+            );
+            event.timestamp = ts.parse().unwrap();
+            event.sequence = 42;
+
+            let mut hasher = Sha256::new();
+            hasher.update(event.trace_version.as_bytes());
+            hasher.update(event.event_id.as_bytes());
+            hasher.update(event.trace_id.as_bytes());
+            hasher.update(event.span_id.as_bytes());
+            hasher.update(b"");
+            hasher.update(event.session_id.as_bytes());
+            hasher.update(event.sequence.to_string().as_bytes());
+            hasher.update(event.timestamp.to_rfc3339().as_bytes());
+            hasher.update(event.event_type.as_str().as_bytes());
+            hasher.update(canonical_json(&event.payload).as_bytes());
+            hasher.update(event.previous_event_hash.as_bytes());
+
+            assert_eq!(event.compute_hash(), hex::encode(hasher.finalize()));
+        }
+    }
+
     #[test]
     fn test_event_chaining() {
         let first = TRACEEvent::genesis(
@@ -662,6 +736,20 @@ mod tests {
         assert!(canonical.contains("\"c\":{\"x\":1,\"y\":2}"));
     }
 
+    #[test]
+    fn test_canonical_json_nested_output() {
+        // Exact bytes matter: they feed the event hash
+        let value = json!({
+            "z": [1, {"b": null, "a": "q\"uote"}, []],
+            "m": {},
+            "a": [true, 1.5, "h\u{e9}"]
+        });
+        assert_eq!(
+            canonical_json(&value),
+            r#"{"a":[true,1.5,"hé"],"m":{},"z":[1,{"a":"q\"uote","b":null},[]]}"#
+        );
+    }
+
     #[test]
     fn test_event_type_parsing() {
         assert_eq!(
@@ -69,6 +69,16 @@ pub const VERSION: &str = "1.0";
 /// Genesis hash - used as previous_event_hash for first event
 pub const GENESIS_HASH: &str = "0000000000000000000000000000000000000000000000000000000000000000";
 
+/// Generate a random (v4) ID in hyphenated form
+///
+/// Encodes into a stack buffer and copies it out once, instead of going
+/// through `Display` as `Uuid::new_v4().to_string()` does. Every event takes
+/// two of these, so it sits on the emit path.
+pub(crate) fn new_id() -> String {
+    let mut buf = uuid::Uuid::encode_buffer();
+    uuid::Uuid::new_v4().hyphenated().encode_lower(&mut buf).to_owned()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -113,4 +123,12 @@ mod tests {
         assert!(verification.is_valid);
         assert_eq!(verification.event_count, 2);
     }
+    #[test]
+    fn test_new_id_format() {
+        let id = new_id();
+        let parsed = uuid::Uuid::parse_str(&id).unwrap();
+        assert_eq!(id, parsed.to_string());
+        assert_eq!(parsed.get_version_num(), 4);
+        assert_ne!(id, new_id());
+    }
 }
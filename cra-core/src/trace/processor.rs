@@ -10,7 +10,6 @@ use std::sync::{Arc, RwLock};
 use std::thread::{self, JoinHandle};
 use std::time::Duration;
 
-use crate::error::Result;
 use crate::storage::StorageBackend;
 
 use super::buffer::TraceRingBuffer;
@@ -168,31 +167,36 @@ impl TraceProcessor {
             }
 
             // Process the batch
-            for raw_event in events {
-                if let Err(e) = Self::process_event(&raw_event, &chains, storage.as_ref()) {
-                    // Log error but continue processing
-                    eprintln!("Error processing trace event: {:?}", e);
-                }
+            let batch = Self::process_batch(&events, &chains);
+            if let Err(e) = storage.store_events(&batch) {
+                // Log error but continue processing
+                eprintln!("Error storing trace events: {:?}", e);
             }
         }
 
         // Flush remaining events on shutdown
         if config.flush_on_shutdown {
             let remaining = buffer.drain_all();
-            for raw_event in remaining {
-                if let Err(e) = Self::process_event(&raw_event, &chains, storage.as_ref()) {
-                    eprintln!("Error processing trace event during shutdown: {:?}", e);
-                }
+            let batch = Self::process_batch(&remaining, &chains);
+            if let Err(e) = storage.store_events(&batch) {
+                eprintln!("Error storing trace events during shutdown: {:?}", e);
             }
         }
     }
 
-    /// Process a single raw event
-    fn process_event(
-        raw: &RawEvent,
+    /// Chain a batch of raw events, ready to be stored in one call
+    fn process_batch(
+        raw_events: &[RawEvent],
         chains: &RwLock<HashMap<String, ChainState>>,
-        storage: &dyn StorageBackend,
-    ) -> Result<()> {
+    ) -> Vec<TRACEEvent> {
+        raw_events
+            .iter()
+            .map(|raw| Self::process_event(raw, chains))
+            .collect()
+    }
+
+    /// Process a single raw event
+    fn process_event(raw: &RawEvent, chains: &RwLock<HashMap<String, ChainState>>) -> TRACEEvent {
         // Get or create chain state
         let (sequence, previous_hash, trace_id) = {
             let mut chains = chains.write().unwrap();
@@ -235,10 +239,7 @@ impl TraceProcessor {
             }
         }
 
-        // Store the processed event
-        storage.store_event(&event)?;
-
-        Ok(())
+        event
     }
 
     /// Get the chain state for a session (for verification)
@@ -7,9 +7,9 @@
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
-use uuid::Uuid;
 
 use super::event::EventType;
+use super::new_id;
 
 /// Raw event before hash computation
 ///
@@ -53,8 +53,8 @@ impl RawEvent {
         Self {
             session_id,
             trace_id,
-            event_id: Uuid::new_v4().to_string(),
-            span_id: Uuid::new_v4().to_string(),
+            event_id: new_id(),
+            span_id: new_id(),
             parent_span_id: None,
             event_type,
             payload,
@@ -8,6 +8,8 @@
 //! 5. Agent signals ready (READY)
 //! 6. CRA confirms session (SESSION)
 
+use std::sync::OnceLock;
+
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
@@ -109,6 +111,45 @@ pub struct GovernanceRule {
 
 fn default_soft() -> String { "soft".to_string() }
 
+/// Standard governance rules sent to every agent: (rule_id, description, enforcement)
+pub const STANDARD_GOVERNANCE_RULES: &[(&str, &str, &str)] = &[
+    ("trace.required", "All actions must be reported through cra_report_action", "hard"),
+    ("context.must_request", "Request context before making domain-specific decisions", "soft"),
+    ("feedback.expected", "Provide feedback on context usefulness", "soft"),
+];
+
+/// Obligations listed in the one-shot bootstrap result
+pub const STANDARD_OBLIGATIONS: &[&str] = &[
+    "Report all significant actions via cra_report_action",
+    "Request context when unsure about domain specifics",
+    "Provide feedback on context usefulness",
+];
+
+/// Build the standard governance rules from [`STANDARD_GOVERNANCE_RULES`]
+pub fn standard_governance_rules() -> Vec<GovernanceRule> {
+    STANDARD_GOVERNANCE_RULES
+        .iter()
+        .map(|(rule_id, description, enforcement)| GovernanceRule {
+            rule_id: (*rule_id).to_string(),
+            description: (*description).to_string(),
+            enforcement: (*enforcement).to_string(),
+        })
+        .collect()
+}
+
+/// The governance section every bootstrap result carries, built once
+///
+/// Only the session-specific fields of a [`BootstrapResult`] change between
+/// sessions; the governance section is assembled from constants and reused.
+pub fn standard_governance() -> &'static GovernanceSection {
+    static GOVERNANCE: OnceLock<GovernanceSection> = OnceLock::new();
+    GOVERNANCE.get_or_init(|| GovernanceSection {
+        rules: standard_governance_rules(),
+        policies: Vec::new(),
+        you_must: STANDARD_OBLIGATIONS.iter().map(|s| (*s).to_string()).collect(),
+    })
+}
+
 /// Summary of a policy
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct PolicySummary {
@@ -294,23 +335,7 @@ impl BootstrapProtocol {
         let governance = GovernanceMessage {
             session_id: session.session_id.clone(),
             genesis_hash: session.genesis_hash.clone(),
-            rules: vec![
-                GovernanceRule {
-                    rule_id: "trace.required".to_string(),
-                    description: "All actions must be reported through cra_report_action".to_string(),
-                    enforcement: "hard".to_string(),
-                },
-                GovernanceRule {
-                    rule_id: "context.must_request".to_string(),
-                    description: "Request context before making domain-specific decisions".to_string(),
-                    enforcement: "soft".to_string(),
-                },
-                GovernanceRule {
-                    rule_id: "feedback.expected".to_string(),
-                    description: "Provide feedback on context usefulness".to_string(),
-                    enforcement: "soft".to_string(),
-                },
-            ],
+            rules: standard_governance_rules(),
             policies: Vec::new(), // Would be populated from loaded atlases
             acknowledgment_required: true,
         };
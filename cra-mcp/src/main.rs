@@ -47,7 +47,10 @@ struct Args {
     verbose: bool,
 }
 
-#[tokio::main]
+// The server handles one stdio stream sequentially, so a work-stealing
+// pool only adds worker threads and cross-thread wakeups. Atlas loading
+// still runs on the blocking pool.
+#[tokio::main(flavor = "current_thread")]
 async fn main() -> Result<(), Box<dyn std::error::Error>> {
     let args = Args::parse();
 
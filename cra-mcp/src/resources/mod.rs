@@ -2,6 +2,8 @@
 //!
 //! Resources are data that agents can read through the MCP protocol.
 
+use std::sync::OnceLock;
+
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 
@@ -19,30 +21,43 @@ pub struct ResourceDefinition {
     pub mime_type: String,
 }
 
+/// Static resource table: (uri, description, mime_type)
+///
+/// Kept as compile-time data so the definitions live in the binary's
+/// read-only section rather than being rebuilt from literals on each call.
+pub const RESOURCE_TABLE: &[(&str, &str, &str)] = &[
+    (
+        "cra://session/current",
+        "Current session state, loaded atlases, and context received",
+        "application/json",
+    ),
+    (
+        "cra://trace/{session_id}",
+        "TRACE audit trail for a session",
+        "application/x-ndjson",
+    ),
+    (
+        "cra://atlas/{atlas_id}",
+        "Full atlas manifest for inspection",
+        "application/json",
+    ),
+    (
+        "cra://chain/{session_id}",
+        "Chain verification status for a session",
+        "application/json",
+    ),
+];
+
 /// Get all CRA resource definitions
 pub fn get_resource_definitions() -> Vec<ResourceDefinition> {
-    vec![
-        ResourceDefinition {
-            uri: "cra://session/current".to_string(),
-            description: "Current session state, loaded atlases, and context received".to_string(),
-            mime_type: "application/json".to_string(),
-        },
-        ResourceDefinition {
-            uri: "cra://trace/{session_id}".to_string(),
-            description: "TRACE audit trail for a session".to_string(),
-            mime_type: "application/x-ndjson".to_string(),
-        },
-        ResourceDefinition {
-            uri: "cra://atlas/{atlas_id}".to_string(),
-            description: "Full atlas manifest for inspection".to_string(),
-            mime_type: "application/json".to_string(),
-        },
-        ResourceDefinition {
-            uri: "cra://chain/{session_id}".to_string(),
-            description: "Chain verification status for a session".to_string(),
-            mime_type: "application/json".to_string(),
-        },
-    ]
+    RESOURCE_TABLE
+        .iter()
+        .map(|(uri, description, mime_type)| ResourceDefinition {
+            uri: (*uri).to_string(),
+            description: (*description).to_string(),
+            mime_type: (*mime_type).to_string(),
+        })
+        .collect()
 }
 
 /// Session resource content
@@ -92,3 +107,9 @@ pub struct ChainResource {
     #[serde(skip_serializing_if = "Option::is_none")]
     pub error: Option<String>,
 }
+
+/// All CRA resource definitions, built once per process
+pub fn resource_definitions() -> &'static [ResourceDefinition] {
+    static RESOURCES: OnceLock<Vec<ResourceDefinition>> = OnceLock::new();
+    RESOURCES.get_or_init(get_resource_definitions)
+}
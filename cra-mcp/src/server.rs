@@ -1,12 +1,18 @@
 //! MCP Server implementation
 
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
 use serde::{Deserialize, Serialize};
+use serde_json::value::RawValue;
 use serde_json::{json, Value};
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
 
-use crate::bootstrap::{BootstrapProtocol, BootstrapResult, BootstrapContext, GovernanceSection, ChainState, GovernanceRule, PolicySummary};
+use cra_core::TRACEEvent;
+
+use crate::bootstrap::{
+    standard_governance, BootstrapProtocol, BootstrapResult, BootstrapContext,
+    ChainState, PolicySummary,
+};
 use crate::error::{McpError, McpResult};
 use crate::session::SessionManager;
 use crate::tools::{self, ToolDefinition};
@@ -17,11 +23,9 @@ pub struct McpServer {
     /// Session manager
     session_manager: Arc<SessionManager>,
 
-    /// Server name
-    name: String,
-
-    /// Server version
-    version: String,
+    /// `initialize` response, rendered once from the server name and
+    /// version at build time
+    initialize_result: Value,
 }
 
 impl McpServer {
@@ -35,77 +39,135 @@ impl McpServer {
         let stdin = tokio::io::stdin();
         let mut stdout = tokio::io::stdout();
         let mut reader = BufReader::new(stdin);
+        // Reused serialization buffer for outgoing messages
+        let mut out = Vec::with_capacity(4096);
 
         tracing::info!("CRA MCP Server started on stdio");
 
+        // Reused input buffer. Lines are kept as raw bytes and parsed with
+        // from_slice, which checks UTF-8 only inside JSON strings instead of
+        // validating the whole line up front
+        let mut buf = Vec::with_capacity(4096);
+
         loop {
-            let mut line = String::new();
-            let bytes_read = reader.read_line(&mut line).await?;
+            buf.clear();
+            let bytes_read = reader.read_until(b'\n', &mut buf).await?;
 
             if bytes_read == 0 {
                 tracing::info!("EOF received, shutting down");
                 break;
             }
 
-            let line = line.trim();
+            let line = buf.trim_ascii();
             if line.is_empty() {
                 continue;
             }
 
-            match serde_json::from_str::<JsonRpcRequest>(line) {
+            if let Some(reply) = self.dispatch(line).await {
+                write_message(&mut stdout, &mut out, &reply).await?;
+            }
+        }
+
+        Ok(())
+    }
+
+    /// Handle one incoming message, a single request or a batch
+    ///
+    /// Returns the serialized response, or `None` when nothing is owed
+    /// (a notification, or a batch made up only of notifications).
+    pub async fn handle_message(&self, message: &str) -> Option<String> {
+        let reply = self.dispatch(message.trim().as_bytes()).await?;
+        serde_json::to_string(&reply).ok()
+    }
+
+    /// Parse and handle one message
+    async fn dispatch(&self, line: &[u8]) -> Option<Reply> {
+        // JSON-RPC batch: several independent calls in one message,
+        // answered with a single array response
+        if line.starts_with(b"[") {
+            return self.handle_batch(line).await;
+        }
+
+        let response = match serde_json::from_slice::<JsonRpcRequest>(line) {
+            // Notifications (no `id`) are run but never answered
+            Ok(request) if request.id.is_none() => {
+                self.handle_request(request).await;
+                return None;
+            }
+            Ok(request) => self.handle_request(request).await,
+            Err(e) => JsonRpcResponse::error(-32700, format!("Parse error: {}", e)),
+        };
+        Some(Reply::Single(response))
+    }
+
+    /// Handle a JSON-RPC batch
+    ///
+    /// Elements are converted one at a time, so a malformed element gets its
+    /// own -32600 error while the rest are still answered. Notifications
+    /// (no `id`) are run but get no entry, and a batch of nothing but
+    /// notifications gets no response at all.
+    async fn handle_batch(&self, line: &[u8]) -> Option<Reply> {
+        let batch = match serde_json::from_slice::<Vec<Value>>(line) {
+            Ok(batch) => batch,
+            Err(e) => {
+                return Some(Reply::Single(JsonRpcResponse::error(-32700, format!("Parse error: {}", e))));
+            }
+        };
+        if batch.is_empty() {
+            return Some(Reply::Single(JsonRpcResponse::error(
+                -32600,
+                "Invalid Request: empty batch".to_string(),
+            )));
+        }
+
+        let mut responses = Vec::with_capacity(batch.len());
+        for element in batch {
+            match serde_json::from_value::<JsonRpcRequest>(element) {
                 Ok(request) => {
+                    let is_notification = request.id.is_none();
                     let response = self.handle_request(request).await;
-                    let response_json = serde_json::to_string(&response)?;
-                    stdout.write_all(response_json.as_bytes()).await?;
-                    stdout.write_all(b"\n").await?;
-                    stdout.flush().await?;
+                    if !is_notification {
+                        responses.push(response);
+                    }
                 }
                 Err(e) => {
-                    let error_response = JsonRpcResponse {
-                        jsonrpc: "2.0".to_string(),
-                        id: None,
-                        result: None,
-                        error: Some(JsonRpcError {
-                            code: -32700,
-                            message: format!("Parse error: {}", e),
-                            data: None,
-                        }),
-                    };
-                    let response_json = serde_json::to_string(&error_response)?;
-                    stdout.write_all(response_json.as_bytes()).await?;
-                    stdout.write_all(b"\n").await?;
-                    stdout.flush().await?;
+                    responses.push(JsonRpcResponse::error(-32600, format!("Invalid Request: {}", e)));
                 }
             }
         }
 
-        Ok(())
+        if responses.is_empty() {
+            None
+        } else {
+            Some(Reply::Batch(responses))
+        }
     }
 
     /// Handle a JSON-RPC request
     async fn handle_request(&self, request: JsonRpcRequest) -> JsonRpcResponse {
-        let result = match request.method.as_str() {
+        let JsonRpcRequest { id, method, params, .. } = request;
+        let result = match method.as_str() {
             // MCP Protocol methods
-            "initialize" => self.handle_initialize(&request.params).await,
+            "initialize" => self.handle_initialize(&params).await.map(RpcResult::Value),
             "tools/list" => self.handle_list_tools().await,
-            "tools/call" => self.handle_call_tool(&request.params).await,
+            "tools/call" => self.handle_call_tool(params).await.map(RpcResult::Value),
             "resources/list" => self.handle_list_resources().await,
-            "resources/read" => self.handle_read_resource(&request.params).await,
+            "resources/read" => self.handle_read_resource(&params).await.map(RpcResult::Value),
 
             // Unknown method
-            _ => Err(McpError::Validation(format!("Unknown method: {}", request.method))),
+            _ => Err(McpError::Validation(format!("Unknown method: {}", method))),
         };
 
         match result {
             Ok(value) => JsonRpcResponse {
-                jsonrpc: "2.0".to_string(),
-                id: request.id,
+                jsonrpc: JSONRPC_VERSION,
+                id,
                 result: Some(value),
                 error: None,
             },
             Err(e) => JsonRpcResponse {
-                jsonrpc: "2.0".to_string(),
-                id: request.id,
+                jsonrpc: JSONRPC_VERSION,
+                id,
                 result: None,
                 error: Some(JsonRpcError {
                     code: e.error_code(),
@@ -118,39 +180,34 @@ impl McpServer {
 
     /// Handle initialize request
     async fn handle_initialize(&self, _params: &Option<Value>) -> McpResult<Value> {
-        Ok(json!({
-            "protocolVersion": "2024-11-05",
-            "capabilities": {
-                "tools": {},
-                "resources": {}
-            },
-            "serverInfo": {
-                "name": self.name,
-                "version": self.version
-            }
-        }))
+        Ok(self.initialize_result.clone())
     }
 
     /// Handle tools/list request
-    async fn handle_list_tools(&self) -> McpResult<Value> {
-        let tools = tools::get_tool_definitions();
-        Ok(json!({ "tools": tools }))
+    ///
+    /// The tool list never changes, so its result is encoded once and the
+    /// same bytes are written for every request.
+    async fn handle_list_tools(&self) -> McpResult<RpcResult> {
+        static ENCODED: OnceLock<Box<RawValue>> = OnceLock::new();
+        let encoded = ENCODED.get_or_init(|| encode_once(&json!({ "tools": tools::tool_definitions() })));
+        Ok(RpcResult::Encoded(encoded))
     }
 
     /// Handle tools/call request
-    async fn handle_call_tool(&self, params: &Option<Value>) -> McpResult<Value> {
-        let params = params.as_ref()
+    async fn handle_call_tool(&self, params: Option<Value>) -> McpResult<Value> {
+        let params = params
             .ok_or_else(|| McpError::Validation("Missing params".to_string()))?;
 
-        let name = params.get("name")
-            .and_then(|v| v.as_str())
+        // Decode into a typed struct so the arguments are moved out of the
+        // request rather than deep-cloned from it
+        let CallToolParams { name, arguments } = serde_json::from_value(params)?;
+
+        let name = name
             .ok_or_else(|| McpError::Validation("Missing tool name".to_string()))?;
 
-        let arguments = params.get("arguments")
-            .cloned()
-            .unwrap_or(json!({}));
+        let arguments = arguments.unwrap_or_else(|| json!({}));
 
-        let result = match name {
+        let result = match name.as_str() {
             "cra_start_session" => self.call_start_session(arguments).await?,
             "cra_end_session" => self.call_end_session(arguments).await?,
             "cra_request_context" => self.call_request_context(arguments).await?,
@@ -162,18 +219,24 @@ impl McpServer {
             _ => return Err(McpError::Validation(format!("Unknown tool: {}", name))),
         };
 
+        // Tools serialize their output straight to compact text: it is
+        // consumed by the model, where indentation only costs encoding time
+        // and tokens, and going through a Value first would walk it twice.
         Ok(json!({
             "content": [{
                 "type": "text",
-                "text": serde_json::to_string_pretty(&result)?
+                "text": result
             }]
         }))
     }
 
     /// Handle resources/list request
-    async fn handle_list_resources(&self) -> McpResult<Value> {
-        let resources = resources::get_resource_definitions();
-        Ok(json!({ "resources": resources }))
+    async fn handle_list_resources(&self) -> McpResult<RpcResult> {
+        static ENCODED: OnceLock<Box<RawValue>> = OnceLock::new();
+        let encoded = ENCODED.get_or_init(|| {
+            encode_once(&json!({ "resources": resources::resource_definitions() }))
+        });
+        Ok(RpcResult::Encoded(encoded))
     }
 
     /// Handle resources/read request
@@ -191,16 +254,16 @@ impl McpServer {
             "contents": [{
                 "uri": uri,
                 "mimeType": "application/json",
-                "text": serde_json::to_string_pretty(&content)?
+                "text": content
             }]
         }))
     }
 
-    /// Read a resource by URI
-    async fn read_resource(&self, uri: &str) -> McpResult<Value> {
+    /// Read a resource by URI, returning its JSON text
+    async fn read_resource(&self, uri: &str) -> McpResult<String> {
         if uri == "cra://session/current" {
             let session = self.session_manager.get_current_session()?;
-            Ok(json!({
+            Ok(serde_json::to_string(&json!({
                 "session_id": session.session_id,
                 "agent_id": session.agent_id,
                 "goal": session.goal,
@@ -209,17 +272,26 @@ impl McpServer {
                 "injected_contexts": session.injected_contexts,
                 "event_count": session.event_count,
                 "current_hash": session.current_hash
-            }))
+            }))?)
         } else if uri.starts_with("cra://trace/") {
             let session_id = uri.strip_prefix("cra://trace/")
                 .ok_or_else(|| McpError::Validation("Invalid trace URI".to_string()))?;
 
+            // Encode the events straight from the trace rather than first
+            // copying every event into a Value tree with json!
+            #[derive(Serialize)]
+            struct TraceResource<'a> {
+                session_id: &'a str,
+                event_count: usize,
+                events: &'a [TRACEEvent],
+            }
+
             let events = self.session_manager.get_trace(session_id)?;
-            Ok(json!({
-                "session_id": session_id,
-                "event_count": events.len(),
-                "events": events
-            }))
+            Ok(serde_json::to_string(&TraceResource {
+                session_id,
+                event_count: events.len(),
+                events: &events,
+            })?)
         } else if uri.starts_with("cra://chain/") {
             let session_id = uri.strip_prefix("cra://chain/")
                 .ok_or_else(|| McpError::Validation("Invalid chain URI".to_string()))?;
@@ -227,7 +299,7 @@ impl McpServer {
             let verification = self.session_manager.verify_chain(session_id)?;
             let session = self.session_manager.get_session(session_id)?;
 
-            Ok(json!({
+            Ok(serde_json::to_string(&json!({
                 "session_id": session_id,
                 "is_valid": verification.is_valid,
                 "event_count": verification.event_count,
@@ -235,16 +307,16 @@ impl McpServer {
                 "current_hash": session.current_hash,
                 "first_invalid_index": verification.first_invalid_index,
                 "error": verification.error_message
-            }))
+            }))?)
         } else if uri.starts_with("cra://atlas/") {
             let atlas_id = uri.strip_prefix("cra://atlas/")
                 .ok_or_else(|| McpError::Validation("Invalid atlas URI".to_string()))?;
 
             // TODO: Get full atlas manifest
-            Ok(json!({
+            Ok(serde_json::to_string(&json!({
                 "atlas_id": atlas_id,
                 "status": "not_implemented"
-            }))
+            }))?)
         } else {
             Err(McpError::Validation(format!("Unknown resource URI: {}", uri)))
         }
@@ -252,7 +324,7 @@ impl McpServer {
 
     // Tool implementations
 
-    async fn call_start_session(&self, args: Value) -> McpResult<Value> {
+    async fn call_start_session(&self, args: Value) -> McpResult<String> {
         let input: tools::session::StartSessionInput = serde_json::from_value(args)?;
 
         let session = self.session_manager.start_session(
@@ -261,95 +333,94 @@ impl McpServer {
             Some(input.atlas_hints),
         )?;
 
-        Ok(json!({
+        Ok(serde_json::to_string(&json!({
             "session_id": session.session_id,
             "active_atlases": session.active_atlases,
             "initial_context": [],
             "genesis_hash": session.genesis_hash
-        }))
+        }))?)
     }
 
-    async fn call_end_session(&self, args: Value) -> McpResult<Value> {
+    async fn call_end_session(&self, args: Value) -> McpResult<String> {
         let input: tools::session::EndSessionInput = serde_json::from_value(args)?;
 
-        let session = self.session_manager.get_current_session()?;
-        let verification = self.session_manager.verify_chain(&session.session_id)?;
-        let ended_session = self.session_manager.end_session(&session.session_id, input.summary)?;
+        let session_id = self.session_manager.current_session_id()?;
+        let verification = self.session_manager.verify_chain(&session_id)?;
+        let ended_session = self.session_manager.end_session(&session_id, input.summary)?;
 
-        Ok(json!({
+        Ok(serde_json::to_string(&json!({
             "session_id": ended_session.session_id,
             "duration_ms": ended_session.duration_ms(),
             "event_count": ended_session.event_count,
             "chain_verified": verification.is_valid,
             "final_hash": ended_session.current_hash
-        }))
+        }))?)
     }
 
-    async fn call_request_context(&self, args: Value) -> McpResult<Value> {
+    async fn call_request_context(&self, args: Value) -> McpResult<String> {
         let input: tools::context::RequestContextInput = serde_json::from_value(args)?;
 
-        let session = self.session_manager.get_current_session()?;
+        let session_id = self.session_manager.current_session_id()?;
         let matched = self.session_manager.request_context(
-            &session.session_id,
+            &session_id,
             &input.need,
             Some(input.hints),
         )?;
 
-        Ok(json!({
+        Ok(serde_json::to_string(&json!({
             "matched_contexts": matched,
             "trace_id": uuid::Uuid::new_v4().to_string()
-        }))
+        }))?)
     }
 
-    async fn call_search_contexts(&self, args: Value) -> McpResult<Value> {
+    async fn call_search_contexts(&self, args: Value) -> McpResult<String> {
         let input: tools::context::SearchContextsInput = serde_json::from_value(args)?;
 
         // TODO: Implement context search
-        Ok(json!({
-            "results": [],
-            "total_count": 0
-        }))
+        Ok(EMPTY_SEARCH_RESULT.to_string())
     }
 
-    async fn call_list_atlases(&self, _args: Value) -> McpResult<Value> {
+    async fn call_list_atlases(&self, _args: Value) -> McpResult<String> {
         let atlases = self.session_manager.list_atlases()?;
 
-        Ok(json!({
+        Ok(serde_json::to_string(&json!({
             "atlases": atlases
-        }))
+        }))?)
     }
 
-    async fn call_report_action(&self, args: Value) -> McpResult<Value> {
+    async fn call_report_action(&self, args: Value) -> McpResult<String> {
         let input: tools::action::ReportActionInput = serde_json::from_value(args)?;
 
-        let session = self.session_manager.get_current_session()?;
+        let session_id = self.session_manager.current_session_id()?;
         let report = self.session_manager.report_action(
-            &session.session_id,
+            &session_id,
             &input.action,
             input.params,
         )?;
 
-        Ok(json!(report))
+        Ok(serde_json::to_string(&report)?)
     }
 
-    async fn call_feedback(&self, args: Value) -> McpResult<Value> {
+    async fn call_feedback(&self, args: Value) -> McpResult<String> {
         let input: tools::feedback::FeedbackInput = serde_json::from_value(args)?;
 
-        let session = self.session_manager.get_current_session()?;
+        let session_id = self.session_manager.current_session_id()?;
         self.session_manager.submit_feedback(
-            &session.session_id,
+            &session_id,
             &input.context_id,
             input.helpful,
             input.reason,
         )?;
 
-        Ok(json!({
-            "recorded": true,
-            "trace_id": uuid::Uuid::new_v4().to_string()
-        }))
+        // A hyphenated UUID never needs JSON escaping, so splice it into
+        // the pre-rendered body instead of building and encoding a Value.
+        Ok(format!(
+            r#"{{"recorded":true,"trace_id":"{}"}}"#,
+            uuid::Uuid::new_v4()
+        ))
     }
 
-    async fn call_bootstrap(&self, args: Value) -> McpResult<Value> {
+    async fn call_bootstrap(&self, args: Value) -> McpResult<String> {
         let input: tools::session::BootstrapInput = serde_json::from_value(args)?;
 
         // Start session
@@ -363,31 +434,7 @@ impl McpServer {
         let result = BootstrapResult {
             session_id: session.session_id.clone(),
             genesis_hash: session.genesis_hash.clone(),
-            governance: GovernanceSection {
-                rules: vec![
-                    GovernanceRule {
-                        rule_id: "trace.required".to_string(),
-                        description: "All actions must be reported through cra_report_action".to_string(),
-                        enforcement: "hard".to_string(),
-                    },
-                    GovernanceRule {
-                        rule_id: "context.must_request".to_string(),
-                        description: "Request context before making domain-specific decisions".to_string(),
-                        enforcement: "soft".to_string(),
-                    },
-                    GovernanceRule {
-                        rule_id: "feedback.expected".to_string(),
-                        description: "Provide feedback on context usefulness".to_string(),
-                        enforcement: "soft".to_string(),
-                    },
-                ],
-                policies: Vec::new(),
-                you_must: vec![
-                    "Report all significant actions via cra_report_action".to_string(),
-                    "Request context when unsure about domain specifics".to_string(),
-                    "Provide feedback on context usefulness".to_string(),
-                ],
-            },
+            governance: standard_governance().clone(),
             context: Vec::new(), // Would be populated from atlases
             chain_state: ChainState {
                 current_hash: session.current_hash.clone(),
@@ -398,10 +445,43 @@ impl McpServer {
             message: "Governance established. Context internalized. You may begin.".to_string(),
         };
 
-        Ok(json!(result))
+        Ok(serde_json::to_string(&result)?)
     }
 }
 
+/// Render the `initialize` response for a server name and version
+fn initialize_result(name: &str, version: &str) -> Value {
+    json!({
+        "protocolVersion": "2024-11-05",
+        "capabilities": {
+            "tools": {},
+            "resources": {}
+        },
+        "serverInfo": {
+            "name": name,
+            "version": version
+        }
+    })
+}
+
+/// Write one newline-delimited JSON-RPC message
+///
+/// The message and its terminator are serialized into `buf` and handed to
+/// stdout in a single write, so each response costs one trip through
+/// tokio's blocking stdout writer rather than three.
+async fn write_message<W: AsyncWriteExt + Unpin, T: Serialize>(
+    writer: &mut W,
+    buf: &mut Vec<u8>,
+    response: &T,
+) -> McpResult<()> {
+    buf.clear();
+    serde_json::to_writer(&mut *buf, response)?;
+    buf.push(b'\n');
+    writer.write_all(buf).await?;
+    writer.flush().await?;
+    Ok(())
+}
+
 /// Builder for McpServer
 pub struct McpServerBuilder {
     atlases_dir: Option<String>,
@@ -429,18 +509,23 @@ impl McpServerBuilder {
     }
 
     pub async fn build(self) -> McpResult<McpServer> {
-        let session_manager = if let Some(dir) = &self.atlases_dir {
-            let manager = SessionManager::new().with_atlases_dir(dir);
-            manager.load_atlases()?;
-            manager
+        // Atlas loading is blocking file I/O plus JSON parsing; run it on the
+        // blocking pool so it doesn't stall the runtime's worker threads.
+        let session_manager = if let Some(dir) = self.atlases_dir {
+            tokio::task::spawn_blocking(move || -> McpResult<SessionManager> {
+                let manager = SessionManager::new().with_atlases_dir(&dir);
+                manager.load_atlases()?;
+                Ok(manager)
+            })
+            .await
+            .map_err(|e| McpError::Internal(format!("Atlas loading task failed: {}", e)))??
         } else {
             SessionManager::new()
         };
 
         Ok(McpServer {
             session_manager: Arc::new(session_manager),
-            name: self.name,
-            version: self.version,
+            initialize_result: initialize_result(&self.name, &self.version),
         })
     }
 }
@@ -463,17 +548,69 @@ struct JsonRpcRequest {
     params: Option<Value>,
 }
 
-#[derive(Debug, Clone, Serialize, Deserialize)]
+/// Parameters of a `tools/call` request
+#[derive(Debug, Deserialize)]
+struct CallToolParams {
+    #[serde(default)]
+    name: Option<String>,
+    #[serde(default)]
+    arguments: Option<Value>,
+}
+
+/// Protocol version stamped on every response
+const JSONRPC_VERSION: &str = "2.0";
+
+/// Pre-rendered `cra_search_contexts` result while search is unimplemented
+const EMPTY_SEARCH_RESULT: &str = r#"{"results":[],"total_count":0}"#;
+
+#[derive(Debug, Clone, Serialize)]
 struct JsonRpcResponse {
-    jsonrpc: String,
+    jsonrpc: &'static str,
     #[serde(skip_serializing_if = "Option::is_none")]
     id: Option<Value>,
     #[serde(skip_serializing_if = "Option::is_none")]
-    result: Option<Value>,
+    result: Option<RpcResult>,
     #[serde(skip_serializing_if = "Option::is_none")]
     error: Option<JsonRpcError>,
 }
 
+/// What is sent back for one incoming message
+#[derive(Debug, Serialize)]
+#[serde(untagged)]
+enum Reply {
+    Single(JsonRpcResponse),
+    Batch(Vec<JsonRpcResponse>),
+}
+
+/// Result payload of a response: built per request, or encoded up front
+#[derive(Debug, Clone, Serialize)]
+#[serde(untagged)]
+enum RpcResult {
+    Value(Value),
+    Encoded(&'static RawValue),
+}
+
+/// Encode a static result for reuse across requests
+fn encode_once(value: &Value) -> Box<RawValue> {
+    serde_json::value::to_raw_value(value).expect("a JSON value always encodes")
+}
+
+impl JsonRpcResponse {
+    /// Error response not tied to a request ID (parse / invalid request)
+    fn error(code: i32, message: String) -> Self {
+        Self {
+            jsonrpc: JSONRPC_VERSION,
+            id: None,
+            result: None,
+            error: Some(JsonRpcError {
+                code,
+                message,
+                data: None,
+            }),
+        }
+    }
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 struct JsonRpcError {
     code: i32,
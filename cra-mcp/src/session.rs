@@ -1,6 +1,7 @@
 //! Session management for MCP server
 
 use std::collections::HashMap;
+use std::io::Read;
 use std::sync::{Arc, RwLock};
 
 use chrono::{DateTime, Utc};
@@ -126,22 +127,24 @@ impl SessionManager {
         let entries = std::fs::read_dir(dir)
             .map_err(|e| McpError::Io(e))?;
 
+        // One resolver lock and one read buffer for the whole directory,
+        // rather than a fresh lock and allocation per atlas file
+        let mut resolver = self.resolver.write()
+            .map_err(|_| McpError::Internal("Lock poisoned".to_string()))?;
+        let mut content = Vec::new();
+
         for entry in entries.flatten() {
             let path = entry.path();
             if path.extension().map_or(false, |ext| ext == "json") {
-                let content = std::fs::read_to_string(&path)
+                content.clear();
+                std::fs::File::open(&path)
+                    .and_then(|mut file| file.read_to_end(&mut content))
                     .map_err(|e| McpError::Io(e))?;
 
-                let manifest: AtlasManifest = serde_json::from_str(&content)
+                let manifest: AtlasManifest = serde_json::from_slice(&content)
                     .map_err(|e| McpError::Atlas(format!("Failed to parse {}: {}", path.display(), e)))?;
 
-                let atlas_id = manifest.atlas_id.clone();
-
-                let mut resolver = self.resolver.write()
-                    .map_err(|_| McpError::Internal("Lock poisoned".to_string()))?;
-
-                resolver.load_atlas(manifest)?;
-                loaded.push(atlas_id);
+                loaded.push(resolver.load_atlas(manifest)?);
             }
         }
 
@@ -207,6 +210,20 @@ impl SessionManager {
             .ok_or_else(|| McpError::NoActiveSession)
     }
 
+    /// Get the ID of the current session (most recent)
+    ///
+    /// Same session as [`get_current_session`](Self::get_current_session),
+    /// without cloning the whole record when only its ID is needed.
+    pub fn current_session_id(&self) -> McpResult<String> {
+        let sessions = self.sessions.read()
+            .map_err(|_| McpError::Internal("Lock poisoned".to_string()))?;
+
+        sessions.values()
+            .max_by_key(|s| s.started_at)
+            .map(|s| s.session_id.clone())
+            .ok_or_else(|| McpError::NoActiveSession)
+    }
+
     /// End a session
     pub fn end_session(&self, session_id: &str, summary: Option<String>) -> McpResult<Session> {
         // Get final session state
@@ -242,12 +259,13 @@ impl SessionManager {
 
         let resolution = resolver.resolve(&request)?;
 
-        // Convert context blocks to MatchedContext
-        let matched: Vec<MatchedContext> = resolution.context_blocks.iter().map(|block| {
+        // Convert context blocks to MatchedContext, moving their content out
+        // of the resolution rather than copying it
+        let matched: Vec<MatchedContext> = resolution.context_blocks.into_iter().map(|block| {
             MatchedContext {
-                context_id: block.block_id.clone(),
-                name: block.name.clone(),
-                content: block.content.clone(),
+                context_id: block.block_id,
+                name: block.name,
+                content: block.content,
                 priority: block.priority,
                 match_score: 1.0, // Perfect match since resolver already filtered
             }
@@ -258,15 +276,24 @@ impl SessionManager {
 
     /// Report an action for audit trail
     pub fn report_action(&self, session_id: &str, action: &str, params: serde_json::Value) -> McpResult<ActionReport> {
+        // Only the agent ID is needed, so read it without cloning the
+        // session, and before taking the resolver lock
+        let agent_id = {
+            let sessions = self.sessions.read()
+                .map_err(|_| McpError::Internal("Lock poisoned".to_string()))?;
+
+            sessions.get(session_id)
+                .map(|s| s.agent_id.clone())
+                .ok_or_else(|| McpError::InvalidSession(session_id.to_string()))?
+        };
+
         let mut resolver = self.resolver.write()
             .map_err(|_| McpError::Internal("Lock poisoned".to_string()))?;
 
         // Create a CARP request to check if action is allowed
-        let session = self.get_session(session_id)?;
-
         let request = cra_core::CARPRequest::new(
             session_id.to_string(),
-            session.agent_id.clone(),
+            agent_id,
             format!("Execute action: {}", action),
         );
 
@@ -276,14 +303,14 @@ impl SessionManager {
         let allowed = resolution.allowed_actions.iter()
             .any(|a| a.action_id == action || action.starts_with(&a.action_id));
 
-        let denied = resolution.denied_actions.iter()
+        let denied = resolution.denied_actions.into_iter()
             .find(|d| d.action_id == action || action.starts_with(&d.action_id));
 
         if let Some(denied_action) = denied {
             return Ok(ActionReport {
                 decision: "denied".to_string(),
                 trace_id: resolution.trace_id,
-                reason: Some(denied_action.reason.clone()),
+                reason: Some(denied_action.reason),
                 policy_notes: vec![format!("Denied by policy: {}", denied_action.policy_id)],
                 alternatives: Vec::new(),
             });
@@ -7,6 +7,8 @@ pub mod context;
 pub mod action;
 pub mod feedback;
 
+use std::sync::OnceLock;
+
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 
@@ -37,3 +39,12 @@ pub fn get_tool_definitions() -> Vec<ToolDefinition> {
         session::bootstrap_tool(),
     ]
 }
+
+/// All CRA tool definitions, built once per process
+///
+/// The definitions are static, so `tools/list` reuses these rather than
+/// rebuilding every schema on each request.
+pub fn tool_definitions() -> &'static [ToolDefinition] {
+    static TOOLS: OnceLock<Vec<ToolDefinition>> = OnceLock::new();
+    TOOLS.get_or_init(get_tool_definitions)
+}
@@ -348,3 +348,14 @@ fn test_bootstrap_message_serialization() {
         _ => panic!("Wrong message type"),
     }
 }
+
+#[test]
+fn test_standard_governance_built_once() {
+    let first = standard_governance();
+    let second = standard_governance();
+
+    assert!(std::ptr::eq(first, second));
+    assert_eq!(first.rules.len(), STANDARD_GOVERNANCE_RULES.len());
+    assert_eq!(first.you_must.len(), STANDARD_OBLIGATIONS.len());
+    assert!(first.policies.is_empty());
+}
@@ -0,0 +1,101 @@
+//! JSON-RPC message handling tests
+
+use cra_mcp::McpServer;
+use serde_json::Value;
+
+async fn reply(server: &McpServer, message: &str) -> Option<Value> {
+    server
+        .handle_message(message)
+        .await
+        .map(|reply| serde_json::from_str(&reply).unwrap())
+}
+
+#[tokio::test]
+async fn test_single_request() {
+    let server = McpServer::builder().build().await.unwrap();
+
+    let response = reply(&server, r#"{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}"#)
+        .await
+        .unwrap();
+    assert_eq!(response["id"], 1);
+    assert!(response["result"].is_object());
+
+    let response = reply(&server, "{not json").await.unwrap();
+    assert_eq!(response["error"]["code"], -32700);
+}
+
+#[tokio::test]
+async fn test_single_notification() {
+    let server = McpServer::builder().build().await.unwrap();
+
+    // Notifications are never answered, even when the method is unknown
+    let response = reply(&server, r#"{"jsonrpc": "2.0", "method": "notifications/initialized"}"#).await;
+    assert!(response.is_none());
+    let response = reply(&server, r#"{"jsonrpc": "2.0", "method": "tools/list"}"#).await;
+    assert!(response.is_none());
+}
+
+#[tokio::test]
+async fn test_batch_with_invalid_element() {
+    let server = McpServer::builder().build().await.unwrap();
+
+    let response = reply(
+        &server,
+        r#"[
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+            {"jsonrpc": "2.0", "id": 2},
+            42,
+            {"jsonrpc": "2.0", "id": 3, "method": "resources/list"}
+        ]"#,
+    )
+    .await
+    .unwrap();
+
+    // Valid elements are still answered; each malformed one gets -32600
+    let responses = response.as_array().unwrap();
+    assert_eq!(responses.len(), 4);
+    assert_eq!(responses[0]["id"], 1);
+    assert!(responses[0]["result"].is_object());
+    assert_eq!(responses[1]["error"]["code"], -32600);
+    assert_eq!(responses[2]["error"]["code"], -32600);
+    assert_eq!(responses[3]["id"], 3);
+    assert!(responses[3]["result"].is_object());
+}
+
+#[tokio::test]
+async fn test_batch_notifications() {
+    let server = McpServer::builder().build().await.unwrap();
+
+    // Notifications get no entry in the batch response
+    let response = reply(
+        &server,
+        r#"[
+            {"jsonrpc": "2.0", "method": "tools/list"},
+            {"jsonrpc": "2.0", "id": "a", "method": "tools/list"}
+        ]"#,
+    )
+    .await
+    .unwrap();
+    let responses = response.as_array().unwrap();
+    assert_eq!(responses.len(), 1);
+    assert_eq!(responses[0]["id"], "a");
+
+    // A batch of only notifications produces no output at all
+    let response = reply(
+        &server,
+        r#"[{"jsonrpc": "2.0", "method": "tools/list"}, {"jsonrpc": "2.0", "method": "resources/list"}]"#,
+    )
+    .await;
+    assert!(response.is_none());
+}
+
+#[tokio::test]
+async fn test_batch_errors() {
+    let server = McpServer::builder().build().await.unwrap();
+
+    let response = reply(&server, "[]").await.unwrap();
+    assert_eq!(response["error"]["code"], -32600);
+
+    let response = reply(&server, r#"[{"jsonrpc": "2.0", "method""#).await.unwrap();
+    assert_eq!(response["error"]["code"], -32700);
+}
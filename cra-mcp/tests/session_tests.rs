@@ -113,6 +113,7 @@ fn test_session_manager_get_current_session() {
     // No session should be current initially
     let result = manager.get_current_session();
     assert!(result.is_err());
+    assert!(manager.current_session_id().is_err());
 
     // Start a session
     let session1 = manager.start_session(
@@ -134,6 +135,7 @@ fn test_session_manager_get_current_session() {
 
     let current = manager.get_current_session().unwrap();
     assert_eq!(current.session_id, session2.session_id);
+    assert_eq!(manager.current_session_id().unwrap(), session2.session_id);
 }
 
 #[test]
@@ -0,0 +1,14 @@
+//! Tool definition tests
+
+use cra_mcp::tools::{get_tool_definitions, tool_definitions};
+
+#[test]
+fn test_tool_definitions_cached() {
+    let first = tool_definitions();
+    let second = tool_definitions();
+
+    // Built once and shared
+    assert!(std::ptr::eq(first, second));
+    assert_eq!(first.len(), get_tool_definitions().len());
+    assert!(first.iter().any(|t| t.name == "cra_bootstrap"));
+}
@@ -155,17 +155,9 @@ impl Resolver {
     /// Get the trace for a session as JSONL
     #[napi]
     pub fn get_trace(&self, session_id: String) -> Result<String> {
-        let events = self
-            .inner
-            .get_trace(&session_id)
-            .map_err(|e| Error::new(Status::GenericFailure, format!("Failed to get trace: {}", e)))?;
-
-        let lines: Vec<String> = events
-            .iter()
-            .filter_map(|e| serde_json::to_string(e).ok())
-            .collect();
-
-        Ok(lines.join("\n"))
+        self.inner
+            .export_trace_jsonl(&session_id)
+            .map_err(|e| Error::new(Status::GenericFailure, format!("Failed to get trace: {}", e)))
     }
 
     /// Verify the hash chain for a session
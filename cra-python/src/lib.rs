@@ -96,13 +96,13 @@ impl AllowedAction {
     }
 }
 
-impl From<&CoreAllowedAction> for AllowedAction {
-    fn from(action: &CoreAllowedAction) -> Self {
+impl From<CoreAllowedAction> for AllowedAction {
+    fn from(action: CoreAllowedAction) -> Self {
         AllowedAction {
-            action_id: action.action_id.clone(),
-            name: action.name.clone(),
-            description: action.description.clone(),
-            risk_tier: action.risk_tier.clone(),
+            action_id: action.action_id,
+            name: action.name,
+            description: action.description,
+            risk_tier: action.risk_tier,
             parameters_schema: Some(serde_json::to_string(&action.parameters_schema).unwrap_or_default()),
         }
     }
@@ -127,12 +127,12 @@ impl DeniedAction {
     }
 }
 
-impl From<&CoreDeniedAction> for DeniedAction {
-    fn from(action: &CoreDeniedAction) -> Self {
+impl From<CoreDeniedAction> for DeniedAction {
+    fn from(action: CoreDeniedAction) -> Self {
         DeniedAction {
-            action_id: action.action_id.clone(),
-            policy_id: action.policy_id.clone(),
-            reason: action.reason.clone(),
+            action_id: action.action_id,
+            policy_id: action.policy_id,
+            reason: action.reason,
         }
     }
 }
@@ -204,14 +204,16 @@ impl CARPResolution {
 }
 
 impl From<CoreCARPResolution> for CARPResolution {
+    /// Moves the core resolution's strings into the Python objects instead
+    /// of copying them; the core value is dropped right after anyway.
     fn from(res: CoreCARPResolution) -> Self {
         CARPResolution {
             resolution_id: res.trace_id.clone(),  // Use trace_id as resolution_id
             session_id: res.session_id,
             trace_id: res.trace_id,
             decision: res.decision.to_string(),
-            allowed_actions: res.allowed_actions.iter().map(AllowedAction::from).collect(),
-            denied_actions: res.denied_actions.iter().map(DeniedAction::from).collect(),
+            allowed_actions: res.allowed_actions.into_iter().map(AllowedAction::from).collect(),
+            denied_actions: res.denied_actions.into_iter().map(DeniedAction::from).collect(),
             ttl_seconds: res.ttl_seconds,
         }
     }
@@ -451,19 +453,47 @@ impl Resolver {
             .map_err(|e| PyRuntimeError::new_err(format!("Failed to serialize: {}", e)))
     }
 
-    /// Get the trace for a session as JSONL string
-    fn get_trace(&self, session_id: &str) -> PyResult<String> {
-        let events = self
+    /// Resolve a CARP request and execute one of its actions in one call
+    ///
+    /// Saves a separate `resolve()` / `execute()` round trip across the FFI
+    /// boundary. Returns `(resolution, result_json)`; a denied action fails
+    /// and is recorded in the trace just as `execute()` records it.
+    fn resolve_and_execute(
+        &mut self,
+        session_id: &str,
+        agent_id: &str,
+        goal: &str,
+        action_id: &str,
+        parameters_json: Option<&str>,
+    ) -> PyResult<(CARPResolution, String)> {
+        let request = CoreCARPRequest::new(
+            session_id.to_string(),
+            agent_id.to_string(),
+            goal.to_string(),
+        );
+
+        let params: serde_json::Value = match parameters_json {
+            Some(json) => serde_json::from_str(json)
+                .map_err(|e| PyValueError::new_err(format!("Invalid parameters JSON: {}", e)))?,
+            None => serde_json::json!({}),
+        };
+
+        let (resolution, result) = self
             .inner
-            .get_trace(session_id)
-            .map_err(|e| PyRuntimeError::new_err(format!("Failed to get trace: {}", e)))?;
+            .resolve_and_execute(&request, action_id, params)
+            .map_err(|e| PyRuntimeError::new_err(format!("Failed to execute: {}", e)))?;
 
-        let lines: Vec<String> = events
-            .iter()
-            .filter_map(|e| serde_json::to_string(e).ok())
-            .collect();
+        let result = serde_json::to_string(&result)
+            .map_err(|e| PyRuntimeError::new_err(format!("Failed to serialize: {}", e)))?;
+
+        Ok((CARPResolution::from(resolution), result))
+    }
 
-        Ok(lines.join("\n"))
+    /// Get the trace for a session as JSONL string
+    fn get_trace(&self, session_id: &str) -> PyResult<String> {
+        self.inner
+            .export_trace_jsonl(session_id)
+            .map_err(|e| PyRuntimeError::new_err(format!("Failed to get trace: {}", e)))
     }
 
     /// Get the trace for a session as a list of TRACEEvent objects
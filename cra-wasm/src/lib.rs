@@ -182,17 +182,9 @@ impl Resolver {
     /// Get the trace for a session as JSONL
     #[wasm_bindgen]
     pub fn get_trace(&self, session_id: &str) -> Result<String, JsError> {
-        let events = self
-            .inner
-            .get_trace(session_id)
-            .map_err(|e| JsError::new(&format!("Failed to get trace: {}", e)))?;
-
-        let lines: Vec<String> = events
-            .iter()
-            .filter_map(|e| serde_json::to_string(e).ok())
-            .collect();
-
-        Ok(lines.join("\n"))
+        self.inner
+            .export_trace_jsonl(session_id)
+            .map_err(|e| JsError::new(&format!("Failed to get trace: {}", e)))
     }
 
     /// Verify the hash chain for a session
@@ -1,13 +1,22 @@
 //! Context cache for avoiding redundant fetches
 
 use std::collections::HashMap;
+use std::sync::Arc;
 use std::sync::atomic::{AtomicU64, Ordering};
 
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
-use tokio::sync::RwLock;
+use tokio::sync::{OnceCell, RwLock};
 
 use crate::config::CacheConfig;
+use crate::error::WrapperError;
+use crate::ContextBlock;
+
+/// Shared slot for a context request that is currently on the wire
+///
+/// Holds the outcome either way, so callers waiting on a failed request
+/// get its error instead of each going back to CRA.
+pub(crate) type InflightRequest = Arc<OnceCell<Result<Vec<ContextBlock>, WrapperError>>>;
 
 /// A cached context block
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -41,6 +50,9 @@ pub struct CacheStats {
     /// Number of entries in cache
     pub entry_count: usize,
 
+    /// Number of memoized requests and decisions
+    pub memo_count: usize,
+
     /// Total cache hits
     pub hits: u64,
 
@@ -54,6 +66,54 @@ pub struct CacheStats {
     pub evictions: u64,
 }
 
+/// Memoized context request: the context IDs a lookup resolved to
+#[derive(Debug, Clone)]
+struct RequestMemo {
+    context_ids: Vec<String>,
+    expires_at: DateTime<Utc>,
+}
+
+/// Memoized action decision from CRA
+#[derive(Debug, Clone)]
+struct DecisionMemo {
+    decision: String,
+    reason: Option<String>,
+    expires_at: DateTime<Utc>,
+}
+
+/// Build the memo key for a context request
+///
+/// Each field is written with its byte length in front, so the key is an
+/// unambiguous encoding: distinct (session, need, hints) tuples always
+/// produce distinct keys, whatever characters the fields contain.
+pub fn request_key(session_id: &str, need: &str, hints: Option<&[String]>) -> String {
+    use std::fmt::Write;
+
+    let hints = hints.unwrap_or_default();
+    let mut key = String::with_capacity(session_id.len() + need.len() + 8 * (hints.len() + 2));
+    for field in [session_id, need].into_iter().chain(hints.iter().map(String::as_str)) {
+        let _ = write!(key, "{}:", field.len());
+        key.push_str(field);
+    }
+    key
+}
+
+/// Build the memo key for an action decision
+///
+/// Covers the action and its parameters in the same length-prefixed form
+/// as [`request_key`], so a decision is only reused for an identical call.
+pub fn decision_key(action: &str, params: &serde_json::Value) -> String {
+    use std::fmt::Write;
+
+    let params = params.to_string();
+    let mut key = String::with_capacity(action.len() + params.len() + 16);
+    for field in [action, params.as_str()] {
+        let _ = write!(key, "{}:", field.len());
+        key.push_str(field);
+    }
+    key
+}
+
 /// Context cache
 pub struct ContextCache {
     /// Cache configuration
@@ -62,6 +122,15 @@ pub struct ContextCache {
     /// Cached contexts by ID
     entries: RwLock<HashMap<String, CachedContext>>,
 
+    /// Memoized request lookups by request key
+    requests: RwLock<HashMap<String, RequestMemo>>,
+
+    /// Context requests currently being fetched, by request key
+    inflight: RwLock<HashMap<String, InflightRequest>>,
+
+    /// Memoized action decisions, by session ID then decision key
+    decisions: RwLock<HashMap<String, HashMap<String, DecisionMemo>>>,
+
     /// Statistics
     hits: AtomicU64,
     misses: AtomicU64,
@@ -74,6 +143,9 @@ impl ContextCache {
         Self {
             config,
             entries: RwLock::new(HashMap::new()),
+            requests: RwLock::new(HashMap::new()),
+            inflight: RwLock::new(HashMap::new()),
+            decisions: RwLock::new(HashMap::new()),
             hits: AtomicU64::new(0),
             misses: AtomicU64::new(0),
             evictions: AtomicU64::new(0),
@@ -123,6 +195,166 @@ impl ContextCache {
         entries.insert(key.to_string(), context);
     }
 
+    /// Look up a memoized context request
+    ///
+    /// Returns the cached contexts only if the memo is still live and every
+    /// context it refers to is still cached; otherwise the caller should go
+    /// back to CRA.
+    pub async fn get_request(&self, key: &str) -> Option<Vec<CachedContext>> {
+        if !self.config.enabled {
+            self.misses.fetch_add(1, Ordering::SeqCst);
+            return None;
+        }
+
+        let context_ids = {
+            let requests = self.requests.read().await;
+            match requests.get(key) {
+                Some(memo) if Utc::now() <= memo.expires_at => memo.context_ids.clone(),
+                _ => {
+                    self.misses.fetch_add(1, Ordering::SeqCst);
+                    return None;
+                }
+            }
+        };
+
+        let entries = self.entries.read().await;
+        let contexts: Option<Vec<CachedContext>> = context_ids
+            .iter()
+            .map(|id| entries.get(id).filter(|ctx| !ctx.is_expired()).cloned())
+            .collect();
+
+        match contexts {
+            Some(contexts) => {
+                self.hits.fetch_add(1, Ordering::SeqCst);
+                Some(contexts)
+            }
+            None => {
+                self.misses.fetch_add(1, Ordering::SeqCst);
+                None
+            }
+        }
+    }
+
+    /// Memoize the context IDs a request resolved to
+    pub async fn set_request(&self, key: &str, context_ids: Vec<String>) {
+        if !self.config.enabled {
+            return;
+        }
+
+        let expires_at = Utc::now() + chrono::Duration::seconds(self.config.default_ttl_seconds as i64);
+        let mut requests = self.requests.write().await;
+
+        // Memos share one TTL, so the soonest to expire is the oldest
+        if requests.len() >= self.config.max_entries && !requests.contains_key(key) {
+            if let Some(oldest_key) = requests.iter()
+                .min_by_key(|(_, memo)| memo.expires_at)
+                .map(|(k, _)| k.clone())
+            {
+                requests.remove(&oldest_key);
+            }
+        }
+
+        requests.insert(key.to_string(), RequestMemo { context_ids, expires_at });
+    }
+
+    /// Join or open the in-flight slot for a request key
+    ///
+    /// Concurrent callers asking for the same key get the same slot, so
+    /// only the first of them goes to CRA and the rest await its result.
+    pub(crate) async fn inflight(&self, key: &str) -> InflightRequest {
+        let mut inflight = self.inflight.write().await;
+        Arc::clone(inflight.entry(key.to_string()).or_default())
+    }
+
+    /// Release an in-flight slot once its request has completed
+    ///
+    /// Only removes the entry if it is still `slot`, so a late caller never
+    /// drops a newer request's slot.
+    pub(crate) async fn release_inflight(&self, key: &str, slot: &InflightRequest) {
+        let mut inflight = self.inflight.write().await;
+        if inflight.get(key).is_some_and(|current| Arc::ptr_eq(current, slot)) {
+            inflight.remove(key);
+        }
+    }
+
+    /// Drop all memoized requests
+    pub async fn clear_requests(&self) {
+        self.requests.write().await.clear();
+    }
+
+    /// Look up a live memoized decision for an action call in a session
+    ///
+    /// Returns the decision string and reason CRA gave for the same action
+    /// with the same parameters. Always misses when `decision_ttl_seconds`
+    /// is 0.
+    pub async fn get_decision(
+        &self,
+        session_id: &str,
+        action: &str,
+        params: &serde_json::Value,
+    ) -> Option<(String, Option<String>)> {
+        if !self.config.enabled || self.config.decision_ttl_seconds == 0 {
+            return None;
+        }
+
+        let decisions = self.decisions.read().await;
+        decisions
+            .get(session_id)?
+            .get(&decision_key(action, params))
+            .filter(|memo| Utc::now() <= memo.expires_at)
+            .map(|memo| (memo.decision.clone(), memo.reason.clone()))
+    }
+
+    /// Memoize the decision CRA gave for an action call in a session
+    pub async fn set_decision(
+        &self,
+        session_id: &str,
+        action: &str,
+        params: &serde_json::Value,
+        decision: &str,
+        reason: Option<&str>,
+    ) {
+        if !self.config.enabled || self.config.decision_ttl_seconds == 0 {
+            return;
+        }
+
+        let key = decision_key(action, params);
+        let expires_at = Utc::now() + chrono::Duration::seconds(self.config.decision_ttl_seconds as i64);
+        let mut decisions = self.decisions.write().await;
+
+        // Cap the memos across all sessions, dropping the oldest first
+        let is_new = !decisions.get(session_id).is_some_and(|memos| memos.contains_key(&key));
+        let count: usize = decisions.values().map(HashMap::len).sum();
+        if is_new && count >= self.config.max_entries {
+            let oldest = decisions.iter()
+                .flat_map(|(session, memos)| memos.iter().map(move |(k, memo)| (session, k, memo.expires_at)))
+                .min_by_key(|(_, _, expires_at)| *expires_at)
+                .map(|(session, k, _)| (session.clone(), k.clone()));
+            if let Some((session, k)) = oldest {
+                if let Some(memos) = decisions.get_mut(&session) {
+                    memos.remove(&k);
+                    if memos.is_empty() {
+                        decisions.remove(&session);
+                    }
+                }
+            }
+        }
+
+        decisions
+            .entry(session_id.to_string())
+            .or_default()
+            .insert(key, DecisionMemo {
+                decision: decision.to_string(),
+                reason: reason.map(str::to_string),
+                expires_at,
+            });
+    }
+
+    /// Drop every memoized decision for a session
+    pub async fn invalidate_session(&self, session_id: &str) {
+        self.decisions.write().await.remove(session_id);
+    }
+
     /// Invalidate a cache entry
     pub async fn invalidate(&self, key: &str) {
         let mut entries = self.entries.write().await;
@@ -133,17 +365,22 @@ impl ContextCache {
     pub async fn clear(&self) {
         let mut entries = self.entries.write().await;
         entries.clear();
+        self.requests.write().await.clear();
+        self.decisions.write().await.clear();
     }
 
     /// Get cache statistics
     pub async fn stats(&self) -> CacheStats {
         let entry_count = self.entries.read().await.len();
+        let memo_count = self.requests.read().await.len()
+            + self.decisions.read().await.values().map(HashMap::len).sum::<usize>();
         let hits = self.hits.load(Ordering::SeqCst);
         let misses = self.misses.load(Ordering::SeqCst);
         let total = hits + misses;
 
         CacheStats {
             entry_count,
+            memo_count,
             hits,
             misses,
             hit_rate: if total > 0 { hits as f64 / total as f64 } else { 0.0 },
@@ -151,19 +388,33 @@ impl ContextCache {
         }
     }
 
-    /// Remove expired entries
+    /// Remove expired entries and memos
     pub async fn evict_expired(&self) {
-        let mut entries = self.entries.write().await;
         let now = Utc::now();
 
-        let expired: Vec<String> = entries.iter()
-            .filter(|(_, v)| v.expires_at < now)
-            .map(|(k, _)| k.clone())
-            .collect();
+        // Nothing to evict is the common case; check each map under a shared
+        // lock and only take its write lock when something actually has to go
+        if self.entries.read().await.values().any(|v| v.expires_at < now) {
+            let mut entries = self.entries.write().await;
+            let before = entries.len();
+            entries.retain(|_, v| v.expires_at >= now);
+            self.evictions.fetch_add((before - entries.len()) as u64, Ordering::SeqCst);
+        }
+
+        if self.requests.read().await.values().any(|memo| memo.expires_at < now) {
+            self.requests.write().await.retain(|_, memo| memo.expires_at >= now);
+        }
 
-        for key in expired {
-            entries.remove(&key);
-            self.evictions.fetch_add(1, Ordering::SeqCst);
+        let decisions_expired = self.decisions.read().await
+            .values()
+            .flat_map(HashMap::values)
+            .any(|memo| memo.expires_at < now);
+        if decisions_expired {
+            let mut decisions = self.decisions.write().await;
+            for memos in decisions.values_mut() {
+                memos.retain(|_, memo| memo.expires_at >= now);
+            }
+            decisions.retain(|_, memos| !memos.is_empty());
         }
     }
 }
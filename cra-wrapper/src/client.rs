@@ -42,6 +42,14 @@ pub trait CRAClient: Send + Sync {
 
     /// End session
     async fn end_session(&self, session_id: &str, summary: Option<&str>) -> WrapperResult<EndSessionResult>;
+
+    /// Check that CRA still knows a session, without recording anything
+    ///
+    /// Clients that cannot check keep this default, which trusts the session.
+    async fn session_active(&self, session_id: &str) -> WrapperResult<bool> {
+        let _ = session_id;
+        Ok(true)
+    }
 }
 
 /// Result from bootstrap
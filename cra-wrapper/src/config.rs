@@ -91,6 +91,17 @@ pub struct CacheConfig {
     #[serde(default = "default_max_entries")]
     pub max_entries: usize,
 
+    /// How long an action decision from CRA is reused for repeat reports
+    /// of the same action with the same parameters in the same session,
+    /// in seconds
+    ///
+    /// 0 (the default) waits for CRA on every report. Otherwise a repeat
+    /// call gets the memoized decision at once while it is still reported
+    /// to CRA in the background; CRA's answer, such as a rate-limit denial,
+    /// applies from the next call, so keep this short.
+    #[serde(default)]
+    pub decision_ttl_seconds: u64,
+
     /// Cache backend type
     #[serde(default)]
     pub backend: CacheBackendType,
@@ -105,6 +116,7 @@ impl Default for CacheConfig {
             enabled: true,
             default_ttl_seconds: 300,
             max_entries: 1000,
+            decision_ttl_seconds: 0,
             backend: CacheBackendType::Memory,
         }
     }
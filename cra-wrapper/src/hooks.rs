@@ -87,8 +87,9 @@ pub struct ActionResult {
 
 /// Registry for managing hooks
 pub struct HookRegistry {
-    /// Registered keywords for triggering context injection
-    keywords: RwLock<Vec<String>>,
+    /// Registered keywords for triggering context injection, each paired
+    /// with its lowercase form so matching doesn't redo it per input
+    keywords: RwLock<Vec<(String, String)>>,
 
     /// Custom hook handlers
     handlers: RwLock<Vec<Box<dyn IOHooks>>>,
@@ -106,18 +107,24 @@ impl HookRegistry {
     /// Register keywords for context injection
     pub fn register_keywords(&self, keywords: Vec<String>) {
         if let Ok(mut kw) = self.keywords.write() {
-            kw.extend(keywords);
+            kw.extend(keywords.into_iter().map(|keyword| {
+                let lower = keyword.to_lowercase();
+                (keyword, lower)
+            }));
         }
     }
 
     /// Check input for keyword matches
     pub fn check_keywords(&self, input: &str) -> Vec<String> {
-        let input_lower = input.to_lowercase();
-
         if let Ok(keywords) = self.keywords.read() {
+            if keywords.is_empty() {
+                return Vec::new();
+            }
+
+            let input_lower = input.to_lowercase();
             keywords.iter()
-                .filter(|kw| input_lower.contains(&kw.to_lowercase()))
-                .cloned()
+                .filter(|(_, lower)| input_lower.contains(lower.as_str()))
+                .map(|(keyword, _)| keyword.clone())
                 .collect()
         } else {
             Vec::new()
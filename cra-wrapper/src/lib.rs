@@ -71,6 +71,7 @@ pub use queue::{TraceQueue, QueuedEvent};
 pub use cache::{ContextCache, CachedContext};
 pub use client::CRAClient;
 
+use std::path::Path;
 use std::sync::Arc;
 use tokio::sync::RwLock;
 use chrono::{DateTime, Utc};
@@ -179,6 +180,43 @@ impl Wrapper {
         Ok(bootstrap_result.session_id)
     }
 
+    /// Resume a session persisted by an earlier process
+    ///
+    /// Skips the bootstrap when CRA confirms it still knows the session, at
+    /// the cost of one cheap check. A session CRA no longer knows falls back
+    /// to [`Wrapper::start_session`] with the same goal, so the returned ID
+    /// may differ from the saved one. Pair with [`WrapperSession::save`] and
+    /// [`WrapperSession::load`] so short-lived processes do not pay for a
+    /// fresh bootstrap on every start.
+    pub async fn resume_session(&self, session: WrapperSession) -> WrapperResult<String> {
+        if let Some(active) = self.session.read().await.as_ref() {
+            return Err(WrapperError::SessionExists(active.session_id.clone()));
+        }
+
+        if !self.client.session_active(&session.session_id).await? {
+            return self.start_session(&session.goal).await;
+        }
+
+        let session_id = session.session_id.clone();
+
+        {
+            let mut current = self.session.write().await;
+            if let Some(active) = current.as_ref() {
+                return Err(WrapperError::SessionExists(active.session_id.clone()));
+            }
+            *current = Some(session);
+        }
+
+        self.queue.enqueue(QueuedEvent {
+            event_type: "wrapper.session_resumed".to_string(),
+            session_id: session_id.clone(),
+            timestamp: Utc::now(),
+            payload: serde_json::json!({}),
+        }).await;
+
+        Ok(session_id)
+    }
+
     /// End the current session
     pub async fn end_session(&self, summary: Option<&str>) -> WrapperResult<SessionSummary> {
         let session = self.session.read().await
@@ -192,8 +230,10 @@ impl Wrapper {
         // End session with CRA
         let result = self.client.end_session(&session.session_id, summary).await?;
 
-        // Clear session
+        // Clear session and its memoized lookups
         *self.session.write().await = None;
+        self.cache.clear_requests().await;
+        self.cache.invalidate_session(&session.session_id).await;
 
         Ok(SessionSummary {
             session_id: session.session_id,
@@ -204,6 +244,23 @@ impl Wrapper {
         })
     }
 
+    /// Shut the wrapper down explicitly
+    ///
+    /// Ends the active session (if any) and flushes queued TRACE events.
+    /// Dropping a wrapper performs no I/O, so anything still queued at that
+    /// point is lost; long-lived hosts should call this on exit instead.
+    pub async fn shutdown(&self) -> WrapperResult<()> {
+        let has_session = self.session.read().await.is_some();
+        if has_session {
+            self.end_session(None).await?;
+        } else {
+            self.queue.flush().await?;
+        }
+
+        self.cache.clear_requests().await;
+        Ok(())
+    }
+
     /// Process input through hooks
     pub async fn on_input(&self, input: &str) -> WrapperResult<ProcessedInput> {
         let session = self.session.read().await
@@ -291,12 +348,51 @@ impl Wrapper {
             .ok_or(WrapperError::NoActiveSession)?
             .clone();
 
-        // Report to CRA and get decision
-        let report = self.client.report_action(
-            &session.session_id,
-            action,
-            params.clone(),
-        ).await?;
+        // Reuse a recent decision for this exact call, or report to CRA
+        let cached = self.cache.get_decision(&session.session_id, action, &params).await;
+        let is_cached = cached.is_some();
+        let (decision, reason) = match cached {
+            Some(memo) => {
+                // CRA still sees every call, so its TRACE and rate limits
+                // cover cached ones too; its answer replaces the memo
+                let client = Arc::clone(&self.client);
+                let cache = Arc::clone(&self.cache);
+                let session_id = session.session_id.clone();
+                let action = action.to_string();
+                tokio::spawn(async move {
+                    match client.report_action(&session_id, &action, params.clone()).await {
+                        Ok(report) => {
+                            cache.set_decision(
+                                &session_id,
+                                &action,
+                                &params,
+                                &report.decision,
+                                report.reason.as_deref(),
+                            ).await;
+                        }
+                        Err(e) => {
+                            tracing::warn!("Failed to report cached action {}: {}", action, e);
+                        }
+                    }
+                });
+                memo
+            }
+            None => {
+                let report = self.client.report_action(
+                    &session.session_id,
+                    action,
+                    params.clone(),
+                ).await?;
+                self.cache.set_decision(
+                    &session.session_id,
+                    action,
+                    &params,
+                    &report.decision,
+                    report.reason.as_deref(),
+                ).await;
+                (report.decision, report.reason)
+            }
+        };
 
         // Emit action event
         self.queue.enqueue(QueuedEvent {
@@ -305,13 +401,14 @@ impl Wrapper {
             timestamp: Utc::now(),
             payload: serde_json::json!({
                 "action": action,
-                "decision": report.decision
+                "decision": decision,
+                "cached": is_cached
             }),
         }).await;
 
         Ok(ActionDecision {
-            allowed: report.decision == "approved",
-            reason: report.reason,
+            allowed: decision == "approved",
+            reason,
             injected_context: None,
         })
     }
@@ -360,28 +457,43 @@ impl Wrapper {
             .ok_or(WrapperError::NoActiveSession)?
             .clone();
 
-        // Check cache first
-        // ... (cache lookup logic)
-
-        // Request from CRA
-        let contexts = self.client.request_context(
+        fetch_context(
+            self.client.as_ref(),
+            &self.cache,
             &session.session_id,
             need,
             hints,
-        ).await?;
+        ).await
+    }
 
-        // Cache results
-        for ctx in &contexts {
-            self.cache.set(&ctx.context_id, CachedContext {
-                context_id: ctx.context_id.clone(),
-                content: ctx.content.clone(),
-                fetched_at: Utc::now(),
-                expires_at: Utc::now() + chrono::Duration::hours(1),
-                priority: ctx.priority,
-            }).await;
-        }
+    /// Start fetching context in the background
+    ///
+    /// Use this as soon as the need is known (for example, once a tool name
+    /// has been decoded but before its arguments are complete) so the round
+    /// trip overlaps with the agent's own work. The result lands in the
+    /// context cache, so a later [`Wrapper::request_context`] with the same
+    /// need and hints is answered locally. Awaiting the returned handle is
+    /// optional.
+    pub async fn prefetch_context(
+        &self,
+        need: &str,
+        hints: Option<Vec<String>>,
+    ) -> WrapperResult<tokio::task::JoinHandle<WrapperResult<()>>> {
+        let session_id = self.session.read().await
+            .as_ref()
+            .ok_or(WrapperError::NoActiveSession)?
+            .session_id
+            .clone();
+
+        let client = Arc::clone(&self.client);
+        let cache = Arc::clone(&self.cache);
+        let need = need.to_string();
 
-        Ok(contexts)
+        Ok(tokio::spawn(async move {
+            fetch_context(client.as_ref(), &cache, &session_id, &need, hints)
+                .await
+                .map(|_| ())
+        }))
     }
 
     /// Get current session info
@@ -400,6 +512,84 @@ impl Wrapper {
     }
 }
 
+/// Fetch context for a need, consulting and filling the cache
+async fn fetch_context(
+    client: &(dyn client::CRAClient + Send + Sync),
+    cache: &cache::ContextCache,
+    session_id: &str,
+    need: &str,
+    hints: Option<Vec<String>>,
+) -> WrapperResult<Vec<ContextBlock>> {
+    // Check cache first
+    let request_key = cache::request_key(session_id, need, hints.as_deref());
+    if let Some(cached) = cache.get_request(&request_key).await {
+        return Ok(cached
+            .into_iter()
+            .map(|ctx| ContextBlock {
+                context_id: ctx.context_id,
+                content: ctx.content,
+                priority: ctx.priority,
+            })
+            .collect());
+    }
+
+    // Request from CRA, sharing the round trip, and its outcome, with
+    // identical concurrent requests
+    let slot = cache.inflight(&request_key).await;
+    let result = match slot.get_or_init(|| async {
+        let contexts = client.request_context(
+            session_id,
+            need,
+            hints,
+        ).await?;
+
+        // Cache results
+        for ctx in &contexts {
+            cache.set(&ctx.context_id, CachedContext {
+                context_id: ctx.context_id.clone(),
+                content: ctx.content.clone(),
+                fetched_at: Utc::now(),
+                expires_at: Utc::now() + chrono::Duration::hours(1),
+                priority: ctx.priority,
+            }).await;
+        }
+        cache.set_request(
+            &request_key,
+            contexts.iter().map(|ctx| ctx.context_id.clone()).collect(),
+        ).await;
+
+        Ok::<_, WrapperError>(contexts)
+    }).await {
+        Ok(contexts) => Ok(contexts.clone()),
+        Err(e) => Err(share_error(e)),
+    };
+    cache.release_inflight(&request_key, &slot).await;
+
+    result
+}
+
+/// Copy an error for each caller that shared a failed request
+///
+/// Keeps the variant and message; wrapped I/O and JSON errors are rebuilt
+/// from their kind and text, since they cannot be cloned.
+fn share_error(e: &WrapperError) -> WrapperError {
+    match e {
+        WrapperError::NoActiveSession => WrapperError::NoActiveSession,
+        WrapperError::SessionExists(s) => WrapperError::SessionExists(s.clone()),
+        WrapperError::BootstrapFailed(s) => WrapperError::BootstrapFailed(s.clone()),
+        WrapperError::ActionDenied(s) => WrapperError::ActionDenied(s.clone()),
+        WrapperError::ContextNotFound(s) => WrapperError::ContextNotFound(s.clone()),
+        WrapperError::Transport(s) => WrapperError::Transport(s.clone()),
+        WrapperError::Queue(s) => WrapperError::Queue(s.clone()),
+        WrapperError::Cache(s) => WrapperError::Cache(s.clone()),
+        WrapperError::Serialization(err) => WrapperError::Serialization(serde_json::Error::io(
+            std::io::Error::other(err.to_string()),
+        )),
+        WrapperError::Io(err) => WrapperError::Io(std::io::Error::new(err.kind(), err.to_string())),
+        WrapperError::Internal(s) => WrapperError::Internal(s.clone()),
+    }
+}
+
 /// Wrapper session state
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct WrapperSession {
@@ -412,6 +602,43 @@ pub struct WrapperSession {
     pub contexts_received: Vec<String>,
 }
 
+impl WrapperSession {
+    /// Persist the session to `path`
+    ///
+    /// Written to a sibling temp file and renamed into place, so a crash
+    /// mid-write never leaves a truncated session behind. The parent
+    /// directory is only created when the first write finds it missing, so
+    /// repeated saves cost no directory syscalls.
+    pub fn save(&self, path: impl AsRef<Path>) -> WrapperResult<()> {
+        let path = path.as_ref();
+        let tmp = path.with_extension("tmp");
+        let bytes = serde_json::to_vec(self)?;
+
+        match std::fs::write(&tmp, &bytes) {
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                if let Some(parent) = path.parent() {
+                    std::fs::create_dir_all(parent)?;
+                }
+                std::fs::write(&tmp, &bytes)?;
+            }
+            result => result?,
+        }
+        std::fs::rename(&tmp, path)?;
+        Ok(())
+    }
+
+    /// Load a session saved with [`WrapperSession::save`]
+    ///
+    /// Returns `Ok(None)` if nothing has been saved at `path` yet.
+    pub fn load(path: impl AsRef<Path>) -> WrapperResult<Option<Self>> {
+        match std::fs::read(path) {
+            Ok(bytes) => Ok(Some(serde_json::from_slice(&bytes)?)),
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(None),
+            Err(e) => Err(e.into()),
+        }
+    }
+}
+
 /// Session summary after ending
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct SessionSummary {
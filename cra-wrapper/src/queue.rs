@@ -75,14 +75,15 @@ impl TraceQueue {
 
     /// Enqueue an event
     pub async fn enqueue(&self, event: QueuedEvent) {
+        let is_sync = self.config.sync_events.contains(&event.event_type);
+
         let should_flush = {
             let mut events = self.events.write().await;
-            events.push(event.clone());
+            events.push(event);
             self.total_enqueued.fetch_add(1, Ordering::SeqCst);
 
             // Check if we should auto-flush
-            events.len() >= self.config.max_size ||
-                self.config.sync_events.contains(&event.event_type)
+            events.len() >= self.config.max_size || is_sync
         };
 
         if should_flush {
@@ -92,16 +93,24 @@ impl TraceQueue {
 
     /// Flush all pending events
     pub async fn flush(&self) -> WrapperResult<FlushResult> {
+        let empty = FlushResult {
+            flushed_count: 0,
+            success: true,
+        };
+
+        // Periodic flushes of an idle queue only need a shared lock, so they
+        // never contend with producers for the write lock
+        if self.events.read().await.is_empty() {
+            return Ok(empty);
+        }
+
         let events: Vec<QueuedEvent> = {
             let mut queue = self.events.write().await;
             std::mem::take(&mut *queue)
         };
 
         if events.is_empty() {
-            return Ok(FlushResult {
-                flushed_count: 0,
-                success: true,
-            });
+            return Ok(empty);
         }
 
         let count = events.len() as u64;
@@ -1,6 +1,6 @@
 //! ContextCache tests
 
-use cra_wrapper::cache::{ContextCache, CachedContext};
+use cra_wrapper::cache::{request_key, ContextCache, CachedContext};
 use cra_wrapper::config::{CacheConfig, CacheBackendType};
 use chrono::{Duration, Utc};
 
@@ -9,6 +9,7 @@ fn test_cache_config() -> CacheConfig {
         enabled: true,
         default_ttl_seconds: 3600,
         max_entries: 100,
+        decision_ttl_seconds: 0,
         backend: CacheBackendType::Memory,
     }
 }
@@ -114,6 +115,7 @@ async fn test_cache_disabled() {
         enabled: false, // Cache disabled
         default_ttl_seconds: 3600,
         max_entries: 100,
+        decision_ttl_seconds: 0,
         backend: CacheBackendType::Memory,
     };
     let cache = ContextCache::new(config);
@@ -191,6 +193,7 @@ async fn test_cache_eviction_at_capacity() {
         enabled: true,
         default_ttl_seconds: 3600,
         max_entries: 3, // Small capacity for testing
+        decision_ttl_seconds: 0,
         backend: CacheBackendType::Memory,
     };
     let cache = ContextCache::new(config);
@@ -266,6 +269,64 @@ async fn test_cache_evict_expired() {
 
     // Valid entry should still be there
     assert!(cache.get("valid").await.is_some());
+
+    // With nothing expired, a second pass evicts nothing
+    cache.evict_expired().await;
+    let stats = cache.stats().await;
+    assert_eq!(stats.entry_count, 1);
+    assert_eq!(stats.evictions, 1);
+}
+
+#[tokio::test]
+async fn test_cache_evict_expired_memos() {
+    let params = serde_json::json!({});
+    let cache = ContextCache::new(CacheConfig {
+        default_ttl_seconds: 0,
+        ..test_cache_config()
+    });
+    cache.set_request("stale", vec!["ctx".to_string()]).await;
+    tokio::time::sleep(std::time::Duration::from_millis(5)).await;
+    assert_eq!(cache.stats().await.memo_count, 1);
+
+    cache.evict_expired().await;
+    assert_eq!(cache.stats().await.memo_count, 0);
+
+    // Live decision memos survive a pass
+    let cache = ContextCache::new(CacheConfig {
+        decision_ttl_seconds: 60,
+        ..test_cache_config()
+    });
+    cache.set_decision("session-1", "write_file", &params, "approved", None).await;
+    cache.evict_expired().await;
+    assert_eq!(cache.stats().await.memo_count, 1);
+}
+
+#[tokio::test]
+async fn test_cache_memos_capped_at_max_entries() {
+    let cache = ContextCache::new(CacheConfig {
+        max_entries: 3,
+        decision_ttl_seconds: 60,
+        ..test_cache_config()
+    });
+
+    for i in 0..5 {
+        cache.set_request(&format!("request-{}", i), vec![]).await;
+        tokio::time::sleep(std::time::Duration::from_millis(2)).await;
+    }
+    assert_eq!(cache.stats().await.memo_count, 3);
+
+    for i in 0..5 {
+        let params = serde_json::json!({"n": i});
+        cache.set_decision(&format!("session-{}", i % 2), "write_file", &params, "approved", None).await;
+        tokio::time::sleep(std::time::Duration::from_millis(2)).await;
+    }
+    assert_eq!(cache.stats().await.memo_count, 6);
+
+    // The oldest decisions went first
+    let first = serde_json::json!({"n": 0});
+    let last = serde_json::json!({"n": 4});
+    assert!(cache.get_decision("session-0", "write_file", &first).await.is_none());
+    assert!(cache.get_decision("session-0", "write_file", &last).await.is_some());
 }
 
 #[tokio::test]
@@ -364,3 +425,79 @@ async fn test_cache_stats_serialization() {
     assert!(json.contains("hits"));
     assert!(json.contains("hit_rate"));
 }
+
+#[tokio::test]
+async fn test_cache_request_memo() {
+    let cache = ContextCache::new(test_cache_config());
+    let hints = vec!["rust".to_string()];
+    let key = request_key("session-1", "How do I test?", Some(&hints));
+
+    // Nothing memoized yet
+    assert!(cache.get_request(&key).await.is_none());
+
+    cache.set("ctx-1", CachedContext {
+        context_id: "ctx-1".to_string(),
+        content: "Use cargo test".to_string(),
+        fetched_at: Utc::now(),
+        expires_at: Utc::now() + Duration::hours(1),
+        priority: 100,
+    }).await;
+    cache.set_request(&key, vec!["ctx-1".to_string()]).await;
+
+    let cached = cache.get_request(&key).await.unwrap();
+    assert_eq!(cached.len(), 1);
+    assert_eq!(cached[0].content, "Use cargo test");
+
+    // Different hints are a different request
+    assert!(cache.get_request(&request_key("session-1", "How do I test?", None)).await.is_none());
+
+    // Field boundaries are part of the key, whatever the fields contain
+    assert_ne!(
+        request_key("s", "a\u{1f}b", None),
+        request_key("s", "a", Some(&["b".to_string()]))
+    );
+    assert_ne!(
+        request_key("s", "a", Some(&["b:c".to_string()])),
+        request_key("s", "a", Some(&["b".to_string(), "c".to_string()]))
+    );
+
+    // Memo is dropped once a referenced context is gone
+    cache.invalidate("ctx-1").await;
+    assert!(cache.get_request(&key).await.is_none());
+}
+
+#[tokio::test]
+async fn test_cache_decision_memo() {
+    // Disabled by default
+    let params = serde_json::json!({"path": "/tmp/a.txt"});
+    let cache = ContextCache::new(test_cache_config());
+    cache.set_decision("session-1", "write_file", &params, "approved", None).await;
+    assert!(cache.get_decision("session-1", "write_file", &params).await.is_none());
+
+    let cache = ContextCache::new(CacheConfig {
+        decision_ttl_seconds: 5,
+        ..test_cache_config()
+    });
+    cache.set_decision("session-1", "write_file", &params, "approved", None).await;
+    cache.set_decision("session-1", "rm_rf", &params, "denied", Some("Destructive")).await;
+    cache.set_decision("session-2", "write_file", &params, "denied", None).await;
+
+    assert_eq!(
+        cache.get_decision("session-1", "write_file", &params).await,
+        Some(("approved".to_string(), None))
+    );
+    assert_eq!(
+        cache.get_decision("session-1", "rm_rf", &params).await,
+        Some(("denied".to_string(), Some("Destructive".to_string())))
+    );
+    assert!(cache.get_decision("session-1", "read_file", &params).await.is_none());
+
+    // Decisions are only reused for the same parameters
+    let other = serde_json::json!({"path": "/etc/passwd"});
+    assert!(cache.get_decision("session-1", "write_file", &other).await.is_none());
+
+    // Invalidating one session leaves the others alone
+    cache.invalidate_session("session-1").await;
+    assert!(cache.get_decision("session-1", "write_file", &params).await.is_none());
+    assert!(cache.get_decision("session-2", "write_file", &params).await.is_some());
+}
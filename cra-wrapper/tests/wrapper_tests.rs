@@ -1,6 +1,14 @@
 //! Wrapper integration tests
 
-use cra_wrapper::{Wrapper, WrapperConfig, WrapperSession, ProcessedInput, ProcessedOutput};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::Arc;
+
+use async_trait::async_trait;
+use cra_wrapper::client::{ActionReport, BootstrapResult, DirectClient, EndSessionResult, UploadResult};
+use cra_wrapper::{
+    CRAClient, ContextBlock, ProcessedInput, ProcessedOutput, Wrapper, WrapperConfig,
+    WrapperError, WrapperResult, WrapperSession,
+};
 
 #[tokio::test]
 async fn test_wrapper_creation() {
@@ -258,3 +266,236 @@ async fn test_wrapper_config_serialization() {
     assert_eq!(parsed.version, config.version);
     assert_eq!(parsed.checkpoints_enabled, config.checkpoints_enabled);
 }
+
+#[tokio::test]
+async fn test_wrapper_shutdown_flushes_queue() {
+    let wrapper = Wrapper::new(WrapperConfig::default());
+    wrapper.start_session("Test goal").await.unwrap();
+    wrapper.on_output("some output").await.unwrap();
+
+    wrapper.shutdown().await.unwrap();
+
+    assert!(wrapper.current_session().await.is_none());
+    assert_eq!(wrapper.queue_stats().await.pending_count, 0);
+
+    // Shutting down again without a session is a no-op
+    wrapper.shutdown().await.unwrap();
+}
+
+#[tokio::test]
+async fn test_wrapper_prefetch_context() {
+    let wrapper = Wrapper::new(WrapperConfig::default());
+    assert!(wrapper.prefetch_context("need", None).await.is_err());
+
+    wrapper.start_session("Test goal").await.unwrap();
+
+    let handle = wrapper.prefetch_context(
+        "How to write unit tests",
+        Some(vec!["testing".to_string()]),
+    ).await.unwrap();
+    handle.await.unwrap().unwrap();
+
+    let contexts = wrapper.request_context(
+        "How to write unit tests",
+        Some(vec!["testing".to_string()]),
+    ).await.unwrap();
+    assert!(contexts.is_empty());
+}
+
+/// Client that counts context requests and answers them slowly (failing
+/// any need named "unavailable"), and denies action reports once
+/// `approved_reports` have been approved
+struct CountingClient {
+    inner: DirectClient,
+    context_requests: Arc<AtomicUsize>,
+    action_reports: Arc<AtomicUsize>,
+    approved_reports: usize,
+}
+
+#[async_trait]
+impl CRAClient for CountingClient {
+    async fn bootstrap(&self, goal: &str) -> WrapperResult<BootstrapResult> {
+        self.inner.bootstrap(goal).await
+    }
+
+    async fn request_context(
+        &self,
+        _session_id: &str,
+        need: &str,
+        _hints: Option<Vec<String>>,
+    ) -> WrapperResult<Vec<ContextBlock>> {
+        self.context_requests.fetch_add(1, Ordering::SeqCst);
+        tokio::time::sleep(std::time::Duration::from_millis(20)).await;
+        if need == "unavailable" {
+            return Err(WrapperError::Transport("CRA unavailable".to_string()));
+        }
+        Ok(vec![ContextBlock {
+            context_id: "ctx-1".to_string(),
+            content: format!("context for {}", need),
+            priority: 1,
+        }])
+    }
+
+    async fn report_action(
+        &self,
+        session_id: &str,
+        action: &str,
+        params: serde_json::Value,
+    ) -> WrapperResult<ActionReport> {
+        let count = self.action_reports.fetch_add(1, Ordering::SeqCst) + 1;
+        let mut report = self.inner.report_action(session_id, action, params).await?;
+        if count > self.approved_reports {
+            report.decision = "denied".to_string();
+            report.reason = Some("Rate limit exceeded".to_string());
+        }
+        Ok(report)
+    }
+
+    async fn feedback(
+        &self,
+        session_id: &str,
+        context_id: &str,
+        helpful: bool,
+        reason: Option<&str>,
+    ) -> WrapperResult<()> {
+        self.inner.feedback(session_id, context_id, helpful, reason).await
+    }
+
+    async fn upload_trace(&self, events: Vec<serde_json::Value>) -> WrapperResult<UploadResult> {
+        self.inner.upload_trace(events).await
+    }
+
+    async fn end_session(&self, session_id: &str, summary: Option<&str>) -> WrapperResult<EndSessionResult> {
+        self.inner.end_session(session_id, summary).await
+    }
+
+    async fn session_active(&self, session_id: &str) -> WrapperResult<bool> {
+        Ok(!session_id.starts_with("expired-"))
+    }
+}
+
+#[tokio::test]
+async fn test_wrapper_coalesces_concurrent_context_requests() {
+    let context_requests = Arc::new(AtomicUsize::new(0));
+    let wrapper = Wrapper::with_client(WrapperConfig::default(), CountingClient {
+        inner: DirectClient::new(),
+        context_requests: context_requests.clone(),
+        action_reports: Arc::new(AtomicUsize::new(0)),
+        approved_reports: usize::MAX,
+    });
+    wrapper.start_session("Test goal").await.unwrap();
+
+    let (a, b, c) = tokio::join!(
+        wrapper.request_context("same need", None),
+        wrapper.request_context("same need", None),
+        wrapper.request_context("same need", None),
+    );
+
+    assert_eq!(context_requests.load(Ordering::SeqCst), 1);
+    for contexts in [a, b, c] {
+        let contexts = contexts.unwrap();
+        assert_eq!(contexts.len(), 1);
+        assert_eq!(contexts[0].content, "context for same need");
+    }
+
+    // A failure is shared too, instead of each waiter retrying
+    let (a, b, c) = tokio::join!(
+        wrapper.request_context("unavailable", None),
+        wrapper.request_context("unavailable", None),
+        wrapper.request_context("unavailable", None),
+    );
+    assert_eq!(context_requests.load(Ordering::SeqCst), 2);
+    for result in [a, b, c] {
+        assert!(matches!(result, Err(WrapperError::Transport(msg)) if msg == "CRA unavailable"));
+    }
+
+    // Once the failed request is over, a new one goes back to CRA
+    assert!(wrapper.request_context("unavailable", None).await.is_err());
+    assert_eq!(context_requests.load(Ordering::SeqCst), 3);
+}
+
+#[tokio::test]
+async fn test_wrapper_cached_decisions_still_reach_cra() {
+    let action_reports = Arc::new(AtomicUsize::new(0));
+    let mut config = WrapperConfig::default();
+    config.cache.decision_ttl_seconds = 60;
+    let wrapper = Wrapper::with_client(config, CountingClient {
+        inner: DirectClient::new(),
+        context_requests: Arc::new(AtomicUsize::new(0)),
+        action_reports: action_reports.clone(),
+        approved_reports: 1,
+    });
+    wrapper.start_session("Test goal").await.unwrap();
+
+    let params = serde_json::json!({"path": "/tmp/test.txt"});
+    assert!(wrapper.report_action("write_file", params.clone()).await.unwrap().allowed);
+
+    // The repeat call is answered from the memo but still reported to CRA
+    assert!(wrapper.report_action("write_file", params.clone()).await.unwrap().allowed);
+    while action_reports.load(Ordering::SeqCst) < 2 {
+        tokio::task::yield_now().await;
+    }
+    tokio::time::sleep(std::time::Duration::from_millis(20)).await;
+
+    // CRA's denial for that call replaces the memo
+    let decision = wrapper.report_action("write_file", params).await.unwrap();
+    assert!(!decision.allowed);
+    assert_eq!(decision.reason.as_deref(), Some("Rate limit exceeded"));
+
+    // Different parameters are never answered from the memo
+    let other = serde_json::json!({"path": "/tmp/other.txt"});
+    let reported = action_reports.load(Ordering::SeqCst);
+    wrapper.report_action("write_file", other).await.unwrap();
+    assert!(action_reports.load(Ordering::SeqCst) > reported);
+}
+
+#[tokio::test]
+async fn test_wrapper_resume_saved_session() {
+    let path = std::env::temp_dir()
+        .join(format!("cra-wrapper-{}", uuid::Uuid::new_v4()))
+        .join("session.json");
+    assert!(WrapperSession::load(&path).unwrap().is_none());
+
+    let first = Wrapper::new(WrapperConfig::default());
+    let session_id = first.start_session("Test goal").await.unwrap();
+    first.current_session().await.unwrap().save(&path).unwrap();
+    // Saving again reuses the now-existing directory
+    first.current_session().await.unwrap().save(&path).unwrap();
+
+    let saved = WrapperSession::load(&path).unwrap().unwrap();
+    let second = Wrapper::new(WrapperConfig::default());
+    assert_eq!(second.resume_session(saved.clone()).await.unwrap(), session_id);
+    assert_eq!(second.current_session().await.unwrap().goal, "Test goal");
+
+    // Resuming over an active session is rejected
+    assert!(second.resume_session(saved.clone()).await.is_err());
+
+    // A session CRA no longer knows is replaced by a fresh one
+    let third = Wrapper::with_client(WrapperConfig::default(), CountingClient {
+        inner: DirectClient::new(),
+        context_requests: Arc::new(AtomicUsize::new(0)),
+        action_reports: Arc::new(AtomicUsize::new(0)),
+        approved_reports: usize::MAX,
+    });
+    let expired = WrapperSession {
+        session_id: "expired-session".to_string(),
+        ..saved
+    };
+    let resumed_id = third.resume_session(expired).await.unwrap();
+    assert_ne!(resumed_id, "expired-session");
+    let current = third.current_session().await.unwrap();
+    assert_eq!(current.session_id, resumed_id);
+    assert_eq!(current.goal, "Test goal");
+
+    std::fs::remove_dir_all(path.parent().unwrap()).unwrap();
+}
+
+#[test]
+fn test_hook_registry_keywords_ignore_case() {
+    let hooks = cra_wrapper::hooks::HookRegistry::new();
+    assert!(hooks.check_keywords("Deploy to production").is_empty());
+
+    hooks.register_keywords(vec!["Deploy".to_string(), "rollback".to_string()]);
+    assert_eq!(hooks.check_keywords("please DEPLOY the build"), vec!["Deploy".to_string()]);
+    assert!(hooks.check_keywords("nothing to see").is_empty());
+}